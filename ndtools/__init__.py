@@ -3,25 +3,38 @@ __all__ = [
     "NEVER",
     "All",
     "Any",
+    "BitmapIndex",
+    "Classify",
     "Combinable",
     "Equatable",
+    "Field",
     "Match",
     "Not",
     "Range",
+    "RangeSet",
     "Orderable",
+    "SortedIndex",
+    "StringIndex",
     "Where",
+    "ZoneMap",
+    "aevaluate",
     "comparison",
+    "engines",
+    "indexes",
 ]
 __version__ = "1.1.0"
 
 
 # dependencies
 from . import comparison
+from . import engines
+from . import indexes
 from .comparison.builtins import (
     ANY,
     NEVER,
     Match,
     Range,
+    RangeSet,
     Where,
 )
 from .comparison.comparables import (
@@ -32,3 +45,10 @@ from .comparison.comparables import (
     Not,
     Orderable,
 )
+from .comparison.fields import Field
+from .engines.asynchronous import aevaluate
+from .engines.classification import Classify
+from .indexes.bitmap import BitmapIndex
+from .indexes.sorted import SortedIndex
+from .indexes.strings import StringIndex
+from .indexes.zonemap import ZoneMap
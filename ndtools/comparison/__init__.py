@@ -1,8 +1,10 @@
-__all__ = ["builtins", "comparables", "operators", "utils"]
+__all__ = ["arrow", "builtins", "comparables", "fields", "operators", "utils"]
 
 
 # dependencies
+from . import arrow
 from . import builtins
 from . import comparables
+from . import fields
 from . import operators
 from . import utils
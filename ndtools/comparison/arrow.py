@@ -0,0 +1,215 @@
+__all__ = ["between", "fullmatch", "is_arrow", "isin", "supports_regex"]
+
+
+# standard library
+from functools import lru_cache, reduce
+from re import IGNORECASE
+from typing import Any as Any_
+
+# dependencies
+import pandas as pd
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+except ImportError:
+    pa = pc = None
+
+
+def between(array: Any_, lower: Any_, upper: Any_, bounds: str, /) -> Any_:
+    """Check if each element of an Arrow-backed array is within a range.
+
+    Args:
+        array: Arrow-backed array (see ``is_arrow``).
+        lower: Lower value of the range. ``None`` skips the comparison.
+        upper: Upper value of the range. ``None`` skips the comparison.
+        bounds: Type of bounds of the range (``[]``, ``[)``, ``(]``, or ``()``).
+
+    Returns:
+        Boolean array in the same container type as ``array``.
+
+    Raises:
+        ValueError: Raised if ``bounds`` is not valid.
+
+    """
+    if bounds not in ("[]", "[)", "(]", "()"):
+        raise ValueError("Bounds must be either [], [), (], or ().")
+
+    data = to_arrow(array)
+    results: list[Any_] = []
+
+    if lower is not None:
+        compare = pc.greater_equal if bounds[0] == "[" else pc.greater  # type: ignore
+        results.append(compare(data, lower))  # type: ignore
+
+    if upper is not None:
+        compare = pc.less_equal if bounds[1] == "]" else pc.less  # type: ignore
+        results.append(compare(data, upper))  # type: ignore
+
+    if not results:
+        results.append(pc.or_(pc.is_valid(data), True))  # type: ignore
+
+    result = reduce(pc.and_kleene, results)  # type: ignore
+    return from_arrow(result, array)
+
+
+def fullmatch(
+    array: Any_,
+    pat: str,
+    case: bool = True,
+    flags: int = 0,
+    na: Any_ = None,
+    /,
+) -> Any_:
+    """Match a regular expression to each element of an Arrow-backed array.
+
+    Args:
+        array: Arrow-backed array of strings (see ``is_arrow``).
+        pat: Regular expression supported by RE2 (see ``supports_regex``).
+        case: If True, case sensitive matching will be performed.
+        flags: Regular expression flags (only ``re.IGNORECASE`` is supported).
+        na: Fill value for missing values. ``None`` keeps them missing.
+
+    Returns:
+        Boolean array in the same container type as ``array``.
+
+    """
+    result = pc.match_substring_regex(  # type: ignore
+        to_arrow(array),
+        pattern=anchor(pat),
+        ignore_case=not case or bool(flags & IGNORECASE),
+    )
+
+    if na is not None:
+        result = pc.fill_null(result, bool(na))  # type: ignore
+
+    return from_arrow(result, array)
+
+
+def is_arrow(array: Any_, /) -> bool:
+    """Check if given array is backed by Apache Arrow.
+
+    Arrow arrays and chunked arrays, and pandas objects
+    of ``ArrowDtype`` or ``StringDtype("pyarrow")`` are supported.
+
+    """
+    if pa is None:
+        return False
+
+    if isinstance(array, (pa.Array, pa.ChunkedArray)):  # type: ignore
+        return True
+
+    if isinstance(dtype := getattr(array, "dtype", None), pd.ArrowDtype):
+        return True
+
+    return isinstance(dtype, pd.StringDtype) and dtype.storage in (
+        "pyarrow",
+        "pyarrow_numpy",
+    )
+
+
+def isin(array: Any_, values: Any_, /) -> Any_:
+    """Check if each element of an Arrow-backed array is in given values.
+
+    Missing elements stay missing as ``(array == v0) | (array == v1) | ...``.
+
+    Args:
+        array: Arrow-backed array (see ``is_arrow``).
+        values: Iterable of scalar values.
+
+    Returns:
+        Boolean array in the same container type as ``array``.
+        ``NotImplemented`` if the values cannot be cast to the array type
+        without loss (e.g. ``2.5`` to integers) or across kinds of types.
+
+    """
+    data = to_arrow(array)
+
+    try:
+        value_set = pa.array(list(values))  # type: ignore
+
+        if type_kind(value_set.type) not in ("null", type_kind(data.type)):  # type: ignore
+            return NotImplemented
+
+        value_set = value_set.cast(data.type, safe=True)  # type: ignore
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):  # type: ignore
+        return NotImplemented
+
+    result = pc.if_else(  # type: ignore
+        pc.is_valid(data),  # type: ignore
+        pc.is_in(data, value_set=value_set),  # type: ignore
+        pa.scalar(None, pa.bool_()),  # type: ignore
+    )
+    return from_arrow(result, array)
+
+
+@lru_cache(maxsize=None)
+def supports_regex(pat: str, flags: int = 0, /) -> bool:
+    """Check if given regular expression can be run by Arrow (RE2)."""
+    if pa is None or flags & ~IGNORECASE:
+        return False
+
+    try:
+        pc.match_substring_regex(pa.array([""]), anchor(pat))  # type: ignore
+    except pa.ArrowInvalid:  # type: ignore
+        return False
+
+    return True
+
+
+def anchor(pat: str, /) -> str:
+    """Anchor a regular expression so that it fully matches a string."""
+    return rf"\A(?:{pat})\z"
+
+
+def from_arrow(result: Any_, like: Any_, /) -> Any_:
+    """Convert an Arrow boolean array to the container type of another array."""
+    if isinstance(like, (pa.Array, pa.ChunkedArray)):  # type: ignore
+        return result
+
+    if like.dtype.na_value is pd.NA:
+        array = pd.arrays.ArrowExtensionArray(result)
+    else:
+        array = pc.fill_null(result, False).to_numpy()  # type: ignore
+
+    if isinstance(like, pd.Series):
+        return pd.Series(array, like.index, name=like.name)  # type: ignore
+
+    if isinstance(like, pd.Index):
+        return pd.Index(array, name=like.name)  # type: ignore
+
+    return array  # type: ignore
+
+
+def type_kind(type_: Any_, /) -> str:
+    """Return the kind of an Arrow type whose values are comparable to each other."""
+    if pa.types.is_null(type_):  # type: ignore
+        return "null"
+
+    if pa.types.is_integer(type_) or pa.types.is_floating(type_):  # type: ignore
+        return "number"
+
+    if pa.types.is_decimal(type_):  # type: ignore
+        return "number"
+
+    if pa.types.is_string(type_) or pa.types.is_large_string(type_):  # type: ignore
+        return "string"
+
+    if pa.types.is_binary(type_) or pa.types.is_large_binary(type_):  # type: ignore
+        return "binary"
+
+    if pa.types.is_timestamp(type_):  # type: ignore
+        return "timestamp"
+
+    if pa.types.is_duration(type_):  # type: ignore
+        return "duration"
+
+    return str(type_)
+
+
+def to_arrow(array: Any_, /) -> Any_:
+    """Return the Arrow data of an Arrow-backed array without copy."""
+    if isinstance(array, (pa.Array, pa.ChunkedArray)):  # type: ignore
+        return array
+
+    return getattr(array, "array", array).__arrow_array__()
@@ -1,15 +1,33 @@
-__all__ = ["ANY", "NEVER", "AnyType", "NeverType", "Match", "Range", "Where"]
+__all__ = [
+    "ANY",
+    "NEVER",
+    "AnyType",
+    "NeverType",
+    "Match",
+    "Range",
+    "RangeSet",
+    "Where",
+]
 
 
 # standard library
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any as Any_, Literal
 
 # dependencies
+import numpy as np
 import pandas as pd
 from typing_extensions import Self
-from .comparables import Combinable, Equatable, Orderable
+from .arrow import between, fullmatch, is_arrow, supports_regex
+from .comparables import Combinable, Equatable, Orderable, equals
+from .operators import EQUAL, UNORDERED, to_codes
+from .utils import to_container
+
+# constants
+CACHESIZE = 1024
 
 
 class AnyType(Combinable, Equatable):
@@ -28,6 +46,8 @@ class AnyType(Combinable, Equatable):
 
     """
 
+    __slots__ = ()
+    __hash__ = object.__hash__  # type: ignore
     _ANY: Self
 
     def __new__(cls) -> Self:
@@ -59,6 +79,8 @@ class NeverType(Combinable, Equatable):
 
     """
 
+    __slots__ = ()
+    __hash__ = object.__hash__  # type: ignore
     _NEVER: Self
 
     def __new__(cls) -> Self:
@@ -102,11 +124,13 @@ Examples:
 """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Match(Combinable, Equatable):
     """Comparable that matches regular expression to each array element.
 
     It uses ``pandas.Series.str.fullmatch`` so the same options are available.
+    For Arrow-backed arrays, the pattern is run by ``pyarrow.compute``
+    if it is supported by RE2 and only ``re.IGNORECASE`` is used as flags.
 
     Args:
         pat: Character sequence or regular expression.
@@ -140,14 +164,21 @@ class Match(Combinable, Equatable):
     """Fill value for missing values."""
 
     def __eq__(self, other: Any_) -> Any_:
-        return (
+        if type(other) is type(self):
+            return equals(self, other)
+
+        if is_arrow(other) and supports_regex(self.pat, self.flags):
+            return fullmatch(other, self.pat, self.case, self.flags, self.na)
+
+        result = (
             pd.Series(other)  # type: ignore
             .str.fullmatch(self.pat, self.case, self.flags, self.na)
             .values
         )
+        return to_container(result, other)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Range(Combinable, Orderable):
     """Comparable that implements equivalence with a certain range.
 
@@ -162,6 +193,10 @@ class Range(Combinable, Orderable):
             ``(]``: Lower-open and upper-closed.
             ``()``: Lower-open and upper-open.
 
+    For Arrow-backed arrays, the equality is run by ``pyarrow.compute``.
+    For NumPy arrays of datetime64, timedelta64, or bytes, the bounds
+    are normalized to the data type once and cached (see ``normalize``).
+
     Examples:
         ::
 
@@ -207,7 +242,49 @@ class Range(Combinable, Orderable):
         """Check if the upper bound is closed."""
         return self.bounds[1] == "]"
 
+    def normalize(self, dtype: Any_, /) -> "Range":
+        """Return the range whose bounds are normalized to given data type.
+
+        For datetime64 and timedelta64, the bounds are converted to
+        closed int64 bounds in the unit of the data type (rounded
+        according to the bounds and excluding NaT) so that
+        ``array.view("i8") == normalized`` is equivalent to ``array == self``.
+        For bytes, string bounds are encoded so that no conversion is needed.
+        Otherwise (or if the conversion fails), the range itself is returned.
+
+        Args:
+            dtype: Data type of the array to be compared.
+
+        Returns:
+            Normalized range that is cached by the range and the data type
+            outside the instance (up to ``CACHESIZE`` of them).
+
+        Raises:
+            TypeError: Raised if a timezone-aware bound is normalized
+                to the (timezone-naive) datetime64.
+
+        """
+        try:
+            hash(self)
+        except TypeError:
+            return normalize(self, np.dtype(dtype))
+
+        return normalize_cached(self, np.dtype(dtype))
+
     def __eq__(self, other: Any_) -> Any_:
+        if type(other) is type(self):
+            return equals(self, other)
+
+        if is_arrow(other):
+            return between(other, self.lower, self.upper, self.bounds)
+
+        if isinstance(other, np.ndarray) and (kind := other.dtype.kind) in "MmS":  # type: ignore
+            if (normalized := self.normalize(other.dtype)) is not self:  # type: ignore
+                if kind == "S":
+                    return normalized == other
+
+                return normalized == other.view(np.int64)
+
         if self.lower is None and self.upper is None:
             return other == ANY
 
@@ -237,6 +314,53 @@ class Range(Combinable, Orderable):
 
         raise ValueError("Bounds must be either [], [), (], or ().")
 
+    def __compare__(self, other: Any_) -> Any_:
+        """Compare the range with each element in a single evaluation.
+
+        Returns:
+            Int8 array whose elements are -1 above the range,
+            0 within the range, 1 below the range, and 2 otherwise (e.g. NaN),
+            i.e. the three-way comparison of the range with the elements
+            (see ``ndtools.comparison.operators.compare``).
+            It is in the same container type as the compared array.
+
+        """
+        if self.bounds not in ("[]", "[)", "(]", "()"):
+            raise ValueError("Bounds must be either [], [), (], or ().")
+
+        if isinstance(other, np.ndarray) and (kind := other.dtype.kind) in "MmS":  # type: ignore
+            if (normalized := self.normalize(other.dtype)) is not self:  # type: ignore
+                if kind == "S":
+                    return normalized.__compare__(other)
+
+                result = normalized.__compare__(other.view(np.int64))
+                result[np.isnat(other)] = UNORDERED  # type: ignore
+                return result
+
+        if self.lower is None and self.upper is None:
+            return np.multiply(other == ANY, EQUAL, dtype=np.int8)
+
+        # one comparison per bound decides all the three cases
+        if self.lower is None:
+            not_below = other == other
+        elif self.is_lower_closed:
+            not_below = other >= self.lower
+        else:
+            not_below = other > self.lower
+
+        if self.upper is None:
+            not_above = other == other
+        elif self.is_upper_closed:
+            not_above = other <= self.upper
+        else:
+            not_above = other < self.upper
+
+        return to_codes(
+            np.logical_and(not_below, np.logical_not(not_above)),
+            np.logical_and(not_above, np.logical_not(not_below)),
+            np.logical_not(np.logical_or(not_below, not_above)),
+        )
+
     def __gt__(self, other: Any_) -> Any_:
         if self.lower is None:
             return other == NEVER
@@ -265,7 +389,253 @@ class Range(Combinable, Orderable):
         return f"{self.bounds[0]}{self.lower}, {self.upper}{self.bounds[1]}"
 
 
-@dataclass(frozen=True)
+def normalize(window: Range, dtype: np.dtype[Any_], /) -> Range:
+    """Normalize the bounds of a range to given data type (see ``Range.normalize``)."""
+    if window.bounds not in ("[]", "[)", "(]", "()"):
+        return window
+
+    if window.lower is None and window.upper is None:
+        return window
+
+    if dtype.kind == "M" and any(
+        getattr(value, "tzinfo", None) is not None
+        for value in (window.lower, window.upper)
+    ):
+        raise TypeError("Cannot compare tz-naive and tz-aware timestamps.")
+
+    if dtype.kind == "S":
+        lower, upper = window.lower, window.upper
+
+        if isinstance(lower, str):
+            lower = lower.encode()
+
+        if isinstance(upper, str):
+            upper = upper.encode()
+
+        if lower is window.lower and upper is window.upper:
+            return window
+
+        return Range(lower, upper, window.bounds)
+
+    if dtype.kind not in "Mm" or np.datetime_data(dtype)[0] == "generic":
+        return window
+
+    try:
+        if window.lower is None:
+            lower = np.iinfo(np.int64).min + 1  # excludes NaT
+        elif window.is_lower_closed:
+            lower = to_int64(window.lower, dtype, ceil=True)
+        else:
+            lower = to_int64(window.lower, dtype, ceil=False) + 1
+
+        if window.upper is None:
+            upper = None
+        elif window.is_upper_closed:
+            upper = to_int64(window.upper, dtype, ceil=False)
+        else:
+            upper = to_int64(window.upper, dtype, ceil=True) - 1
+    except (OverflowError, TypeError, ValueError):
+        return window
+
+    return Range(lower, upper, "[]")
+
+
+@lru_cache(maxsize=CACHESIZE)
+def normalize_cached(window: Range, dtype: np.dtype[Any_], /) -> Range:
+    """Normalize the bounds of a hashable range with a bounded cache."""
+    return normalize(window, dtype)
+
+
+def to_int64(value: Any_, dtype: np.dtype[Any_], /, *, ceil: bool) -> int:
+    """Convert a datetime-like or timedelta-like value to int64 of given data type.
+
+    Raises:
+        TypeError: Raised if the value is not datetime-like nor timedelta-like.
+        ValueError: Raised if the value is NaT or cannot be parsed.
+
+    """
+    scalar: Any_
+
+    if dtype.kind == "M" and isinstance(value, (str, np.datetime64)):
+        scalar = np.datetime64(value)  # type: ignore
+    elif dtype.kind == "M" and isinstance(value, date):
+        scalar = pd.Timestamp(value).to_datetime64()  # type: ignore
+    elif dtype.kind == "m" and isinstance(value, (str, timedelta, np.timedelta64)):
+        scalar = pd.Timedelta(value).to_timedelta64()  # type: ignore
+    else:
+        raise TypeError(f"Cannot convert {value!r} to {dtype}.")
+
+    if np.isnat(scalar):
+        raise ValueError("NaT cannot be normalized.")
+
+    floor = scalar.astype(dtype)
+
+    if ceil and floor != scalar:
+        return int(floor.astype(np.int64)) + 1
+
+    return int(floor.astype(np.int64))
+
+
+@dataclass(frozen=True, slots=True)
+class RangeSet(Combinable, Equatable):
+    """Comparable that evaluates multiple ranges in one pass.
+
+    All the bounds of the ranges are sorted into edges and each element is
+    located once by ``numpy.searchsorted`` into one of the atoms between
+    and at the edges. Then the labels, the stacked mask, and the counts
+    of the ranges are derived from a small table of the atoms in each range
+    (respecting the bounds of each range) instead of comparing
+    the array with each range. The equality with an array is
+    the union of the ranges (i.e. same as ``Any`` of the ranges).
+
+    Args:
+        ranges: Ranges (disjoint or overlapping) to be evaluated.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Range, RangeSet
+
+            bins = RangeSet([Range(0, 2), Range(2, 4, "[]"), Range(3, None)])
+            bins.labels(np.arange(6))  # -> array([0, 0, 1, 1, 1, 2])
+            bins.counts(np.arange(6))  # -> array([2, 3, 3])
+            bins.masks(np.arange(6))  # -> array of shape (3, 6)
+            np.arange(6) == bins  # -> array([True, True, True, True, True, True])
+
+            RangeSet.from_edges([0, 2, 4])  # -> RangeSet(ranges=([0, 2), [2, 4)))
+
+    """
+
+    ranges: tuple[Range, ...]
+    """Ranges to be evaluated."""
+
+    def __init__(self, ranges: Iterable[Range], /) -> None:
+        object.__setattr__(self, "ranges", tuple(ranges))
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Sequence[Any_],
+        /,
+        bounds: Literal["[]", "[)", "(]", "()"] = "[)",
+    ) -> Self:
+        """Create a range set of consecutive bins between given edges."""
+        return cls(
+            Range(lower, upper, bounds) for lower, upper in zip(edges, edges[1:])
+        )
+
+    def counts(self, array: Any_, /) -> Any_:
+        """Return the number of elements within each range."""
+        atoms, table = self.digitize(array)
+        counts = np.bincount(atoms.ravel(), minlength=table.shape[1])
+        return table.astype(np.intp) @ counts
+
+    def labels(self, array: Any_, /) -> Any_:
+        """Return the index of the first range that contains each element (or -1)."""
+        atoms, table = self.digitize(array)
+
+        if not self.ranges:
+            return np.full(atoms.shape, -1, np.intp)
+
+        return np.where(table.any(0), table.argmax(0), -1)[atoms]
+
+    def masks(self, array: Any_, /) -> Any_:
+        """Return the stacked masks of the ranges (shape of ``(len(ranges), ...)``)."""
+        atoms, table = self.digitize(array)
+        return table[:, atoms]
+
+    def digitize(self, array: Any_, /) -> tuple[Any_, Any_]:
+        """Locate the elements of an array into the atoms of the ranges.
+
+        Args:
+            array: Array to be located. It will be converted to NumPy array.
+
+        Returns:
+            Tuple of the atom indices of the elements (same shape as the array)
+            and the boolean table of shape ``(len(ranges), n_atoms)`` that
+            tells if each atom is within each range. For the ``m`` sorted
+            edges, the atom ``2j`` is between the edges ``j - 1`` and ``j``,
+            the atom ``2j + 1`` is at the edge ``j``, and the last atom
+            ``2m + 1`` is of missing values (e.g. NaN and NaT).
+
+        Raises:
+            ValueError: Raised if the bounds of any range is invalid
+                or only some of the ranges can be normalized to the data type.
+
+        """
+        array = np.asarray(array)
+        valid: Any_ = ~pd.isna(array.ravel())  # type: ignore
+        ranges = self.ranges
+
+        for window in ranges:
+            if window.bounds not in ("[]", "[)", "(]", "()"):
+                raise ValueError("Bounds must be either [], [), (], or ().")
+
+        if array.dtype.kind == "S":
+            ranges = tuple(window.normalize(array.dtype) for window in ranges)
+
+        if array.dtype.kind in "Mm":
+            normalized = tuple(window.normalize(array.dtype) for window in ranges)
+            failed = [
+                new is old and (old.lower is not None or old.upper is not None)
+                for new, old in zip(normalized, ranges)
+            ]
+
+            if not any(failed):
+                ranges, array = normalized, array.view(np.int64)
+            elif not all(failed):
+                raise ValueError(
+                    f"Bounds of some ranges cannot be normalized to {array.dtype}."
+                )
+
+        values = [
+            value
+            for window in ranges
+            for value in (window.lower, window.upper)
+            if value is not None
+        ]
+        edges: Any_ = np.unique(np.asarray(values)) if values else np.empty(0)
+        missing = 2 * len(edges) + 1
+
+        flat = array.ravel()[valid]
+        atoms: Any_ = np.full(array.size, missing, np.intp)
+        atoms[valid] = np.searchsorted(edges, flat) + np.searchsorted(
+            edges, flat, "right"
+        )
+
+        table = np.zeros((len(ranges), missing + 1), bool)
+
+        for i, window in enumerate(ranges):
+            if window.lower is None and window.upper is None:
+                table[i] = True
+                continue
+
+            if window.lower is None:
+                start = 0
+            else:
+                j = int(np.searchsorted(edges, window.lower))  # type: ignore
+                start = 2 * j + 1 if window.is_lower_closed else 2 * j + 2
+
+            if window.upper is None:
+                stop = missing
+            else:
+                j = int(np.searchsorted(edges, window.upper))  # type: ignore
+                stop = 2 * j + 2 if window.is_upper_closed else 2 * j + 1
+
+            table[i, start:stop] = True
+
+        return atoms.reshape(array.shape), table
+
+    def __eq__(self, other: Any_) -> Any_:
+        if type(other) is type(self):
+            return equals(self, other)
+
+        atoms, table = self.digitize(other)
+        return table.any(0)[atoms]
+
+
+@dataclass(frozen=True, slots=True)
 class Where(Combinable, Equatable):
     """Comparable that applies a boolean function for multidimensional arrays.
 
@@ -295,12 +665,18 @@ class Where(Combinable, Equatable):
     """Keyword arguments to be passed to the function."""
 
     def __init__(self, func: Callable[..., Any_], *args: Any_, **kwargs: Any_) -> None:
-        super().__setattr__("func", func)
-        super().__setattr__("args", args)
-        super().__setattr__("kwargs", kwargs)
+        object.__setattr__(self, "func", func)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "kwargs", kwargs)
 
     def __eq__(self, other: Any_) -> Any_:
-        return self.func(other, *self.args, **self.kwargs)
+        if type(other) is type(self):
+            return equals(self, other)
+
+        return to_container(self.func(other, *self.args, **self.kwargs), other)
+
+    def __hash__(self) -> int:
+        return hash((self.func, self.args, tuple(self.kwargs.items())))
 
     def __repr__(self) -> str:
         return f"Apply({self.func}, *{self.args}, **{self.kwargs})"
@@ -1,17 +1,30 @@
-__all__ = ["All", "Any", "Combinable", "Equatable", "Not", "Orderable"]
+__all__ = [
+    "All",
+    "Any",
+    "Combinable",
+    "Equatable",
+    "Group",
+    "Not",
+    "Orderable",
+    "equals",
+]
 
 
 # standard library
-from collections import UserList
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import fields, is_dataclass
 from functools import reduce
+from itertools import chain
 from operator import and_, or_
-from typing import Any as Any_
+from typing import Any as Any_, overload
 
 # dependencies
 import numpy as np
+import pandas as pd
+from .arrow import is_arrow, isin
 from .operators import eq, ge, gt, le, lt, ne
-from .utils import has_method
+from .utils import has_method, to_container
+from typing_extensions import Self
 
 
 class Combinable:
@@ -25,6 +38,8 @@ class Combinable:
     will return ``Any([comparable_0, comparable_1, ...])``.
     where ``All`` and ``Any`` are the implementation of
     logical conjunction and logical disjunction, respectively.
+    ``comparable.select(array)`` returns the elements of the array
+    equal to the comparable without allocating a full mask.
 
     Examples:
         ::
@@ -48,17 +63,33 @@ class Combinable:
 
     """
 
+    __slots__ = ()
+
     def __and__(self, other: Any_) -> "All":
-        def iterable(obj: Any_) -> Iterable[Any_]:
-            return obj if isinstance(obj, All) else [obj]
+        if isinstance(self, All):
+            return self.concat(other if isinstance(other, All) else [other])
 
-        return All([*iterable(self), *iterable(other)])
+        return All.of([self, other])
 
     def __or__(self, other: Any_) -> "Any":
-        def iterable(obj: Any_) -> Iterable[Any_]:
-            return obj if isinstance(obj, Any) else [obj]
+        if isinstance(self, Any):
+            return self.concat(other if isinstance(other, Any) else [other])
+
+        return Any.of([self, other])
+
+    def select(self, array: Any_, /, *, axis: Any_ = None, **kwargs: Any_) -> Any_:
+        """Return the elements of an array equal to the comparable without a full mask.
+
+        It is equivalent to ``array[array == self]`` but evaluated
+        chunk by chunk (see ``ndtools.engines.selection.select``).
+        If an axis is given, the sub-arrays along the axis are selected
+        whose labels (e.g. coordinate of xarray) are equal to the comparable.
+
+        """
+        # deferred to avoid the circular import of the engines
+        from ..engines.selection import select
 
-        return Any([*iterable(self), *iterable(other)])
+        return select(self, array, axis=axis, **kwargs)
 
 
 class Equatable:
@@ -89,6 +120,9 @@ class Equatable:
 
     """
 
+    __slots__ = ()
+    __pandas_priority__ = 5000  # defer pandas comparisons to comparables
+
     __eq__: Callable[..., Any_]
     __ne__: Callable[..., Any_]
 
@@ -125,6 +159,12 @@ class Orderable:
     These special methods should be implemented for the target array like
     ``def __ge__(self, array)``. Then the class instance and the array
     can perform ``instance >= array`` and ``array <= instance``.
+    Alternatively, classes can implement only the three-way comparison
+    ``def __compare__(self, array)`` that returns an int8 array of
+    -1 (``instance < array``), 0 (``instance == array``), 1 (``instance > array``),
+    or 2 (otherwise, e.g. NaN) so that any of the six operators
+    is derived from a single evaluation
+    (see ``ndtools.comparison.operators.compare``).
 
     Examples:
         ::
@@ -152,6 +192,9 @@ class Orderable:
 
     """
 
+    __slots__ = ()
+    __pandas_priority__ = 5000  # defer pandas comparisons to comparables
+
     __eq__: Callable[..., Any_]
     __ge__: Callable[..., Any_]
     __gt__: Callable[..., Any_]
@@ -194,12 +237,131 @@ class Orderable:
                 setattr(cls, f"__{operator.__name__}__", operator)
 
 
-class All(UserList[Any_], Combinable, Equatable):
+class Group(Sequence[Any_]):
+    """Immutable tuple-backed group of comparables (base of ``All`` and ``Any``).
+
+    It stores the comparables in a tuple with a hash computed once and cached
+    so that trees of comparables use less memory per node and can be used
+    as keys of dictionaries or caches. Groups of the same type are equal
+    if their comparables are structurally equal (see ``equals``).
+    A group made by ``concat`` shares the group it extends and only keeps
+    the appended comparables until its tuple is first accessed, so that
+    chains like ``reduce(operator.or_, comparables)`` take linear time.
+
+    Args:
+        comparables: Comparables (or scalars) of the group.
+
+    """
+
+    __slots__ = ("_hash", "_items", "_prefix")
+
+    _hash: int | None
+    _items: tuple[Any_, ...]
+    _prefix: "Group | None"
+
+    def __init__(self, comparables: Iterable[Any_] = (), /) -> None:
+        object.__setattr__(self, "_hash", None)
+        object.__setattr__(self, "_items", tuple(comparables))
+        object.__setattr__(self, "_prefix", None)
+
+    @classmethod
+    def of(cls, comparables: Iterable[Any_], /) -> Self:
+        """Create a group in linear time, flattening the groups of the same type.
+
+        Examples:
+            ::
+
+                from ndtools import All
+
+                All.of([0, All([1, 2]), 3])  # -> All([0, 1, 2, 3])
+
+        """
+        items: list[Any_] = []
+
+        for comparable in comparables:
+            if isinstance(comparable, cls):
+                items.extend(comparable.data)
+            else:
+                items.append(comparable)
+
+        return cls(items)
+
+    @property
+    def data(self) -> tuple[Any_, ...]:
+        """Comparables (or scalars) of the group."""
+        if self._prefix is None:
+            return self._items
+
+        chunks: list[tuple[Any_, ...]] = []
+        group: Group | None = self
+
+        while group is not None:
+            chunks.append(group._items)
+            group = group._prefix
+
+        object.__setattr__(self, "_items", tuple(chain.from_iterable(reversed(chunks))))
+        object.__setattr__(self, "_prefix", None)
+        return self._items
+
+    def concat(self, comparables: Iterable[Any_], /) -> Self:
+        """Return a new group with comparables appended in O(appended) time."""
+        group = type(self)(comparables)
+        object.__setattr__(group, "_prefix", self)
+        return group
+
+    def __contains__(self, value: Any_) -> bool:
+        return any(equals(comparable, value) for comparable in self.data)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __eq__(self, other: Any_) -> Any_:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return equals(self, other)
+
+    @overload
+    def __getitem__(self, index: int) -> Any_: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> Any_:
+        if isinstance(index, slice):
+            return type(self)(self.data[index])
+
+        return self.data[index]
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((type(self), self.data)))
+
+        return self._hash  # type: ignore
+
+    def __iter__(self) -> Iterator[Any_]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __reduce__(self) -> tuple[Any_, ...]:
+        return type(self), (self.data,)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.data)!r})"
+
+    def __setattr__(self, name: str, value: Any_) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+
+class All(Group, Combinable, Equatable):
     """Implement logical conjunction between comparables.
 
     It should contain comparables like ``All([comparable_0, comparable_1, ...])``.
     Then the equality operation on the target array will perform like
     ``(array == comparable_0) & array == comparable_1) & ...``.
+    It is immutable and hashable (see ``Group``).
 
     Examples:
         ::
@@ -220,16 +382,25 @@ class All(UserList[Any_], Combinable, Equatable):
 
     """
 
+    __slots__ = ()
+    __hash__ = Group.__hash__
+
     def __eq__(self, other: Any_) -> Any_:
-        return reduce(and_, (other == cond for cond in self))
+        if type(other) is type(self):
+            return equals(self, other)
+
+        return to_container(reduce(and_, (other == cond for cond in self)), other)
 
 
-class Any(UserList[Any_], Combinable, Equatable):
+class Any(Group, Combinable, Equatable):
     """Implement logical disjunction between comparables.
 
     It should contain comparables like ``Any([comparable_0, comparable_1, ...])``.
     Then the equality operation on the target array will perform like
     ``(array == comparable_0) | array == comparable_1) & ...``.
+    If all of them are scalars and the array is Arrow-backed,
+    it will be evaluated as a membership test by ``pyarrow.compute``.
+    It is immutable and hashable (see ``Group``).
 
     Examples:
         ::
@@ -250,8 +421,18 @@ class Any(UserList[Any_], Combinable, Equatable):
 
     """
 
+    __slots__ = ()
+    __hash__ = Group.__hash__
+
     def __eq__(self, other: Any_) -> Any_:
-        return reduce(or_, (other == cond for cond in self))
+        if type(other) is type(self):
+            return equals(self, other)
+
+        if is_arrow(other) and all(map(pd.api.types.is_scalar, self)):
+            if (result := isin(other, self)) is not NotImplemented:
+                return result
+
+        return to_container(reduce(or_, (other == cond for cond in self)), other)
 
 
 class Not(Combinable, Equatable):
@@ -260,6 +441,7 @@ class Not(Combinable, Equatable):
     It should wrap a comparable like ``Not(comparable)``.
     Then the equality operation on the target array
     will perform like ``array != comparable``.
+    It is immutable and hashable like ``All`` and ``Any``.
 
     Examples:
         ::
@@ -271,11 +453,98 @@ class Not(Combinable, Equatable):
 
     """
 
+    __slots__ = ("comparable", "_hash")
+
+    comparable: Any_
+    """Comparable (or scalar) to be negated."""
+
+    _hash: int | None
+
     def __init__(self, comparable: Any_, /) -> None:
-        self.comparable = comparable
+        object.__setattr__(self, "comparable", comparable)
+        object.__setattr__(self, "_hash", hash_or_none((type(self), comparable)))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
 
     def __eq__(self, other: Any_) -> Any_:
+        if type(other) is type(self):
+            return equals(self, other)
+
         return other != self.comparable
 
+    def __hash__(self) -> int:
+        if self._hash is None:
+            raise TypeError(f"{type(self).__name__} has an unhashable comparable.")
+
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any_, ...]:
+        return type(self), (self.comparable,)
+
     def __repr__(self) -> str:
         return f"Not({self.comparable})"
+
+    def __setattr__(self, name: str, value: Any_) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+
+def equals(left: Any_, right: Any_, /) -> Any_:
+    """Check if two comparables (or scalars) are structurally equal.
+
+    Comparables are equal if they are of the same type and their members
+    (of groups, ``Not``, or dataclass fields) are structurally equal.
+    Other comparables are equal only if they are identical.
+
+    Returns:
+        ``numpy.bool_`` so that ``~`` of it works as logical negation
+        (e.g. ``comparable != other`` derived from ``__eq__``).
+
+    """
+    if left is right:
+        return np.True_
+
+    if type(left) is not type(right):
+        return np.False_
+
+    if isinstance(left, (Group, tuple, list)):
+        if len(left) != len(right):  # type: ignore
+            return np.False_
+
+        return np.bool_(all(map(equals, left, right)))  # type: ignore
+
+    if isinstance(left, dict):
+        if left.keys() != right.keys():  # type: ignore
+            return np.False_
+
+        return np.bool_(all(equals(left[key], right[key]) for key in left))  # type: ignore
+
+    if isinstance(left, Not):
+        return equals(left.comparable, right.comparable)
+
+    if is_dataclass(left):
+        return np.bool_(
+            all(
+                equals(getattr(left, field.name), getattr(right, field.name))
+                for field in fields(left)
+                if field.compare
+            )
+        )
+
+    if isinstance(left, (Equatable, Orderable)):
+        return np.False_
+
+    try:
+        result: Any_ = left == right
+    except Exception:
+        return np.False_
+
+    return np.bool_(result) if isinstance(result, (bool, np.bool_)) else np.False_  # type: ignore
+
+
+def hash_or_none(obj: Any_, /) -> int | None:
+    """Return the hash of an object or ``None`` if it is unhashable."""
+    try:
+        return hash(obj)
+    except TypeError:
+        return None
@@ -0,0 +1,182 @@
+__all__ = ["Columns", "Field", "columns", "evaluate", "regroup"]
+
+
+# standard library
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from .builtins import ANY
+from .comparables import All, Any, Combinable, Equatable, Not, equals
+
+
+class Columns:
+    """Read-only view of the columns of a table that reads each column once.
+
+    Args:
+        table: pandas DataFrame, NumPy structured (or record) array,
+            or mapping of column names to arrays (e.g. dict of arrays).
+
+    """
+
+    def __init__(self, table: Any_, /) -> None:
+        self.table = table
+        """Table whose columns are viewed."""
+
+        self.cache: dict[Hashable, Any_] = {}
+        """Columns already read from the table."""
+
+    def __getitem__(self, name: Hashable, /) -> Any_:
+        if name not in self.cache:
+            self.cache[name] = self.table[name]
+
+        return self.cache[name]
+
+
+@dataclass(frozen=True, slots=True)
+class Field(Combinable, Equatable):
+    """Comparable that applies a comparable to a column of a table.
+
+    It is evaluated against a pandas DataFrame, a NumPy structured
+    (or record) array, or a mapping of column names to arrays
+    (e.g. dict of arrays) like ``table[name] == comparable``.
+    A field without a comparable can be bound to one by ``==``
+    like ``Field("energy") == Range(1, 5)``. Fields can be combined
+    by ``&``, ``|``, and ``Not`` like the other comparables, and ``evaluate``
+    evaluates such a tree reading only the referenced columns once each.
+    Note that NumPy does not defer comparisons of structured arrays
+    to comparables, so use ``evaluate`` for them.
+
+    Args:
+        name: Name of the column.
+        comparable: Comparable (or scalar) applied to the column.
+
+    Examples:
+        ::
+
+            import pandas as pd
+            from ndtools import Field, Range
+            from ndtools.comparison.fields import evaluate
+
+            df = pd.DataFrame({"energy": [0, 2, 4], "flag": [1, 0, 1]})
+            expr = (Field("energy") == Range(1, 5)) & (Field("flag") == 1)
+            df == expr  # -> array([False, False, True])
+            evaluate(expr, df)  # same but reads each column once
+
+    """
+
+    name: Hashable
+    """Name of the column."""
+
+    comparable: Any_ = ANY
+    """Comparable (or scalar) applied to the column."""
+
+    def __eq__(self, other: Any_) -> Any_:
+        if type(other) is type(self):
+            return equals(self, other)
+
+        if is_table(other):
+            return evaluate(self, other)
+
+        if self.comparable is ANY:
+            return Field(self.name, other)
+
+        raise TypeError(
+            "Field must be evaluated against a DataFrame, "
+            "a structured array, or a mapping of arrays."
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.name, self.comparable))
+
+
+def columns(comparable: Any_, /) -> list[Hashable]:
+    """Return the names of the columns referenced by a comparable.
+
+    They can be used to load only the referenced columns of a table
+    (e.g. ``pandas.read_parquet(path, columns=columns(expr))``).
+
+    """
+    if isinstance(comparable, Field):
+        return [comparable.name]
+
+    if isinstance(comparable, (All, Any)):
+        names = (name for obj in comparable for name in columns(obj))
+        return list(dict.fromkeys(names))
+
+    if isinstance(comparable, Not):
+        return columns(comparable.comparable)
+
+    return []
+
+
+def evaluate(comparable: Any_, table: Any_, /) -> Any_:
+    """Evaluate ``table == comparable`` reading only the referenced columns once.
+
+    The fields in each ``All`` or ``Any`` are regrouped by their columns
+    (see ``regroup``) so that each column is read and passed to
+    its conditions at once, and the columns are read from the table
+    only when they are referenced.
+
+    Args:
+        comparable: Comparable (typically a tree of ``Field``) to be evaluated.
+        table: pandas DataFrame, NumPy structured (or record) array,
+            or mapping of column names to arrays (e.g. dict of arrays).
+
+    Returns:
+        Boolean NumPy array of the length of the table.
+
+    """
+    view = table if isinstance(table, Columns) else Columns(table)
+
+    if isinstance(comparable, Field):
+        return np.asarray(view[comparable.name] == comparable.comparable)
+
+    return np.asarray(view == regroup(comparable))
+
+
+def is_table(obj: Any_, /) -> bool:
+    """Check if an object is a table that fields can be evaluated against."""
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.names is not None  # type: ignore
+
+    return isinstance(obj, (Columns, Mapping, pd.DataFrame))
+
+
+def regroup(comparable: Any_, /) -> Any_:
+    """Regroup the fields in ``All`` and ``Any`` by their columns.
+
+    Examples:
+        ::
+
+            from ndtools import Field
+            from ndtools.comparison.fields import regroup
+
+            regroup(Field("a", 1) & Field("b", 2) & Field("a", 3))
+            # -> All([Field("a", All([1, 3])), Field("b", 2)])
+
+    """
+    if isinstance(comparable, Not):
+        return Not(regroup(comparable.comparable))
+
+    if not isinstance(comparable, (All, Any)):
+        return comparable
+
+    group = type(comparable)
+    fields: dict[Hashable, list[Any_]] = {}
+    others: list[Any_] = []
+
+    for obj in map(regroup, comparable):
+        if isinstance(obj, Field):
+            fields.setdefault(obj.name, []).append(obj.comparable)
+        else:
+            others.append(obj)
+
+    merged = [
+        Field(name, conds[0] if len(conds) == 1 else group(conds))
+        for name, conds in fields.items()
+    ]
+    return group([*merged, *others])
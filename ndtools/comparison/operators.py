@@ -1,21 +1,59 @@
-__all__ = ["eq", "ge", "gt", "le", "lt", "ne"]
+__all__ = ["compare", "eq", "ge", "gt", "le", "lt", "ne"]
 
 
 # standard library
 from typing import Any, TypeVar
 
 # dependencies
+import numpy as np
 from .utils import get_method
 
 # type hints
 T = TypeVar("T")
 
+# constants
+LESS = -1
+EQUAL = 0
+GREATER = 1
+UNORDERED = 2
+
+
+def compare(left: Any, right: Any, /) -> Any:
+    """Implement the three-way comparison for multidimensional arrays.
+
+    If ``left`` implements the ``__compare__`` method, it is used
+    to compare ``left`` with ``right`` in a single evaluation.
+    Otherwise it will fall back to ``<``, ``==``, and ``>`` of ``left``.
+
+    Args:
+        left: Left hand side of the comparison.
+        right: Right hand side of the comparison.
+
+    Returns:
+        Int8 array whose elements are ``LESS`` (-1) where ``left < right``,
+        ``EQUAL`` (0) where ``left == right``, ``GREATER`` (1) where ``left > right``,
+        and ``UNORDERED`` (2) where none of them holds (e.g. NaN).
+        It is in the same container type as the results of the comparison
+        (e.g. pandas Series or xarray DataArray).
+
+    """
+    if (method := get_method(type(left), "__compare__", None)) is not None:
+        return method(left, right)
+
+    equal, less, greater = eq(left, right), lt(left, right), gt(left, right)
+    return to_codes(
+        np.logical_and(less, np.logical_not(np.logical_or(equal, greater))),
+        np.logical_and(greater, np.logical_not(equal)),
+        np.logical_not(np.logical_or(np.logical_or(equal, less), greater)),
+    )
+
 
 def eq(left: T, right: Any, /) -> T:
     """Implement the ``==`` operator for multidimensional arrays.
 
     If ``left`` does not implement the ``__eq__`` method, it will fall back
-    to an equivalent implementation using another comparison operators.
+    to an equivalent implementation using another comparison operators
+    or the three-way comparison (``__compare__``) of ``left``.
 
     Args:
         left: Left hand side of the operator.
@@ -34,6 +72,9 @@ def eq(left: T, right: Any, /) -> T:
     if get_method(cls, "__ne__", ne) is not ne:
         return ~ne(left, right)  # type: ignore
 
+    if (method := get_method(cls, "__compare__", None)) is not None:
+        return method(left, right) == EQUAL  # type: ignore
+
     raise AttributeError("No comparison operator is defined for left == right.")
 
 
@@ -41,7 +82,8 @@ def ge(left: T, right: Any, /) -> T:
     """Implement the ``>=`` operator for multidimensional arrays.
 
     If ``left`` does not implement the ``__ge__`` method, it will fall back
-    to an equivalent implementation using another comparison operators.
+    to an equivalent implementation using another comparison operators
+    or the three-way comparison (``__compare__``) of ``left``.
 
     Args:
         left: Left hand side of the operator.
@@ -57,6 +99,10 @@ def ge(left: T, right: Any, /) -> T:
     if get_method(cls := type(left), "__ge__", ge) is not ge:
         return left >= right
 
+    if (method := get_method(cls, "__compare__", None)) is not None:
+        codes = method(left, right)
+        return (codes == EQUAL) | (codes == GREATER)  # type: ignore
+
     if get_method(cls, "__lt__", lt) is not lt:
         return ~lt(left, right)  # type: ignore
 
@@ -73,7 +119,8 @@ def gt(left: T, right: Any, /) -> T:
     """Implement the ``>`` operator for multidimensional arrays.
 
     If ``left`` does not implement the ``__gt__`` method, it will fall back
-    to an equivalent implementation using another comparison operators.
+    to an equivalent implementation using another comparison operators
+    or the three-way comparison (``__compare__``) of ``left``.
 
     Args:
         left: Left hand side of the operator.
@@ -89,6 +136,9 @@ def gt(left: T, right: Any, /) -> T:
     if get_method(cls := type(left), "__gt__", gt) is not gt:
         return left > right
 
+    if (method := get_method(cls, "__compare__", None)) is not None:
+        return method(left, right) == GREATER  # type: ignore
+
     if get_method(cls, "__le__", le) is not le:
         return ~le(left, right)  # type: ignore
 
@@ -105,7 +155,8 @@ def le(left: T, right: Any, /) -> T:
     """Implement the ``<=`` operator for multidimensional arrays.
 
     If ``left`` does not implement the ``__le__`` method, it will fall back
-    to an equivalent implementation using another comparison operators.
+    to an equivalent implementation using another comparison operators
+    or the three-way comparison (``__compare__``) of ``left``.
 
     Args:
         left: Left hand side of the operator.
@@ -121,6 +172,9 @@ def le(left: T, right: Any, /) -> T:
     if get_method(cls := type(left), "__le__", le) is not le:
         return left <= right
 
+    if (method := get_method(cls, "__compare__", None)) is not None:
+        return method(left, right) <= EQUAL  # type: ignore
+
     if get_method(cls, "__gt__", gt) is not gt:
         return ~gt(left, right)  # type: ignore
 
@@ -137,7 +191,8 @@ def lt(left: T, right: Any, /) -> T:
     """Implement the ``<`` operator for multidimensional arrays.
 
     If ``left`` does not implement the ``__lt__`` method, it will fall back
-    to an equivalent implementation using another comparison operators.
+    to an equivalent implementation using another comparison operators
+    or the three-way comparison (``__compare__``) of ``left``.
 
     Args:
         left: Left hand side of the operator.
@@ -153,6 +208,9 @@ def lt(left: T, right: Any, /) -> T:
     if get_method(cls := type(left), "__lt__", lt) is not lt:
         return left < right
 
+    if (method := get_method(cls, "__compare__", None)) is not None:
+        return method(left, right) == LESS  # type: ignore
+
     if get_method(cls, "__ge__", ge) is not ge:
         return ~ge(left, right)  # type: ignore
 
@@ -169,7 +227,8 @@ def ne(left: T, right: Any, /) -> T:
     """Implement the ``!=`` operator for multidimensional arrays.
 
     If ``left`` does not implement the ``__ne__`` method, it will fall back
-    to an equivalent implementation using another comparison operators.
+    to an equivalent implementation using another comparison operators
+    or the three-way comparison (``__compare__``) of ``left``.
 
     Args:
         left: Left hand side of the operator.
@@ -188,4 +247,13 @@ def ne(left: T, right: Any, /) -> T:
     if get_method(cls, "__eq__", eq) is not eq:
         return ~eq(left, right)  # type: ignore
 
+    if (method := get_method(cls, "__compare__", None)) is not None:
+        return method(left, right) != EQUAL  # type: ignore
+
     raise AttributeError("No comparison operator is defined for left != right.")
+
+
+def to_codes(less: Any, greater: Any, unordered: Any, /) -> Any:
+    """Combine disjoint boolean arrays into the codes of the three-way comparison."""
+    codes = np.subtract(greater, less, dtype=np.int8)
+    return codes + np.multiply(unordered, UNORDERED, dtype=np.int8)
@@ -1,9 +1,12 @@
-__all__ = ["get_method", "has_method"]
+__all__ = ["get_method", "has_method", "to_container"]
 
 
 # standard library
 from typing import Any
 
+# dependencies
+import pandas as pd
+
 
 def get_method(cls: Any, name: str, default: Any, /) -> Any:
     """Return a user-defined method of a class with given name."""
@@ -27,3 +30,14 @@ def is_abstractmethod(method: Any, /) -> bool:
 def is_objectmethod(method: Any, /) -> bool:
     """Check if given method is defined in the object class."""
     return method is getattr(object, method.__name__, None)
+
+
+def to_container(result: Any, like: Any, /) -> Any:
+    """Wrap a result in the pandas container (Series or Index) of another array."""
+    if isinstance(like, pd.Series) and not isinstance(result, pd.Series):
+        return pd.Series(result, like.index, name=like.name)  # type: ignore
+
+    if isinstance(like, pd.Index) and not isinstance(result, pd.Index):
+        return pd.Index(result, name=like.name)  # type: ignore
+
+    return result  # type: ignore
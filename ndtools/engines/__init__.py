@@ -0,0 +1,35 @@
+__all__ = [
+    "asynchronous",
+    "batching",
+    "budget",
+    "classification",
+    "datasets",
+    "incremental",
+    "lazy",
+    "numba",
+    "numexpr",
+    "plans",
+    "runs",
+    "selection",
+    "sparse",
+    "sql",
+    "utils",
+]
+
+
+# dependencies
+from . import asynchronous
+from . import batching
+from . import budget
+from . import classification
+from . import datasets
+from . import incremental
+from . import lazy
+from . import numba
+from . import numexpr
+from . import plans
+from . import runs
+from . import selection
+from . import sparse
+from . import sql
+from . import utils
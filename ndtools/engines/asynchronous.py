@@ -0,0 +1,116 @@
+__all__ = ["aevaluate"]
+
+
+# standard library
+import asyncio
+from concurrent.futures import Executor
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from .incremental import is_elementwise
+
+# constants
+CHUNKSIZE = 1_000_000
+
+
+async def aevaluate(
+    comparable: Any_,
+    array: Any_,
+    /,
+    *,
+    chunksize: int = CHUNKSIZE,
+    executor: Executor | None = None,
+    limiter: asyncio.Semaphore | None = None,
+    timeout: float | None = None,
+) -> Any_:
+    """Evaluate ``array == comparable`` in an executor without blocking the loop.
+
+    The (flattened) array is evaluated chunk by chunk in the executor
+    and the control is yielded to the event loop between the chunks.
+    Cancellation and timeout take effect at the chunk boundaries:
+    the chunk being evaluated is run to the end in the worker
+    but no more chunks are submitted. If a limiter is shared by requests,
+    each chunk holds it while being evaluated so that the requests
+    share the worker pool fairly chunk by chunk. Comparables that opt out
+    of elementwise evaluation (see ``ndtools.engines.incremental``)
+    are evaluated on the whole array as one chunk.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array.
+        chunksize: Number of the elements in each chunk.
+        executor: Executor where the chunks are evaluated.
+            Defaults to the default executor of the event loop.
+        limiter: Semaphore that limits the number of chunks
+            evaluated concurrently across the requests sharing it.
+        timeout: Timeout of the whole evaluation in seconds.
+
+    Returns:
+        Boolean NumPy array of the same shape as the array.
+
+    Raises:
+        TimeoutError: Raised if the evaluation does not finish within the timeout.
+        ValueError: Raised if the chunk size is not positive.
+
+    Examples:
+        ::
+
+            import asyncio
+            import numpy as np
+            from ndtools import Range, aevaluate
+
+            async def main():
+                return await aevaluate(Range(1, 3), np.arange(5), timeout=1.0)
+
+            asyncio.run(main())  # -> array([False, True, True, False, False])
+
+    """
+    if chunksize <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+
+    array = np.asarray(array)
+    flat = array.ravel()
+
+    if is_elementwise(comparable):
+        chunks = [flat[i : i + chunksize] for i in range(0, flat.size, chunksize)]
+    else:
+        chunks = [array]
+
+    def evaluate(chunk: Any_, /) -> Any_:
+        return np.asarray(chunk == comparable, bool).ravel()
+
+    async def submit(chunk: Any_, /) -> Any_:
+        return await loop.run_in_executor(executor, evaluate, chunk)
+
+    async def run(chunk: Any_, /) -> Any_:
+        if limiter is None:
+            return await submit(chunk)
+
+        async with limiter:
+            return await submit(chunk)
+
+    results: list[Any_] = []
+
+    for chunk in chunks:
+        if deadline is None:
+            results.append(await run(chunk))
+        elif (remaining := deadline - loop.time()) <= 0:
+            raise TimeoutError("Evaluation did not finish within the timeout.")
+        else:
+            try:
+                results.append(await asyncio.wait_for(run(chunk), remaining))
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    "Evaluation did not finish within the timeout."
+                ) from None
+
+        await asyncio.sleep(0)
+
+    if not results:
+        return np.empty(array.shape, bool)
+
+    return np.concatenate(results).reshape(array.shape)
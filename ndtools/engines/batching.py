@@ -0,0 +1,219 @@
+__all__ = ["Batcher", "evaluate"]
+
+
+# standard library
+import asyncio
+from collections.abc import Iterable, Mapping
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ..comparison import fields
+
+# constants
+BATCHSIZE = 1024
+LATENCY = 0.001
+
+
+class Batcher:
+    """Micro-batching evaluator of a comparable for streams of events.
+
+    Each call with a scalar value (or a small record, i.e. mapping
+    of field names to values, for trees of ``Field``) is buffered
+    and awaits its result while the buffered events are evaluated
+    at once as vectors (see ``evaluate``) when the buffer is full
+    or when the oldest event has waited for the maximum latency.
+    An event that fails to be evaluated raises its own exception
+    without failing the other events of the batch.
+    The batches are evaluated in the thread of the event loop.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        batchsize: Maximum number of the events in each batch.
+        latency: Maximum time in seconds that an event waits for its batch.
+
+    Examples:
+        ::
+
+            import asyncio
+            from ndtools import Range
+            from ndtools.engines.batching import Batcher
+
+            batcher = Batcher(Range(1, 3), batchsize=256, latency=0.001)
+
+            async def route(event):
+                if await batcher(event):
+                    ...
+
+            async def main():
+                await asyncio.gather(*(route(event) for event in range(1000)))
+
+            asyncio.run(main())
+
+    """
+
+    def __init__(
+        self,
+        comparable: Any_,
+        /,
+        *,
+        batchsize: int = BATCHSIZE,
+        latency: float = LATENCY,
+    ) -> None:
+        if batchsize <= 0:
+            raise ValueError("Batch size must be positive.")
+
+        self.comparable = comparable
+        """Comparable (or scalar) to be evaluated."""
+
+        self.batchsize = batchsize
+        """Maximum number of the events in each batch."""
+
+        self.latency = latency
+        """Maximum time in seconds that an event waits for its batch."""
+
+        self.events: list[Any_] = []
+        """Buffered events waiting for their batch."""
+
+        self.futures: list[asyncio.Future[bool]] = []
+        """Futures of the results of the buffered events."""
+
+        self.timer: asyncio.TimerHandle | None = None
+        """Timer that flushes the buffer at the maximum latency."""
+
+    async def __call__(self, event: Any_, /) -> bool:
+        """Return whether an event is equal to the comparable.
+
+        Args:
+            event: Scalar value or record (mapping) of the event.
+
+        Returns:
+            Result of the event evaluated in its batch.
+
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        self.events.append(event)
+        self.futures.append(future)
+
+        if len(self.events) >= self.batchsize:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.latency, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Evaluate the buffered events at once and set their results."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        events, self.events = self.events, []
+        futures, self.futures = self.futures, []
+
+        if not events:
+            return
+
+        for future, result in zip(futures, evaluate_each(self.comparable, events)):
+            if future.done():
+                continue
+
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def evaluate(comparable: Any_, events: Iterable[Any_], /) -> Any_:
+    """Evaluate a comparable on a batch of events at once.
+
+    The events are grouped by their types so that each event keeps
+    its own scalar semantics regardless of the other events of the batch.
+    Each group of scalar values is evaluated as a vector
+    by ``comparable == numpy.asarray(group)`` so that errors of the
+    comparable are not swallowed by NumPy, and a group of records
+    (mappings of field names to values) is evaluated as the rows
+    of a DataFrame against trees of ``Field``. If a group fails,
+    its events are evaluated one by one (``event == comparable``
+    for scalar values) so that each event raises its own error.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        events: Scalar values or records (mappings) of the events.
+
+    Returns:
+        Boolean NumPy array of the results of the events.
+
+    Raises:
+        Exception: The exception of the first event that fails to be evaluated.
+
+    Examples:
+        ::
+
+            from ndtools import Field, Range
+            from ndtools.engines.batching import evaluate
+
+            evaluate(Range(1, 3), [0, 1, 2, 3])  # -> array([False, True, True, False])
+            evaluate(1, [1, "a", 1.0])  # -> array([True, False, True])
+            evaluate(Field("a", 1), [{"a": 1}, {"a": 2}])  # -> array([True, False])
+
+    """
+    results = evaluate_each(comparable, events)
+
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+    return np.array(results, bool)
+
+
+def evaluate_each(comparable: Any_, events: Iterable[Any_], /) -> list[Any_]:
+    """Return the result (or exception) of each event evaluated by groups of types."""
+    events = list(events)
+    groups: dict[Any_, list[int]] = {}
+    results: list[Any_] = [None] * len(events)
+
+    for index, event in enumerate(events):
+        key = Mapping if isinstance(event, Mapping) else type(event)  # type: ignore
+        groups.setdefault(key, []).append(index)
+
+    for key, indices in groups.items():
+        group = [events[index] for index in indices]
+        values: list[Any_]
+
+        try:
+            values = evaluate_group(comparable, group, key is Mapping)
+        except Exception:
+            values = []
+
+            for event in group:
+                try:
+                    values.append(evaluate_event(comparable, event, key is Mapping))
+                except Exception as error:
+                    values.append(error)
+
+        for index, value in zip(indices, values):
+            results[index] = value
+
+    return results
+
+
+def evaluate_event(comparable: Any_, event: Any_, record: bool, /) -> bool:
+    """Evaluate a comparable on a single event with its own scalar semantics."""
+    if record:
+        return evaluate_group(comparable, [event], True)[0]
+
+    return bool(event == comparable)
+
+
+def evaluate_group(comparable: Any_, group: list[Any_], records: bool, /) -> Any_:
+    """Evaluate a comparable on a group of events of the same type as a vector."""
+    if records:
+        table = pd.DataFrame.from_records(group)  # type: ignore
+        mask = fields.evaluate(comparable, table)
+    else:
+        mask = comparable == np.asarray(group)
+
+    return np.asarray(mask, bool).reshape(len(group)).tolist()
@@ -0,0 +1,275 @@
+__all__ = ["Report", "evaluate", "footprint"]
+
+
+# standard library
+from dataclasses import dataclass
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ..comparison.builtins import AnyType, Match, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+from .incremental import is_elementwise
+from .utils import is_lowerable, is_number
+
+# constants
+OBJECT_SIZE = 64
+
+
+@dataclass(frozen=True)
+class Report:
+    """Report of a memory-budgeted evaluation."""
+
+    budget: int
+    """Byte budget of the temporaries."""
+
+    chunksize: int
+    """Number of the elements evaluated at once."""
+
+    estimate: int
+    """Estimated peak bytes of the temporaries of one chunk."""
+
+    peak: int
+    """Peak bytes of the engine's temporaries (except the input and the result)."""
+
+
+class Usage:
+    """Tracker of the bytes of the temporaries allocated by an evaluation."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        """Bytes of the temporaries currently allocated."""
+
+        self.peak = 0
+        """Peak bytes of the temporaries allocated so far."""
+
+    def allocate(self, nbytes: int, /) -> None:
+        """Record the allocation of a temporary."""
+        self.current += nbytes
+        self.peak = max(self.peak, self.current)
+
+    def free(self, nbytes: int, /) -> None:
+        """Record the release of a temporary."""
+        self.current -= nbytes
+
+
+def evaluate(comparable: Any_, array: Any_, /, *, budget: int) -> tuple[Any_, Report]:
+    """Evaluate ``array == comparable`` keeping the temporaries under a byte budget.
+
+    The bytes of the temporaries per element are estimated
+    from the data type and the tree (see ``footprint``),
+    and the (flattened) array is evaluated chunk by chunk
+    with the largest chunk size that fits in the budget.
+    Each chunk is written into the result in place:
+    ``All``, ``Any``, and ``Not`` are combined into it by in-place
+    logical ufuncs (skipping the members once the chunk is decided),
+    and numeric ``Range`` and scalar equality are compared into it directly.
+    The peak of the temporaries actually allocated by the evaluation
+    is tracked by their sizes (without process-wide tracing, so that
+    it can be used concurrently). Only the temporaries of the engine
+    itself are counted: neither the input array nor the result
+    (one byte per element) is included in the budget and the peak,
+    and temporaries allocated inside user comparables
+    are not tracked except their results.
+    Comparables that opt out of elementwise evaluation
+    (see ``ndtools.engines.incremental``) are evaluated
+    on the whole array as one chunk regardless of the budget.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array.
+        budget: Byte budget of the temporaries (except the result).
+
+    Returns:
+        Tuple of the boolean NumPy array of the same shape as the array
+        and the report of the chunk size and the estimated and tracked peaks.
+
+    Raises:
+        ValueError: Raised if the budget is smaller than
+            the temporaries of a single element.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Not, Range
+            from ndtools.engines.budget import evaluate
+
+            expr = Range(0, 10) & Not(5)
+            mask, report = evaluate(expr, np.arange(10**7), budget=2**20)
+            report.chunksize  # -> 1048576
+            report.peak  # -> about 1 MiB or less
+
+    """
+    array = np.asarray(array)
+    flat = array.reshape(-1)
+    per_element = footprint(comparable, array.dtype)
+
+    if not is_elementwise(comparable):
+        chunksize = max(flat.size, 1)
+    elif budget < per_element:
+        raise ValueError(f"Budget must be at least {per_element} bytes.")
+    else:
+        chunksize = budget // per_element if per_element else max(flat.size, 1)
+
+    result: Any_ = np.empty(flat.shape, bool)
+    usage = Usage()
+
+    if is_elementwise(comparable):
+        for start in range(0, flat.size, chunksize):
+            chunk = slice(start, start + chunksize)
+            fill(comparable, flat[chunk], result[chunk], usage)
+    else:
+        assign(result, array == comparable, usage)
+
+    report = Report(
+        budget=budget,
+        chunksize=chunksize,
+        estimate=per_element * min(chunksize, flat.size),
+        peak=usage.peak,
+    )
+    return result.reshape(array.shape), report
+
+
+def footprint(comparable: Any_, dtype: Any_, /) -> int:
+    """Estimate the bytes of the temporaries per element of an evaluation.
+
+    The estimate follows the in-place evaluation of ``evaluate``:
+    ``ANY``, ``NEVER``, numeric scalar equality, and one-sided numeric ``Range``
+    need no temporaries, two-sided numeric ``Range`` needs one boolean,
+    and each member of ``All`` and ``Any`` except the first needs one boolean
+    in addition to its own temporaries. Other leaves are roughly
+    estimated as one copy of the element and one boolean
+    (and Python objects for ``Match``).
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        dtype: Data type of the array to be compared.
+
+    Returns:
+        Estimated bytes per element (except the result).
+
+    """
+    dtype = np.dtype(dtype)
+
+    if isinstance(comparable, (AnyType, NeverType)):
+        return 0
+
+    if isinstance(comparable, (All, Any)) and len(comparable):
+        first, *others = (footprint(obj, dtype) for obj in comparable)
+        return max([first, *(1 + other for other in others)])
+
+    if isinstance(comparable, Not):
+        return footprint(comparable.comparable, dtype)
+
+    if isinstance(comparable, Range) and is_native(comparable, dtype):
+        if dtype.kind in "Mm":
+            comparable = comparable.normalize(dtype)
+
+        return int(comparable.lower is not None and comparable.upper is not None)
+
+    if is_number(comparable) and dtype.kind in "biuf":
+        return 0
+
+    if isinstance(comparable, Match):
+        return dtype.itemsize + OBJECT_SIZE + 1
+
+    return dtype.itemsize + 1
+
+
+def assign(out: Any_, result: Any_, usage: Usage, /) -> None:
+    """Write a result of a comparison into a boolean array tracking its size."""
+    result = np.asarray(result, bool)
+    usage.allocate(result.nbytes)
+    out[...] = result.reshape(out.shape)
+    usage.free(result.nbytes)
+
+
+def fill(comparable: Any_, chunk: Any_, out: Any_, usage: Usage, /) -> None:
+    """Write ``chunk == comparable`` into a boolean array in place."""
+    if isinstance(comparable, AnyType):
+        out[...] = True
+        return
+
+    if isinstance(comparable, NeverType):
+        out[...] = False
+        return
+
+    if isinstance(comparable, All) and len(comparable):
+        fill(comparable[0], chunk, out, usage)
+        temp = np.empty_like(out)
+        usage.allocate(temp.nbytes)
+
+        for obj in comparable[1:]:
+            if not out.any():
+                break
+
+            fill(obj, chunk, temp, usage)
+            np.logical_and(out, temp, out=out)
+
+        usage.free(temp.nbytes)
+        return
+
+    if isinstance(comparable, Any) and len(comparable):
+        fill(comparable[0], chunk, out, usage)
+        temp = np.empty_like(out)
+        usage.allocate(temp.nbytes)
+
+        for obj in comparable[1:]:
+            if out.all():
+                break
+
+            fill(obj, chunk, temp, usage)
+            np.logical_or(out, temp, out=out)
+
+        usage.free(temp.nbytes)
+        return
+
+    if isinstance(comparable, Not):
+        fill(comparable.comparable, chunk, out, usage)
+        np.logical_not(out, out=out)
+        return
+
+    if isinstance(comparable, Range) and is_native(comparable, chunk.dtype):
+        if comparable.lower is None and comparable.upper is None:
+            out[...] = True
+            return
+
+        if chunk.dtype.kind in "Mm":
+            comparable = comparable.normalize(chunk.dtype)
+            chunk = chunk.view(np.int64)
+
+        if (lower := comparable.lower) is not None:
+            compare = np.greater_equal if comparable.is_lower_closed else np.greater
+            compare(chunk, lower, out=out)
+
+        if (upper := comparable.upper) is not None:
+            compare = np.less_equal if comparable.is_upper_closed else np.less
+
+            if lower is None:
+                compare(chunk, upper, out=out)
+            else:
+                temp = np.empty_like(out)
+                usage.allocate(temp.nbytes)
+                compare(chunk, upper, out=temp)
+                np.logical_and(out, temp, out=out)
+                usage.free(temp.nbytes)
+
+        return
+
+    if is_number(comparable) and chunk.dtype.kind in "biuf":
+        np.equal(chunk, comparable, out=out)  # type: ignore
+        return
+
+    assign(out, chunk == comparable, usage)
+
+
+def is_native(comparable: Range, dtype: Any_, /) -> bool:
+    """Check if a range is compared with an array by NumPy ufuncs only."""
+    if comparable.lower is None and comparable.upper is None:
+        return comparable.bounds in ("[]", "[)", "(]", "()")
+
+    if (dtype := np.dtype(dtype)).kind in "Mm":
+        return comparable.normalize(dtype) is not comparable
+
+    return dtype.kind in "biuf" and is_lowerable(comparable)
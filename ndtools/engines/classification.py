@@ -0,0 +1,91 @@
+__all__ = ["Classify"]
+
+
+# standard library
+from collections.abc import Iterable
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from .incremental import is_elementwise
+from .selection import compare
+
+
+class Classify:
+    """One-pass classifier of array elements by comparables in priority order.
+
+    Each element is labeled by the index of the first comparable
+    that it is equal to (or by the default label if none).
+    It is equivalent to ``np.select([array == c for c in comparables],
+    range(len(comparables)), default)`` but each comparable
+    is evaluated only on the elements that are still unlabeled
+    and the evaluation stops once all elements are labeled.
+    Comparables that opt out of elementwise evaluation
+    (see ``ndtools.engines.incremental``) are evaluated on all elements
+    and their results are used only for the unlabeled ones.
+
+    Args:
+        comparables: Comparables (or scalars) of the categories
+            in priority order (from highest to lowest).
+        default: Label of the elements that match no comparable.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Match, Range
+            from ndtools.engines.classification import Classify
+
+            classify = Classify([Range(None, 0), Range(0, 10), 99], default=-1)
+            classify(np.array([-5, 3, 99, 10]))  # -> array([0, 1, 2, -1])
+
+            classify = Classify([Match("ERROR.*"), Match("WARN.*")], default=2)
+            classify(np.array(["WARN: a", "INFO: b", "ERROR: c"]))  # -> array([1, 2, 0])
+
+    """
+
+    def __init__(self, comparables: Iterable[Any_], /, *, default: int = -1) -> None:
+        self.comparables = tuple(comparables)
+        """Comparables (or scalars) of the categories in priority order."""
+
+        self.default = default
+        """Label of the elements that match no comparable."""
+
+    def __call__(self, array: Any_, /) -> Any_:
+        """Label the elements of an array by the first matching comparables.
+
+        Args:
+            array: Array to be classified. It will be converted to NumPy array.
+                Structured arrays are classified by rows against trees of ``Field``.
+
+        Returns:
+            Integer NumPy array of the labels of the same shape as the array.
+
+        """
+        array = np.asarray(array)
+        flat = array.reshape(-1)
+        labels: Any_ = np.full(flat.size, self.default, np.intp)
+        unlabeled: Any_ = None
+
+        for label, comparable in enumerate(self.comparables):
+            if unlabeled is not None and not unlabeled.size:
+                break
+
+            if unlabeled is None:
+                mask = compare(comparable, flat)
+            elif is_elementwise(comparable):
+                mask = compare(comparable, flat[unlabeled])
+            else:
+                mask = compare(comparable, flat)[unlabeled]
+
+            if unlabeled is None:
+                labels[mask] = label
+                unlabeled = np.flatnonzero(~mask)
+            else:
+                labels[unlabeled[mask]] = label
+                unlabeled = unlabeled[~mask]
+
+        return labels.reshape(array.shape)
+
+    def __repr__(self) -> str:
+        return f"Classify({list(self.comparables)!r}, default={self.default!r})"
@@ -0,0 +1,281 @@
+__all__ = ["read", "split", "to_expression"]
+
+
+# standard library
+from collections.abc import Hashable, Sequence
+from re import IGNORECASE
+from typing import Any as Any_
+
+# dependencies
+from ..comparison import fields
+from ..comparison.arrow import anchor, supports_regex
+from ..comparison.builtins import ANY, AnyType, Match, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+from ..comparison.fields import Field
+from .utils import is_value
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+    import pyarrow.dataset as ds  # type: ignore
+except ImportError:
+    pa = pc = ds = None
+
+
+def read(
+    comparable: Any_,
+    source: Any_,
+    /,
+    *,
+    columns: Sequence[Hashable] | None = None,
+    format: str = "parquet",
+) -> Any_:
+    """Read the rows of a dataset where ``table == comparable`` is True.
+
+    The translatable members of a tree of ``Field`` (see ``split``)
+    are pushed down into the scan of ``pyarrow.dataset`` as a filter
+    so that the row groups are pruned by their statistics
+    and only the matching rows are read. The remaining members
+    (e.g. ``Where`` and user comparables) are then evaluated
+    on the reduced table, and only the requested columns
+    and those referenced by the remaining members are read.
+
+    Args:
+        comparable: Comparable (typically a tree of ``Field``) to be evaluated.
+        source: Path(s) of files or directory, or ``pyarrow.dataset.Dataset``.
+        columns: Names of the columns to be returned. Defaults to all columns.
+        format: File format of the dataset if a path is given.
+
+    Returns:
+        Arrow table of the matching rows and the requested columns.
+
+    Raises:
+        ModuleNotFoundError: Raised if pyarrow is not installed.
+
+    Examples:
+        ::
+
+            from ndtools import Field, Range, Where
+            from ndtools.engines.datasets import read
+
+            expr = (Field("energy") == Range(1, 5)) & (Field("flag") == Where(f))
+            read(expr, "data/", columns=["time", "energy"])
+            # -> pyarrow.Table (filtered by energy in scan, then by flag)
+
+    """
+    if ds is None:
+        raise ModuleNotFoundError("pyarrow is required for this engine.")
+
+    if not isinstance(dataset := source, ds.Dataset):  # type: ignore
+        dataset = ds.dataset(source, format=format)  # type: ignore
+
+    if columns is None:
+        columns = list(dataset.schema.names)  # type: ignore
+
+    expression, residual = split(comparable, dataset.schema)  # type: ignore
+    names = [*columns, *fields.columns(residual)]
+    table = dataset.to_table(  # type: ignore
+        columns=list(dict.fromkeys(names)),
+        filter=expression,
+    )
+
+    if residual is not ANY:
+        mask = fields.evaluate(residual, table.to_pandas())  # type: ignore
+        table = table.filter(pa.array(mask, pa.bool_()))  # type: ignore
+
+    return table.select(list(columns))  # type: ignore
+
+
+def split(comparable: Any_, schema: Any_ = None, /) -> tuple[Any_, Any_]:
+    """Split a comparable into a pushed-down filter and the residual.
+
+    The members of the top-level ``All`` (and of ``All`` bound to a field)
+    are translated by ``to_expression`` one by one so that
+    the untranslatable ones do not prevent the others
+    from being pushed down. ``table == comparable`` is equivalent to
+    filtering by the expression and then evaluating the residual.
+
+    Args:
+        comparable: Comparable (typically a tree of ``Field``) to be split.
+        schema: Arrow schema of the dataset used to convert values.
+
+    Returns:
+        Tuple of the Arrow expression (``None`` if nothing is pushed down)
+        and the residual comparable (``ANY`` if everything is pushed down).
+
+    """
+    members = list(flatten(comparable))
+    expressions: list[Any_] = []
+    residuals: list[Any_] = []
+
+    for member in members:
+        if (expression := to_expression(member, schema)) is None:
+            residuals.append(member)
+        else:
+            expressions.append(expression)
+
+    expression = combine(expressions, All) if expressions else None
+
+    if not residuals:
+        return expression, ANY
+
+    if len(residuals) == 1:
+        return expression, residuals[0]
+
+    return expression, All(residuals)
+
+
+def to_expression(comparable: Any_, schema: Any_ = None, /) -> Any_:
+    """Translate a tree of ``Field`` into an Arrow expression.
+
+    ``Range``, scalar equality, membership (``Any`` of scalars),
+    ``Match`` supported by RE2, ``ANY``, and ``NEVER`` bound to fields,
+    and ``All``, ``Any``, and ``Not`` of them are translated.
+    Missing values are never matched (except by ``ANY``)
+    and their negations are matched as in the evaluation by NumPy.
+
+    Args:
+        comparable: Comparable (typically a tree of ``Field``) to be translated.
+        schema: Arrow schema of the dataset used to convert values
+            (e.g. strings compared with timestamps).
+
+    Returns:
+        Arrow expression or ``None`` if any part cannot be translated.
+
+    Raises:
+        ModuleNotFoundError: Raised if pyarrow is not installed.
+
+    """
+    if pc is None:
+        raise ModuleNotFoundError("pyarrow is required for this engine.")
+
+    if isinstance(comparable, AnyType):
+        return pc.scalar(True)  # type: ignore
+
+    if isinstance(comparable, NeverType):
+        return pc.scalar(False)  # type: ignore
+
+    if isinstance(comparable, (All, Any)) and len(comparable):
+        expressions = [to_expression(obj, schema) for obj in comparable]
+
+        if any(expression is None for expression in expressions):
+            return None
+
+        return combine(expressions, type(comparable))
+
+    if isinstance(comparable, Not):
+        if (expression := to_expression(comparable.comparable, schema)) is None:
+            return None
+
+        return ~expression | expression.is_null()
+
+    if not isinstance(comparable, Field):
+        return None
+
+    if schema is not None and comparable.name not in schema.names:
+        return None
+
+    type_ = None if schema is None else schema.field(comparable.name).type
+    field = pc.field(comparable.name)  # type: ignore
+
+    try:
+        return translate(comparable.comparable, field, type_)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):  # type: ignore
+        return None
+
+
+def combine(expressions: Sequence[Any_], group: type, /) -> Any_:
+    """Combine Arrow expressions by AND (for ``All``) or OR (for ``Any``)."""
+    result = expressions[0]
+
+    for expression in expressions[1:]:
+        result = result & expression if group is All else result | expression
+
+    return result
+
+
+def flatten(comparable: Any_, /) -> Any_:
+    """Yield the members of a top-level ``All`` (distributing fields over them)."""
+    if isinstance(comparable, All):
+        for obj in comparable:
+            yield from flatten(obj)
+    elif isinstance(comparable, Field) and isinstance(comparable.comparable, All):
+        for obj in comparable.comparable:
+            yield from flatten(Field(comparable.name, obj))
+    else:
+        yield comparable
+
+
+def translate(comparable: Any_, field: Any_, type_: Any_, /) -> Any_:
+    """Translate a comparable applied to a field into an Arrow expression."""
+    if isinstance(comparable, AnyType):
+        return pc.scalar(True)  # type: ignore
+
+    if isinstance(comparable, NeverType):
+        return pc.scalar(False)  # type: ignore
+
+    if isinstance(comparable, Any) and comparable and all(map(is_value, comparable)):
+        values = [to_scalar(value, type_) for value in comparable]
+        return field.isin(values)
+
+    if isinstance(comparable, (All, Any)) and len(comparable):
+        expressions = [translate(obj, field, type_) for obj in comparable]
+
+        if any(expression is None for expression in expressions):
+            return None
+
+        return combine(expressions, type(comparable))
+
+    if isinstance(comparable, Not):
+        if (expression := translate(comparable.comparable, field, type_)) is None:
+            return None
+
+        return ~expression | expression.is_null()
+
+    if isinstance(comparable, Range):
+        if comparable.bounds not in ("[]", "[)", "(]", "()"):
+            return None
+
+        terms: list[Any_] = []
+
+        if comparable.lower is not None:
+            lower = to_scalar(comparable.lower, type_)
+            terms.append(
+                field >= lower if comparable.is_lower_closed else field > lower
+            )
+
+        if comparable.upper is not None:
+            upper = to_scalar(comparable.upper, type_)
+            terms.append(
+                field <= upper if comparable.is_upper_closed else field < upper
+            )
+
+        return combine(terms, All) if terms else pc.scalar(True)  # type: ignore
+
+    if isinstance(comparable, Match):
+        if not supports_regex(comparable.pat, comparable.flags):
+            return None
+
+        result = pc.match_substring_regex(  # type: ignore
+            field,
+            pattern=anchor(comparable.pat),
+            ignore_case=not comparable.case or bool(comparable.flags & IGNORECASE),
+        )
+
+        if comparable.na:
+            return result | field.is_null()  # type: ignore
+
+        return result  # type: ignore
+
+    if is_value(comparable):
+        return field == to_scalar(comparable, type_)
+
+    return None
+
+
+def to_scalar(value: Any_, type_: Any_, /) -> Any_:
+    """Convert a value to be compared with a field of given Arrow type."""
+    if isinstance(value, str) and type_ is not None and pa.types.is_temporal(type_):  # type: ignore
+        return pa.scalar(value).cast(type_)  # type: ignore
+
+    return value
@@ -0,0 +1,148 @@
+__all__ = ["Incremental", "is_elementwise"]
+
+
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ..comparison.builtins import Where
+from ..comparison.comparables import All, Any, Not
+
+# type hints
+Path = tuple[int, ...]
+
+
+class Incremental:
+    """Incremental evaluator of a comparable for append-only arrays.
+
+    It keeps the mask of the prefix of the array already evaluated
+    and evaluates ``array == comparable`` only on the newly appended tail
+    (along the first axis) when it is called with the grown array.
+    All the built-ins and user comparables are assumed to be elementwise
+    except those that opt out by ``__elementwise__ = False``
+    (or ``Where`` of such a function), which are re-evaluated
+    on the whole array every time while the masks of the elementwise
+    subtrees next to them (e.g. other members of ``All``) are still kept
+    per node and extended by the tail only.
+    The prefix of the array is assumed not to be modified,
+    and the state is reset if the array shrinks.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Range
+            from ndtools.engines.incremental import Incremental
+
+            evaluator = Incremental(Range(1, 4))
+            evaluator(np.array([3, 1, 4]))  # -> array([True, True, False])
+            evaluator(np.array([3, 1, 4, 1, 5]))  # evaluates only [1, 5]
+            # -> array([True, True, False, True, False])
+
+    """
+
+    def __init__(self, comparable: Any_, /) -> None:
+        self.comparable = comparable
+        """Comparable (or scalar) to be evaluated."""
+
+        self.size = 0
+        """Length of the prefix already evaluated."""
+
+        self.buffers: dict[Path, Any_] = {}
+        """Growable mask buffers of the elementwise nodes keyed by their paths."""
+
+    def __call__(self, array: Any_, /) -> Any_:
+        """Evaluate ``array == comparable`` only on the newly appended tail.
+
+        Args:
+            array: Append-only array whose first ``size`` elements
+                (along the first axis) have already been evaluated.
+
+        Returns:
+            Read-only boolean NumPy array of the same shape as the array.
+
+        """
+        if (array := np.asarray(array)).ndim == 0:
+            return np.asarray(array == self.comparable)
+
+        if len(array) < self.size:
+            self.reset()
+
+        mask = self.visit(self.comparable, array, ())
+        self.size = len(array)
+
+        mask = mask.view()
+        mask.flags.writeable = False
+        return mask
+
+    def reset(self) -> None:
+        """Discard the masks of the prefix already evaluated."""
+        self.size = 0
+        self.buffers.clear()
+
+    def visit(self, comparable: Any_, array: Any_, path: Path, /) -> Any_:
+        """Return the full mask of a node of the comparable."""
+        if is_elementwise(comparable):
+            return self.extend(comparable, array, path)
+
+        if isinstance(comparable, All) and len(comparable):
+            masks = (
+                self.visit(obj, array, (*path, i)) for i, obj in enumerate(comparable)
+            )
+            return np.logical_and.reduce(list(masks))
+
+        if isinstance(comparable, Any) and len(comparable):
+            masks = (
+                self.visit(obj, array, (*path, i)) for i, obj in enumerate(comparable)
+            )
+            return np.logical_or.reduce(list(masks))
+
+        if isinstance(comparable, Not):
+            return ~self.visit(comparable.comparable, array, (*path, 0))
+
+        return np.asarray(array == comparable, bool)
+
+    def extend(self, comparable: Any_, array: Any_, path: Path, /) -> Any_:
+        """Extend the mask of an elementwise node by the tail of the array."""
+        shape = array.shape[1:]
+
+        if (buffer := self.buffers.get(path)) is None or buffer.shape[1:] != shape:
+            buffer = self.buffers[path] = np.empty((0, *shape), bool)
+            start = 0
+        else:
+            start = self.size
+
+        if len(array) > len(buffer):
+            capacity = max(len(array), 2 * len(buffer))
+            grown = np.empty((capacity, *shape), bool)
+            grown[:start] = buffer[:start]
+            buffer = self.buffers[path] = grown
+
+        buffer[start : len(array)] = array[start:] == comparable
+        return buffer[: len(array)]
+
+
+def is_elementwise(comparable: Any_, /) -> bool:
+    """Check if a comparable (and all its members) is evaluated elementwise.
+
+    A comparable opts out by having the attribute ``__elementwise__ = False``.
+    ``Where`` is elementwise unless its function opts out in the same way.
+
+    """
+    if not getattr(comparable, "__elementwise__", True):
+        return False
+
+    if isinstance(comparable, (All, Any)):
+        return all(map(is_elementwise, comparable))
+
+    if isinstance(comparable, Not):
+        return is_elementwise(comparable.comparable)
+
+    if isinstance(comparable, Where):
+        return getattr(comparable.func, "__elementwise__", True)
+
+    return True
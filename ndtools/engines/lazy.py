@@ -0,0 +1,285 @@
+__all__ = ["Lazy", "Mask"]
+
+
+# standard library
+import operator
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from .incremental import is_elementwise
+
+# constants
+CHUNKSIZE = 1_000_000
+SYMBOLS = {
+    operator.eq: "==",
+    operator.ge: ">=",
+    operator.gt: ">",
+    operator.le: "<=",
+    operator.lt: "<",
+    operator.ne: "!=",
+}
+
+
+class Lazy:
+    """Array wrapper whose comparisons return lazy masks.
+
+    It is the opt-in mode of lazy evaluation: comparing a wrapped
+    array with a comparable (or scalar), e.g. ``Lazy(array) == comparable``,
+    does not evaluate anything but returns a ``Mask`` that records it.
+    The wrapped array must be on the left-hand side of the comparison.
+
+    Args:
+        array: Array to be compared (NumPy array or array-like).
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Match, Range
+            from ndtools.engines.lazy import Lazy
+
+            a, b, c = np.arange(5), np.arange(5) * 2, np.array(list("abcab"))
+            mask = (Lazy(a) == Range(1, 4)) & (Lazy(b) != 4) | ~(Lazy(c) == Match("[ab]"))
+            np.asarray(mask)  # -> array([False, True, True, True, False])
+
+    """
+
+    def __init__(self, array: Any_, /) -> None:
+        self.array = array
+        """Array to be compared."""
+
+    def __eq__(self, comparable: Any_) -> "Mask":  # type: ignore
+        return Mask.compare(self.array, comparable, operator.eq)
+
+    def __ge__(self, comparable: Any_) -> "Mask":
+        return Mask.compare(self.array, comparable, operator.ge)
+
+    def __gt__(self, comparable: Any_) -> "Mask":
+        return Mask.compare(self.array, comparable, operator.gt)
+
+    def __le__(self, comparable: Any_) -> "Mask":
+        return Mask.compare(self.array, comparable, operator.le)
+
+    def __lt__(self, comparable: Any_) -> "Mask":
+        return Mask.compare(self.array, comparable, operator.lt)
+
+    def __ne__(self, comparable: Any_) -> "Mask":  # type: ignore
+        return Mask.compare(self.array, comparable, operator.ne)
+
+    def __repr__(self) -> str:
+        return f"Lazy({self.array!r})"
+
+    __hash__ = None  # type: ignore
+
+
+class Mask:
+    """Lazy boolean mask expression over one or more arrays.
+
+    It records the comparisons of arrays with comparables as leaves
+    and ``&``, ``|``, ``^``, and ``~`` as nodes without allocating
+    any temporary mask. It is materialized once when converted
+    by ``numpy.asarray``, used for indexing (e.g. ``data[mask]``),
+    or reduced by ``any``, ``all``, or ``count``: the (flattened)
+    arrays are evaluated chunk by chunk, the whole expression is fused
+    into each output chunk by in-place logical operations, and the chunks
+    can be evaluated in parallel by threads. Members of ``&`` after
+    an all-False chunk (or of ``|`` after an all-True chunk) are skipped.
+    All arrays must have the same shape, and expressions containing
+    comparables that opt out of elementwise evaluation
+    (see ``ndtools.engines.incremental``) are evaluated as one chunk.
+
+    Args:
+        op: Name of the operation (``compare``, ``and``, ``or``, ``xor``, or ``not``).
+        args: Operands of the operation (array, comparable, and comparison
+            function for ``compare``, otherwise masks).
+        shape: Shape of the mask.
+
+    """
+
+    def __init__(
+        self,
+        op: str,
+        args: tuple[Any_, ...],
+        shape: tuple[int, ...],
+        /,
+    ) -> None:
+        self.op = op
+        """Name of the operation."""
+
+        self.args = args
+        """Operands of the operation."""
+
+        self.shape = shape
+        """Shape of the mask."""
+
+    @classmethod
+    def compare(
+        cls, array: Any_, comparable: Any_, func: Callable[..., Any_]
+    ) -> "Mask":
+        """Create a leaf mask of a comparison of an array with a comparable."""
+        return cls("compare", (array, comparable, func), np.shape(array))
+
+    @property
+    def size(self) -> int:
+        """Number of the elements of the mask."""
+        return int(np.prod(self.shape))
+
+    def all(self, *, chunksize: int = CHUNKSIZE) -> bool:
+        """Return whether all elements are True (stopping at the first False chunk)."""
+        return all(bool(chunk.all()) for chunk in self.chunks(chunksize))
+
+    def any(self, *, chunksize: int = CHUNKSIZE) -> bool:
+        """Return whether any element is True (stopping at the first True chunk)."""
+        return any(bool(chunk.any()) for chunk in self.chunks(chunksize))
+
+    def chunks(self, chunksize: int = CHUNKSIZE, /) -> Iterator[Any_]:
+        """Yield the fused masks of the (flattened) chunks one by one."""
+        if chunksize <= 0:
+            raise ValueError("Chunk size must be positive.")
+
+        if not self.is_elementwise():
+            chunksize = max(self.size, 1)
+
+        flats = self.flatten()
+
+        for start in range(0, self.size, chunksize):
+            yield self.fuse(flats, slice(start, start + chunksize))
+
+    def combine(self, op: str, other: Any_, /) -> "Mask":
+        """Combine with another mask (flattening nested nodes of the same operation)."""
+        if not isinstance(other, Mask):
+            return NotImplemented
+
+        if self.shape != other.shape:
+            raise ValueError(f"Shapes {self.shape} and {other.shape} do not match.")
+
+        left = self.args if self.op == op else (self,)
+        right = other.args if other.op == op else (other,)
+        return Mask(op, (*left, *right), self.shape)
+
+    def count(self, *, chunksize: int = CHUNKSIZE) -> int:
+        """Return the number of True elements."""
+        return sum(int(np.count_nonzero(chunk)) for chunk in self.chunks(chunksize))
+
+    def evaluate(
+        self, *, chunksize: int = CHUNKSIZE, workers: int | None = None
+    ) -> Any_:
+        """Materialize the mask by fused chunked evaluation.
+
+        Args:
+            chunksize: Number of the elements in each chunk.
+            workers: Number of the threads evaluating the chunks in parallel.
+                If not specified, the chunks are evaluated in the caller.
+
+        Returns:
+            Boolean NumPy array of the shape of the mask.
+
+        Raises:
+            ValueError: Raised if the chunk size is not positive.
+
+        """
+        if chunksize <= 0:
+            raise ValueError("Chunk size must be positive.")
+
+        if not self.is_elementwise():
+            chunksize = max(self.size, 1)
+
+        flats = self.flatten()
+        out = np.empty(self.size, bool)
+        slices = [
+            slice(start, start + chunksize) for start in range(0, self.size, chunksize)
+        ]
+
+        def fill(index: slice, /) -> None:
+            out[index] = self.fuse(flats, index)
+
+        if workers is None or workers <= 1 or len(slices) <= 1:
+            for index in slices:
+                fill(index)
+        else:
+            with ThreadPoolExecutor(workers) as executor:
+                list(executor.map(fill, slices))
+
+        return out.reshape(self.shape)
+
+    def flatten(self) -> dict[int, Any_]:
+        """Return the flattened arrays of the leaves keyed by their IDs."""
+        if self.op == "compare":
+            return {id(self): np.asarray(self.args[0]).reshape(-1)}
+
+        flats: dict[int, Any_] = {}
+
+        for mask in self.args:
+            flats.update(mask.flatten())
+
+        return flats
+
+    def fuse(self, flats: dict[int, Any_], index: slice, /) -> Any_:
+        """Evaluate the whole expression on a chunk into a new boolean array."""
+        if self.op == "compare":
+            _, comparable, func = self.args
+            return np.array(func(flats[id(self)][index], comparable), bool)
+
+        if self.op == "not":
+            out = self.args[0].fuse(flats, index)
+            return np.logical_not(out, out=out)
+
+        out = self.args[0].fuse(flats, index)
+
+        for mask in self.args[1:]:
+            if self.op == "and":
+                if not out.any():
+                    break
+
+                np.logical_and(out, mask.fuse(flats, index), out=out)
+            elif self.op == "or":
+                if out.all():
+                    break
+
+                np.logical_or(out, mask.fuse(flats, index), out=out)
+            else:
+                np.logical_xor(out, mask.fuse(flats, index), out=out)
+
+        return out
+
+    def is_elementwise(self) -> bool:
+        """Check if all comparables of the leaves are elementwise."""
+        if self.op == "compare":
+            return is_elementwise(self.args[1])
+
+        return all(mask.is_elementwise() for mask in self.args)
+
+    def __and__(self, other: Any_) -> "Mask":
+        return self.combine("and", other)
+
+    def __array__(self, dtype: Any_ = None, copy: Any_ = None) -> Any_:
+        mask = self.evaluate()
+        return mask if dtype is None else mask.astype(dtype)
+
+    def __bool__(self) -> bool:
+        return bool(self.__array__())
+
+    def __invert__(self) -> "Mask":
+        return Mask("not", (self,), self.shape)
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError("len() of unsized mask.")
+
+        return self.shape[0]
+
+    def __or__(self, other: Any_) -> "Mask":
+        return self.combine("or", other)
+
+    def __repr__(self) -> str:
+        if self.op == "compare":
+            _, comparable, func = self.args
+            return f"Mask(array {SYMBOLS[func]} {comparable!r}, shape={self.shape})"
+
+        return f"Mask({self.op}, {list(self.args)!r}, shape={self.shape})"
+
+    def __xor__(self, other: Any_) -> "Mask":
+        return self.combine("xor", other)
@@ -0,0 +1,173 @@
+__all__ = ["compile_kernel", "evaluate"]
+
+
+# standard library
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ..comparison.builtins import AnyType, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+from .utils import is_lowerable, is_number, overflow, to_scalar
+
+try:
+    import numba as nb  # type: ignore
+except ImportError:
+    nb = None
+
+
+# constants
+CACHESIZE = 256
+KERNEL = """
+def kernel(array, out, {operands}):
+    for i in prange(array.size):
+        x = array[i]
+        out[i] = {expression}
+"""
+
+
+def evaluate(comparable: Any_, array: Any_, /, *, parallel: bool = False) -> Any_:
+    """Evaluate ``array == comparable`` by a Numba-compiled loop.
+
+    The whole tree of ``All``, ``Any``, ``Not``, ``Range``, scalar equality,
+    ``ANY``, and ``NEVER`` is compiled into one loop that reads each element
+    once without temporaries and short-circuits ``All`` and ``Any``
+    per element. The compiled kernel is cached by the tree structure
+    (not by the values of the leaves) in a bounded cache and Numba caches
+    its machine code by the data type of the array. Integer bounds out of
+    the range of the data type are decided before the kernel is compiled.
+    Other leaves (e.g. ``Match``, ``Where``, and user comparables)
+    are evaluated on the whole array by NumPy beforehand
+    and read by the kernel as boolean arrays.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array.
+        parallel: If True, the loop will be run in parallel by ``numba.prange``.
+
+    Returns:
+        Boolean NumPy array of the same shape as the array.
+
+    Raises:
+        ModuleNotFoundError: Raised if Numba is not installed.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Not, Range
+            from ndtools.engines.numba import evaluate
+
+            evaluate(Range(0, 10) & Not(Range(3, 4)), np.arange(5))
+            # -> array([True, True, True, False, True])
+
+    """
+    if nb is None:
+        raise ModuleNotFoundError("Numba is required for this engine.")
+
+    if (array := np.asarray(array)).dtype.kind not in "biuf":
+        return np.asarray(array == comparable)
+
+    expression, operands = to_source(comparable, array)
+    kernel = compile_kernel(expression, tuple(operands), parallel)
+
+    out = np.empty(array.size, bool)
+    kernel(array.ravel(), out, *operands.values())
+    return out.reshape(array.shape)  # type: ignore
+
+
+@lru_cache(maxsize=CACHESIZE)
+def compile_kernel(
+    expression: str,
+    names: tuple[str, ...],
+    parallel: bool = False,
+    /,
+) -> Callable[..., None]:
+    """Compile a per-element expression into a Numba loop kernel.
+
+    Args:
+        expression: Boolean expression of the element ``x``.
+        names: Names of the operands used in the expression.
+        parallel: If True, the loop will be run in parallel.
+
+    Returns:
+        Kernel that takes ``kernel(array, out, *operands)``
+        and writes the evaluated booleans of the flattened array to ``out``.
+
+    """
+    namespace: dict[str, Any_] = {"prange": nb.prange}  # type: ignore
+    source = KERNEL.format(operands=", ".join(names), expression=expression)
+    exec(source, namespace)
+    return nb.njit(parallel=parallel)(namespace["kernel"])  # type: ignore
+
+
+def to_source(comparable: Any_, array: Any_, /) -> tuple[str, dict[str, Any_]]:
+    """Lower a comparable into a per-element expression for a Numba kernel.
+
+    Args:
+        comparable: Comparable (or scalar) to be lowered.
+        array: Array to be compared. The element is named ``x``.
+
+    Returns:
+        Tuple of the expression string and the dictionary of operands
+        (scalar values named ``v<n>`` and flattened boolean arrays
+        of the leaves evaluated by NumPy named ``m<n>``).
+
+    """
+    operands: dict[str, Any_] = {}
+
+    def operand(value: Any_, prefix: str, /) -> str:
+        operands[name := f"{prefix}{len(operands)}"] = value
+        return name
+
+    def scalar(value: Any_, /) -> str:
+        return operand(to_scalar(value, array.dtype), "v")
+
+    def visit(obj: Any_, /) -> str:
+        if isinstance(obj, AnyType):
+            return "True"
+
+        if isinstance(obj, NeverType):
+            return "False"
+
+        if isinstance(obj, All) and len(obj):
+            return f"({' and '.join(map(visit, obj))})"
+
+        if isinstance(obj, Any) and len(obj):
+            return f"({' or '.join(map(visit, obj))})"
+
+        if isinstance(obj, Not):
+            return f"(not {visit(obj.comparable)})"
+
+        if isinstance(obj, Range) and is_lowerable(obj):
+            terms: list[str] = []
+
+            if obj.lower is not None:
+                if (sign := overflow(obj.lower, array.dtype)) > 0:
+                    return "False"
+
+                if sign == 0:
+                    op = ">=" if obj.is_lower_closed else ">"
+                    terms.append(f"(x {op} {scalar(obj.lower)})")
+
+            if obj.upper is not None:
+                if (sign := overflow(obj.upper, array.dtype)) < 0:
+                    return "False"
+
+                if sign == 0:
+                    op = "<=" if obj.is_upper_closed else "<"
+                    terms.append(f"(x {op} {scalar(obj.upper)})")
+
+            return f"({' and '.join(terms)})" if terms else "True"
+
+        if is_number(obj):
+            if overflow(obj, array.dtype):
+                return "False"
+
+            return f"(x == {scalar(obj)})"
+
+        return f"{operand(np.asarray(array == obj).ravel(), 'm')}[i]"
+
+    return visit(comparable), operands
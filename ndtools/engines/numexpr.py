@@ -0,0 +1,140 @@
+__all__ = ["evaluate", "to_expression"]
+
+
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ..comparison.builtins import AnyType, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+from .utils import is_lowerable, is_number, overflow, to_scalar
+
+try:
+    import numexpr as ne  # type: ignore
+except ImportError:
+    ne = None
+
+
+# constants
+ARRAY = "array"
+
+
+def evaluate(comparable: Any_, array: Any_, /) -> Any_:
+    """Evaluate ``array == comparable`` by numexpr in a single pass.
+
+    Trees of numeric built-ins (``Range``, scalar equality, ``Not``,
+    ``All``, ``Any``, ``ANY``, and ``NEVER``) are lowered into one numexpr
+    expression so that they are evaluated in a blocked, multi-threaded
+    pass without full-size temporaries. Other leaves (e.g. ``Match``,
+    ``Where``, and user comparables) are evaluated by NumPy beforehand
+    and passed to the expression as boolean operands.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array.
+
+    Returns:
+        Boolean NumPy array of the same shape as the array.
+
+    Raises:
+        ModuleNotFoundError: Raised if numexpr is not installed.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import All, Not, Range
+            from ndtools.engines.numexpr import evaluate
+
+            expr = All([Range(0, 10), Not(Range(3, 4)), Range(None, 8, "(]")])
+            evaluate(expr, np.arange(10))
+            # -> array([True, True, True, False, True, ..., True, False])
+
+    """
+    if ne is None:
+        raise ModuleNotFoundError("numexpr is required for this engine.")
+
+    if not is_supported(array := np.asarray(array)):
+        return np.asarray(array == comparable)
+
+    expression, operands = to_expression(comparable, array)
+    return ne.evaluate(expression, local_dict=operands)  # type: ignore
+
+
+def to_expression(comparable: Any_, array: Any_, /) -> tuple[str, dict[str, Any_]]:
+    """Lower a comparable into a numexpr expression and its operands.
+
+    Args:
+        comparable: Comparable (or scalar) to be lowered.
+        array: Array to be compared. It will be named ``array``
+            in the expression and included in the operands.
+
+    Returns:
+        Tuple of the expression string and the dictionary of operands.
+        Scalar values are named ``v<n>`` and boolean arrays
+        of the leaves evaluated by NumPy are named ``m<n>``.
+
+    """
+    operands: dict[str, Any_] = {ARRAY: array}
+
+    def operand(value: Any_, prefix: str, /) -> str:
+        operands[name := f"{prefix}{len(operands) - 1}"] = value
+        return name
+
+    def scalar(value: Any_, /) -> str:
+        return operand(to_scalar(value, array.dtype), "v")
+
+    def visit(obj: Any_, /) -> str:
+        if isinstance(obj, AnyType):
+            return f"(({ARRAY} == {ARRAY}) | True)"
+
+        if isinstance(obj, NeverType):
+            return f"(({ARRAY} != {ARRAY}) & False)"
+
+        if isinstance(obj, All) and len(obj):
+            return f"({' & '.join(map(visit, obj))})"
+
+        if isinstance(obj, Any) and len(obj):
+            return f"({' | '.join(map(visit, obj))})"
+
+        if isinstance(obj, Not):
+            return f"(~{visit(obj.comparable)})"
+
+        if isinstance(obj, Range) and is_lowerable(obj):
+            terms: list[str] = []
+
+            if obj.lower is not None:
+                if (sign := overflow(obj.lower, array.dtype)) > 0:
+                    return visit(NeverType())
+
+                if sign == 0:
+                    op = ">=" if obj.is_lower_closed else ">"
+                    terms.append(f"({ARRAY} {op} {scalar(obj.lower)})")
+
+            if obj.upper is not None:
+                if (sign := overflow(obj.upper, array.dtype)) < 0:
+                    return visit(NeverType())
+
+                if sign == 0:
+                    op = "<=" if obj.is_upper_closed else "<"
+                    terms.append(f"({ARRAY} {op} {scalar(obj.upper)})")
+
+            return f"({' & '.join(terms)})" if terms else visit(AnyType())
+
+        if is_number(obj):
+            if overflow(obj, array.dtype):
+                return visit(NeverType())
+
+            return f"({ARRAY} == {scalar(obj)})"
+
+        return operand(np.asarray(array == obj), "m")
+
+    return visit(comparable), operands
+
+
+def is_supported(array: Any_, /) -> bool:
+    """Check if the data type of given array is supported by numexpr."""
+    return array.dtype.kind in "bif" or (
+        array.dtype.kind == "u" and array.dtype.itemsize < 8
+    )
@@ -0,0 +1,502 @@
+__all__ = ["VERSION", "Plan"]
+
+
+# standard library
+import json
+import pickle
+import re
+from base64 import b64decode, b64encode
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+from functools import reduce
+from hashlib import sha256
+from importlib import import_module
+from operator import and_, or_  # type: ignore
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from typing_extensions import Self
+from ..comparison.builtins import AnyType, Match, NeverType, Range, RangeSet, Where
+from ..comparison.comparables import All, Any, Not
+from ..comparison.fields import Field
+
+# constants
+VERSION = 1
+
+
+class Plan:
+    """Serializable and precompiled evaluation plan of a comparable.
+
+    A plan stores the normalized tree of a comparable as versioned JSON,
+    where the built-ins are stored by their fields and values with tags
+    (e.g. bytes, NaN, datetime64) instead of pickle, ``Where`` functions
+    are stored by their import names, and the bounds of ``Range`` can be
+    pre-cast to the data types of the arrays to be evaluated.
+    Loading a plan rebuilds the comparables with the pre-cast bounds
+    and compiled regular expressions, and binds the evaluation of each node
+    to its method once so that no operator resolution happens per call.
+    User comparables and functions that cannot be imported by name
+    are pickled only if ``allow_pickle`` is True. As importing a name
+    runs arbitrary code, ``Where`` functions are imported only if
+    they are given in ``functions`` or ``allow_pickle`` is True.
+
+    Args:
+        tree: Normalized tree of the comparable (JSON-compatible).
+        allow_pickle: If True, pickled nodes and values
+            and imports of any function are allowed.
+        functions: Functions (or their import names, ``module:qualname``)
+            of ``Where`` that are allowed to be imported.
+
+    Raises:
+        ValueError: Raised if the tree has pickled nodes or values
+            (or functions not allowed to be imported) and ``allow_pickle`` is False.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Not, Range
+            from ndtools.engines.plans import Plan
+
+            plan = Plan.from_comparable(Range(0, 10) & Not(1))
+            data = plan.dumps()  # -> b'{"tree":{...},"version":1}'
+
+            # in a worker (add functions=[...] to load Where functions)
+            plan = Plan.loads(data)
+            plan(np.arange(3))  # -> array([True, False, True])
+            plan.fingerprint  # -> SHA-256 hex digest of the plan
+
+    """
+
+    def __init__(
+        self,
+        tree: Any_,
+        /,
+        *,
+        allow_pickle: bool = False,
+        functions: Iterable[Callable[..., Any_] | str] = (),
+    ) -> None:
+        self.tree = tree
+        """Normalized tree of the comparable (JSON-compatible)."""
+
+        self.allow_pickle = allow_pickle
+        """Whether pickled nodes and values are allowed."""
+
+        self.functions = frozenset(map(to_import_name, functions))
+        """Import names of the functions allowed to be imported."""
+
+        self.comparable, self.evaluate = load(tree, allow_pickle, self.functions)
+        """Rebuilt comparable and its precompiled evaluation function."""
+
+    def __call__(self, array: Any_, /) -> Any_:
+        """Evaluate ``array == comparable`` by the precompiled plan."""
+        return self.evaluate(array)
+
+    @classmethod
+    def from_comparable(
+        cls,
+        comparable: Any_,
+        /,
+        *,
+        dtypes: Any_ = (),
+        allow_pickle: bool = False,
+    ) -> Self:
+        """Create a plan from a comparable (or scalar).
+
+        Args:
+            comparable: Comparable (or scalar) to be planned.
+            dtypes: Data types of the arrays to be evaluated.
+                The bounds of ``Range`` are pre-cast to them (see ``Range.normalize``).
+            allow_pickle: If True, user comparables and functions
+                that cannot be imported by name are pickled.
+
+        Returns:
+            Plan of the comparable.
+
+        Raises:
+            TypeError: Raised if the comparable cannot be planned without pickle.
+
+        """
+        dtypes = [np.dtype(dtype) for dtype in dtypes]
+        tree = dump(comparable, dtypes, allow_pickle)
+        functions = function_names(tree)
+        return cls(tree, allow_pickle=allow_pickle, functions=functions)
+
+    @classmethod
+    def loads(
+        cls,
+        data: bytes | str,
+        /,
+        *,
+        allow_pickle: bool = False,
+        functions: Iterable[Callable[..., Any_] | str] = (),
+    ) -> Self:
+        """Load a plan from its serialized form (see ``dumps``).
+
+        Raises:
+            ValueError: Raised if the version of the plan is not supported.
+
+        """
+        plan = json.loads(data)
+
+        if plan.get("version") != VERSION:
+            raise ValueError(f"Plan version must be {VERSION}.")
+
+        return cls(plan["tree"], allow_pickle=allow_pickle, functions=functions)
+
+    def dumps(self) -> bytes:
+        """Serialize the plan into canonical JSON bytes."""
+        plan = {"tree": self.tree, "version": VERSION}
+        return json.dumps(plan, separators=(",", ":"), sort_keys=True).encode()
+
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 hex digest of the serialized plan for caching."""
+        return sha256(self.dumps()).hexdigest()
+
+
+def dump(comparable: Any_, dtypes: list[Any_], allow_pickle: bool, /) -> Any_:
+    """Convert a comparable into a normalized tree (see ``Plan``)."""
+
+    def value(obj: Any_, /) -> Any_:
+        return dump_value(obj, allow_pickle)
+
+    if isinstance(comparable, AnyType):
+        return {"type": "ANY"}
+
+    if isinstance(comparable, NeverType):
+        return {"type": "NEVER"}
+
+    if isinstance(comparable, All):
+        members = [dump(obj, dtypes, allow_pickle) for obj in comparable]
+        return {"type": "All", "members": members}
+
+    if isinstance(comparable, Any):
+        members = [dump(obj, dtypes, allow_pickle) for obj in comparable]
+        return {"type": "Any", "members": members}
+
+    if isinstance(comparable, Not):
+        return {
+            "type": "Not",
+            "comparable": dump(comparable.comparable, dtypes, allow_pickle),
+        }
+
+    if isinstance(comparable, Match):
+        return {
+            "type": "Match",
+            "pat": comparable.pat,
+            "case": comparable.case,
+            "flags": comparable.flags,
+            "na": value(comparable.na),
+        }
+
+    if isinstance(comparable, Range):
+        normalized: dict[str, Any_] = {}
+
+        for dtype in dtypes:
+            if (window := comparable.normalize(dtype)) is not comparable:
+                normalized[dtype.str] = [
+                    value(window.lower),
+                    value(window.upper),
+                    window.bounds,
+                ]
+
+        return {
+            "type": "Range",
+            "lower": value(comparable.lower),
+            "upper": value(comparable.upper),
+            "bounds": comparable.bounds,
+            "normalized": normalized,
+        }
+
+    if isinstance(comparable, RangeSet):
+        ranges = [dump(obj, dtypes, allow_pickle) for obj in comparable.ranges]
+        return {"type": "RangeSet", "ranges": ranges}
+
+    if isinstance(comparable, Field) and isinstance(comparable.name, str):
+        return {
+            "type": "Field",
+            "name": comparable.name,
+            "comparable": dump(comparable.comparable, dtypes, allow_pickle),
+        }
+
+    if isinstance(comparable, Where) and (name := import_name(comparable.func)):
+        return {
+            "type": "Where",
+            "func": name,
+            "args": [value(arg) for arg in comparable.args],
+            "kwargs": {key: value(val) for key, val in comparable.kwargs.items()},
+        }
+
+    if comparable is None or pd.api.types.is_scalar(comparable):
+        try:
+            return {"type": "value", "value": dump_value(comparable, False)}
+        except TypeError:
+            pass
+
+    if allow_pickle:
+        return {"type": "pickle", "data": b64encode(pickle.dumps(comparable)).decode()}
+
+    raise TypeError(f"Cannot plan {comparable!r} without pickle.")
+
+
+def dump_value(obj: Any_, allow_pickle: bool, /) -> Any_:
+    """Convert a value into a JSON-compatible value with a tag if needed."""
+    if obj is None or type(obj) in (bool, int, str):
+        return obj
+
+    if type(obj) is float:
+        return obj if np.isfinite(obj) else {"float": repr(obj)}
+
+    if isinstance(obj, bytes):
+        return {"bytes": b64encode(obj).decode()}
+
+    if isinstance(obj, np.datetime64):
+        unit = np.datetime_data(obj.dtype)[0]  # type: ignore
+        return {"datetime64": [int(obj.view(np.int64)), unit]}
+
+    if isinstance(obj, np.timedelta64):
+        unit = np.datetime_data(obj.dtype)[0]  # type: ignore
+        return {"timedelta64": [int(obj.view(np.int64)), unit]}
+
+    if isinstance(obj, np.generic):
+        return {"numpy": [obj.dtype.str, dump_value(obj.item(), allow_pickle)]}  # type: ignore
+
+    if isinstance(obj, pd.Timestamp):
+        return {"Timestamp": str(obj)}
+
+    if isinstance(obj, pd.Timedelta):
+        return {"Timedelta": obj.value}
+
+    if isinstance(obj, datetime):
+        return {"datetime": obj.isoformat()}
+
+    if isinstance(obj, date):
+        return {"date": obj.isoformat()}
+
+    if isinstance(obj, timedelta):
+        return {"timedelta": [obj.days, obj.seconds, obj.microseconds]}
+
+    if isinstance(obj, (list, tuple)):
+        values = [dump_value(val, allow_pickle) for val in obj]  # type: ignore
+        return {type(obj).__name__: values}  # type: ignore
+
+    if allow_pickle:
+        return {"pickle": b64encode(pickle.dumps(obj)).decode()}
+
+    raise TypeError(f"Cannot plan {obj!r} without pickle.")
+
+
+def function_names(tree: Any_, /) -> set[str]:
+    """Return the import names of all ``Where`` functions in a normalized tree."""
+    if not isinstance(tree, dict):
+        return set()
+
+    names: set[str] = set()
+
+    if tree.get("type") == "Where":  # type: ignore
+        names.add(tree["func"])  # type: ignore
+
+    for child in tree.values():  # type: ignore
+        for obj in child if isinstance(child, list) else [child]:  # type: ignore
+            names |= function_names(obj)
+
+    return names
+
+
+def import_name(func: Any_, /) -> str | None:
+    """Return the import name (``module:qualname``) of a function if available."""
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        return None
+
+    try:
+        if import_object(name := f"{module}:{qualname}") is func:
+            return name
+    except (AttributeError, ImportError):
+        pass
+
+    return None
+
+
+def import_object(name: str, /) -> Any_:
+    """Import an object by its import name (``module:qualname``)."""
+    module, qualname = name.split(":")
+    return reduce(getattr, qualname.split("."), import_module(module))
+
+
+def load(
+    tree: Any_,
+    allow_pickle: bool,
+    functions: frozenset[str],
+    /,
+) -> tuple[Any_, Callable[[Any_], Any_]]:
+    """Rebuild a comparable and its evaluation function from a normalized tree."""
+
+    def value(obj: Any_, /) -> Any_:
+        return load_value(obj, allow_pickle)
+
+    if (kind := tree["type"]) == "ANY":
+        return (comparable := AnyType()), comparable.__eq__
+
+    if kind == "NEVER":
+        return (comparable := NeverType()), comparable.__eq__
+
+    if kind in ("All", "Any"):
+        loaded = [load(obj, allow_pickle, functions) for obj in tree["members"]]
+        group = All if kind == "All" else Any
+        comparable = group(obj for obj, _ in loaded)
+
+        if not loaded:
+            return comparable, comparable.__eq__
+
+        # keep membership tests of scalars (e.g. by pyarrow.compute) to Any
+        if kind == "Any" and all(obj["type"] == "value" for obj in tree["members"]):
+            return comparable, comparable.__eq__
+
+        funcs = [func for _, func in loaded]
+        operator: Any_ = and_ if kind == "All" else or_  # type: ignore
+        return comparable, lambda array: reduce(operator, (f(array) for f in funcs))
+
+    if kind == "Not":
+        child, func = load(tree["comparable"], allow_pickle, functions)
+        comparable = Not(child)
+
+        if tree["comparable"]["type"] == "value":
+            return comparable, lambda array: array != child
+
+        return comparable, lambda array: ~func(array)
+
+    if kind == "Match":
+        re.compile(tree["pat"], tree["flags"])
+        comparable = Match(tree["pat"], tree["case"], tree["flags"], value(tree["na"]))
+        return comparable, comparable.__eq__
+
+    if kind == "Range":
+        comparable = Range(value(tree["lower"]), value(tree["upper"]), tree["bounds"])
+
+        windows = {
+            np.dtype(dtype): Range(value(lower), value(upper), *bounds or ["[]"])
+            for dtype, (lower, upper, *bounds) in tree["normalized"].items()
+        }
+
+        if not windows:
+            return comparable, comparable.__eq__
+
+        # use the pre-cast bounds for arrays of the data types in the plan
+        def evaluate_range(array: Any_, /) -> Any_:
+            if not isinstance(array, np.ndarray):
+                return comparable.__eq__(array)
+
+            if (window := windows.get(array.dtype)) is None:  # type: ignore
+                return comparable.__eq__(array)
+
+            if array.dtype.kind == "S":  # type: ignore
+                return window == array
+
+            return window == array.view(np.int64)
+
+        return comparable, evaluate_range
+
+    if kind == "RangeSet":
+        comparable = RangeSet(
+            load(obj, allow_pickle, functions)[0] for obj in tree["ranges"]
+        )
+        return comparable, comparable.__eq__
+
+    if kind == "Field":
+        comparable = Field(
+            tree["name"], load(tree["comparable"], allow_pickle, functions)[0]
+        )
+        return comparable, comparable.__eq__
+
+    if kind == "Where":
+        if not allow_pickle and tree["func"] not in functions:
+            raise ValueError(
+                f"Function {tree['func']!r} is imported only if it is given"
+                " in functions or allow_pickle is True."
+            )
+
+        func = import_object(tree["func"])
+        args = [value(arg) for arg in tree["args"]]
+        kwargs = {key: value(val) for key, val in tree["kwargs"].items()}
+        comparable = Where(func, *args, **kwargs)
+        return comparable, lambda array: func(array, *args, **kwargs)
+
+    if kind == "value":
+        comparable = value(tree["value"])
+        return comparable, lambda array: array == comparable
+
+    if kind == "pickle":
+        comparable = load_value({"pickle": tree["data"]}, allow_pickle)
+        return comparable, lambda array: array == comparable
+
+    raise ValueError(f"Unknown node type: {kind!r}.")
+
+
+def to_import_name(func: Callable[..., Any_] | str, /) -> str:
+    """Convert a function (or its import name) to its import name."""
+    if isinstance(func, str):
+        return func
+
+    if (name := import_name(func)) is None:
+        raise ValueError(f"Cannot import {func!r} by name.")
+
+    return name
+
+
+def load_value(obj: Any_, allow_pickle: bool, /) -> Any_:
+    """Convert a JSON-compatible value with a tag back into a value."""
+    if not isinstance(obj, dict):
+        return obj
+
+    items: list[tuple[str, Any_]] = list(obj.items())  # type: ignore
+    tag, data = items[0]
+
+    if tag == "float":
+        return float(data)
+
+    if tag == "bytes":
+        return b64decode(data)
+
+    if tag == "datetime64":
+        return np.int64(data[0]).view(f"M8[{data[1]}]")
+
+    if tag == "timedelta64":
+        return np.int64(data[0]).view(f"m8[{data[1]}]")
+
+    if tag == "numpy":
+        return np.dtype(data[0]).type(load_value(data[1], allow_pickle))
+
+    if tag == "Timestamp":
+        return pd.Timestamp(data)
+
+    if tag == "Timedelta":
+        return pd.Timedelta(data)
+
+    if tag == "datetime":
+        return datetime.fromisoformat(data)
+
+    if tag == "date":
+        return date.fromisoformat(data)
+
+    if tag == "timedelta":
+        return timedelta(*data)
+
+    if tag == "list":
+        return [load_value(val, allow_pickle) for val in data]
+
+    if tag == "tuple":
+        return tuple(load_value(val, allow_pickle) for val in data)
+
+    if tag == "pickle" and allow_pickle:
+        return pickle.loads(b64decode(data))
+
+    if tag == "pickle":
+        raise ValueError("Pickled plans are loaded only if allow_pickle is True.")
+
+    raise ValueError(f"Unknown value tag: {tag!r}.")
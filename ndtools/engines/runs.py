@@ -0,0 +1,251 @@
+__all__ = ["Runs", "runs"]
+
+
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ..comparison.builtins import AnyType, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+
+
+class Runs:
+    """Run-length-encoded boolean mask of a flat array.
+
+    It keeps the half-open runs ``[start, stop)`` of True elements
+    as sorted, disjoint, and non-adjacent start and stop indices,
+    and supports ``&``, ``|``, and ``~`` on the run lists.
+    It is converted to a dense mask by ``numpy.asarray``
+    and to slices by ``slices`` so that arrays can be selected
+    without materializing the dense mask (e.g. ``select``).
+
+    Runs given in any order are sorted, and overlapping
+    or adjacent runs are merged (empty runs are dropped).
+
+    Args:
+        starts: Start indices of the runs of True elements.
+        stops: Stop indices (exclusive) of the runs of True elements.
+        size: Number of the elements of the mask.
+
+    Raises:
+        ValueError: Raised if the numbers of the starts and the stops differ
+            or any run is out of ``[0, size]``.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools.engines.runs import Runs
+
+            runs = Runs.from_mask(np.array([0, 1, 1, 0, 1], bool))
+            runs.slices()  # -> [slice(1, 3), slice(4, 5)]
+            (~runs).slices()  # -> [slice(0, 1), slice(3, 4)]
+
+    """
+
+    def __init__(self, starts: Any_, stops: Any_, size: int, /) -> None:
+        starts = np.asarray(starts, np.intp).reshape(-1)
+        stops = np.asarray(stops, np.intp).reshape(-1)
+
+        if starts.shape != stops.shape:
+            raise ValueError("Numbers of the starts and the stops must be equal.")
+
+        nonempty = starts < stops
+        starts, stops = starts[nonempty], stops[nonempty]
+
+        if starts.size and (starts.min() < 0 or stops.max() > size):
+            raise ValueError(f"Runs must be within [0, {size}].")
+
+        if starts.size and not (starts[1:] > stops[:-1]).all():
+            starts, stops = merge(starts, stops)
+
+        self.starts: Any_ = starts
+        """Start indices of the runs of True elements."""
+
+        self.stops: Any_ = stops
+        """Stop indices (exclusive) of the runs of True elements."""
+
+        self.size = size
+        """Number of the elements of the mask."""
+
+    @classmethod
+    def from_mask(cls, mask: Any_, /) -> "Runs":
+        """Create runs from a boolean mask by detecting its boundaries."""
+        mask = np.asarray(mask, bool).reshape(-1)
+        edges = np.diff(mask.view(np.int8), prepend=0, append=0)
+        return cls(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1), mask.size)
+
+    def count(self) -> int:
+        """Return the number of True elements."""
+        return int(np.sum(self.stops - self.starts))
+
+    def select(self, array: Any_, /) -> Any_:
+        """Return the elements of a 1-D array in the runs without a dense mask."""
+        array = np.asarray(array)
+
+        if not self.starts.size:
+            return array[:0]
+
+        return np.concatenate([array[index] for index in self.slices()])
+
+    def slices(self) -> list[slice]:
+        """Return the runs as slices (e.g. for ``xarray.DataArray.isel``)."""
+        return [slice(int(i), int(j)) for i, j in zip(self.starts, self.stops)]
+
+    def __and__(self, other: "Runs") -> "Runs":
+        return ~(~self | ~other)
+
+    def __array__(self, dtype: Any_ = None, copy: Any_ = None) -> Any_:
+        edges = np.zeros(self.size + 1, np.int8)
+        edges[self.starts] = 1
+        edges[self.stops] = -1
+        mask = np.cumsum(edges[:-1], dtype=np.int8).view(bool)
+        return mask if dtype is None else mask.astype(dtype)
+
+    def __eq__(self, other: Any_) -> bool:
+        if not isinstance(other, Runs):
+            return NotImplemented
+
+        return (
+            self.size == other.size
+            and np.array_equal(self.starts, other.starts)
+            and np.array_equal(self.stops, other.stops)
+        )
+
+    def __invert__(self) -> "Runs":
+        starts = np.concatenate([[0], self.stops])
+        stops = np.concatenate([self.starts, [self.size]])
+        return Runs(starts, stops, self.size)
+
+    def __or__(self, other: "Runs") -> "Runs":
+        starts = np.concatenate([self.starts, other.starts])
+        stops = np.concatenate([self.stops, other.stops])
+        return Runs(starts, stops, self.size)
+
+    def __repr__(self) -> str:
+        return f"Runs({self.slices()}, size={self.size})"
+
+    __hash__ = None  # type: ignore
+
+
+def runs(comparable: Any_, array: Any_, /, *, sorted: bool | None = None) -> Runs:
+    """Evaluate ``array == comparable`` into run-length-encoded runs.
+
+    On a sorted (flat) array, ``Range`` and scalar equality are
+    evaluated as a single run by ``numpy.searchsorted`` without reading
+    the elements in between. Other leaves (and those on unsorted arrays)
+    are evaluated densely and encoded by detecting the boundaries.
+    ``All``, ``Any``, and ``Not`` operate on the run lists.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array
+            and flattened (so slices are for 1-D arrays).
+        sorted: Whether the flattened array is sorted in ascending order.
+            If not specified, it will be checked once.
+
+    Returns:
+        Runs of True elements of the flattened array.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Not, Range
+            from ndtools.engines.runs import runs
+
+            time = np.arange("2000-01-01", "2001-01-01", dtype="M8[h]")
+            expr = Range("2000-03-01", "2000-04-01") & Not(Range("2000-03-10", None))
+            runs(expr, time).slices()  # -> [slice(1440, 1656)]
+
+    """
+    flat = np.asarray(array).reshape(-1)
+
+    if sorted is None:
+        sorted = is_sorted(flat)
+
+    def visit(obj: Any_, /) -> Runs:
+        if isinstance(obj, AnyType):
+            return Runs([0], [flat.size], flat.size)
+
+        if isinstance(obj, NeverType):
+            return Runs([], [], flat.size)
+
+        if isinstance(obj, All) and len(obj):
+            result = visit(obj[0])
+
+            for member in obj[1:]:
+                if not result.starts.size:
+                    break
+
+                result = result & visit(member)
+
+            return result
+
+        if isinstance(obj, Any) and len(obj):
+            result = visit(obj[0])
+
+            for member in obj[1:]:
+                result = result | visit(member)
+
+            return result
+
+        if isinstance(obj, Not):
+            return ~visit(obj.comparable)
+
+        if sorted and (result := search(obj, flat)) is not None:
+            return result
+
+        return Runs.from_mask(flat == obj)
+
+    return visit(comparable)
+
+
+def is_sorted(flat: Any_, /) -> bool:
+    """Check if a flat array is sorted in ascending order (without missing values)."""
+    try:
+        return bool(np.all(flat[1:] >= flat[:-1]))
+    except TypeError:
+        return False
+
+
+def merge(starts: Any_, stops: Any_, /) -> tuple[Any_, Any_]:
+    """Sort nonempty runs and merge the overlapping or adjacent ones."""
+    order = np.argsort(starts, kind="stable")
+    starts, stops = starts[order], np.maximum.accumulate(stops[order])
+    is_new = np.concatenate([[True], starts[1:] > stops[:-1]])
+    is_last = np.concatenate([is_new[1:], [True]])
+    return starts[is_new], stops[is_last]
+
+
+def search(comparable: Any_, flat: Any_, /) -> Runs | None:
+    """Return the run of a range or scalar on a sorted array (or None)."""
+    if isinstance(comparable, Range):
+        if comparable.bounds not in ("[]", "[)", "(]", "()"):
+            return None
+
+        if flat.dtype.kind in "MmS":
+            if (normalized := comparable.normalize(flat.dtype)) is not comparable:
+                if flat.dtype.kind != "S":
+                    flat = flat.view(np.int64)
+
+                comparable = normalized
+
+        lower, upper = comparable.lower, comparable.upper
+        side_lower = "left" if comparable.is_lower_closed else "right"
+        side_upper = "right" if comparable.is_upper_closed else "left"
+    elif comparable is not None and pd.api.types.is_scalar(comparable):
+        lower = upper = comparable
+        side_lower, side_upper = "left", "right"
+    else:
+        return None
+
+    try:
+        start = 0 if lower is None else np.searchsorted(flat, lower, side_lower)  # type: ignore
+        stop = flat.size if upper is None else np.searchsorted(flat, upper, side_upper)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+    return Runs([start], [stop], flat.size)
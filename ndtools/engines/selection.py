@@ -0,0 +1,167 @@
+__all__ = ["select"]
+
+
+# standard library
+from collections.abc import Hashable, Mapping
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ..comparison.fields import evaluate, is_table
+from .incremental import is_elementwise
+
+# constants
+CHUNKSIZE = 1_000_000
+
+
+def select(
+    comparable: Any_,
+    array: Any_,
+    /,
+    *,
+    axis: Hashable | None = None,
+    chunksize: int = CHUNKSIZE,
+) -> Any_:
+    """Return the elements of an array equal to a comparable without a full mask.
+
+    It is equivalent to ``array[array == comparable]`` but evaluates
+    the (flattened) array chunk by chunk and compresses each chunk
+    straight into the output buffer so that neither a full-size mask
+    nor an intermediate copy is allocated. pandas objects are selected
+    chunk by chunk in the same way keeping their index, and tables
+    (e.g. DataFrame against trees of ``Field``) are selected by rows.
+    If an axis is given, the sub-arrays along the axis are selected
+    whose labels are equal to the comparable (the coordinate of
+    an xarray dimension, the index or columns of a pandas object,
+    or the positions for a NumPy array). Comparables that opt out of
+    elementwise evaluation (see ``ndtools.engines.incremental``)
+    are evaluated on the whole array as one chunk.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: NumPy array, pandas object, or xarray object to be selected.
+        axis: Axis (or dimension name) along which the labels are compared.
+            If not specified, the elements (or rows of a table) are compared.
+        chunksize: Number of the elements (or rows) in each chunk.
+
+    Returns:
+        Selected elements (or sub-arrays) in the same container type.
+        For NumPy arrays, a 1-D array if no axis is specified.
+        For multidimensional xarray objects, a 1-D array along the dimensions
+        stacked into one (e.g. ``x_y``) keeping their coordinates.
+
+    Raises:
+        ValueError: Raised if the chunk size is not positive.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Range
+
+            data = np.arange(10).reshape(2, 5)
+            Range(3, 6).select(data)  # -> array([3, 4, 5])
+            Range(1, 3).select(data, axis=1)  # -> array([[1, 2], [6, 7]])
+
+    """
+    if chunksize <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    if axis is not None:
+        return select_axis(comparable, array, axis)
+
+    if not is_elementwise(comparable):
+        chunksize = max(len(array) if is_table(array) else np.size(array), 1)
+
+    if isinstance(array, Mapping):
+        mask = evaluate(comparable, array)
+        return {name: np.asarray(array[name])[mask] for name in array}  # type: ignore
+
+    if isinstance(array, (pd.Series, pd.DataFrame)):
+        return select_pandas(comparable, array, chunksize)
+
+    if isinstance(array, pd.Index):
+        return array[to_mask(array == comparable)]  # type: ignore
+
+    if is_xarray(array):
+        if array.ndim == 0:
+            return select(comparable, array.values, chunksize=chunksize)
+
+        if array.ndim > 1:
+            array = array.stack({"_".join(map(str, array.dims)): array.dims})
+
+        mask = to_mask(array == comparable)
+        return array.isel({array.dims[0]: np.flatnonzero(mask)})
+
+    array = np.asarray(array)
+    flat = array if is_table(array) else array.reshape(-1)
+    out = np.empty(min(len(flat), chunksize), flat.dtype)
+    size = 0
+
+    for start in range(0, len(flat), chunksize):
+        chunk = flat[start : start + chunksize]
+        mask = compare(comparable, chunk)
+        count = int(np.count_nonzero(mask))
+
+        if size + count > len(out):
+            out.resize(max(size + count, 2 * len(out)), refcheck=False)
+
+        np.compress(mask, chunk, out=out[size : size + count])
+        size += count
+
+    out.resize(size, refcheck=False)
+    return out
+
+
+def compare(comparable: Any_, chunk: Any_, /) -> Any_:
+    """Return the boolean mask of a chunk (or rows of a table) equal to a comparable."""
+    if is_table(chunk):
+        return to_mask(evaluate(comparable, chunk))
+
+    return to_mask(chunk == comparable)
+
+
+def is_xarray(array: Any_, /) -> bool:
+    """Check if an object is an xarray object (by duck typing)."""
+    return hasattr(array, "dims") and hasattr(array, "isel")
+
+
+def select_axis(comparable: Any_, array: Any_, axis: Hashable, /) -> Any_:
+    """Select the sub-arrays along an axis whose labels are equal to a comparable."""
+    if is_xarray(array):
+        dim = axis if isinstance(axis, str) else array.dims[axis]  # type: ignore
+        labels = np.asarray(array[dim])
+        return array.isel({dim: np.flatnonzero(to_mask(labels == comparable))})
+
+    if isinstance(array, (pd.Series, pd.DataFrame)):
+        labels = np.asarray(array.index if axis in (0, "index") else array.columns)  # type: ignore
+        indices = np.flatnonzero(to_mask(labels == comparable))
+        return array.take(indices, axis=axis)  # type: ignore
+
+    array = np.asarray(array)
+    labels = np.arange(array.shape[axis])  # type: ignore
+    return np.compress(to_mask(labels == comparable), array, axis)  # type: ignore
+
+
+def select_pandas(comparable: Any_, array: Any_, chunksize: int, /) -> Any_:
+    """Select the elements of a Series (or rows of a DataFrame) chunk by chunk."""
+    parts = [
+        (chunk := array.iloc[start : start + chunksize])[compare(comparable, chunk)]
+        for start in range(0, len(array), chunksize)
+    ]
+    return pd.concat(parts) if parts else array.iloc[:0]
+
+
+def to_mask(result: Any_, /) -> Any_:
+    """Convert a result of a comparison to a boolean NumPy array (missing as False)."""
+    if isinstance(result, np.ndarray):
+        return result.astype(bool, copy=False)  # type: ignore
+
+    if isinstance(result, (pd.Series, pd.Index, pd.api.extensions.ExtensionArray)):
+        return np.asarray(pd.array(result).fillna(False), bool)  # type: ignore
+
+    if is_xarray(result):
+        return np.asarray(result.fillna(False), bool)  # type: ignore
+
+    return np.asarray(result, bool)
@@ -0,0 +1,149 @@
+__all__ = ["indices", "mask"]
+
+
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ..comparison.comparables import All, Any, Not
+from .incremental import is_elementwise
+
+# constants
+DENSITY = 0.01
+
+
+def indices(comparable: Any_, array: Any_, /, *, density: float = DENSITY) -> Any_:
+    """Return the sorted flat indices where ``array == comparable`` is True.
+
+    Each node of the comparable is represented either by a dense boolean mask
+    or by sparse sorted indices, switched by its measured density
+    (the fraction of True elements) against ``density``.
+    Once a member of ``All`` is sparse, the following members are
+    evaluated only on the selected elements and the results are
+    sorted intersections. ``Any`` is a sorted union of sparse members
+    (or OR of dense masks), and ``Not`` is a complement against all elements.
+    Comparables that opt out of elementwise evaluation
+    (see ``ndtools.engines.incremental``) are evaluated on all elements.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array.
+        density: Density below which the nodes are represented sparsely.
+
+    Returns:
+        Sorted int NumPy array of the flat indices of the (flattened) array.
+        Use ``numpy.unravel_index`` to convert them to N-D indices.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Range, Where
+            from ndtools.engines.sparse import indices
+
+            data = np.arange(10**6)
+            indices(Range(10, 13) & Where(lambda x: x % 2 == 0), data)
+            # -> array([10, 12]) (Where is evaluated only on 3 elements)
+
+    """
+    result = visit(comparable, np.asarray(array).reshape(-1), density)
+    return result if is_sparse(result) else np.flatnonzero(result)
+
+
+def mask(comparable: Any_, array: Any_, /, *, density: float = DENSITY) -> Any_:
+    """Return the boolean mask of ``array == comparable`` evaluated sparsely.
+
+    See ``indices`` for the evaluation.
+
+    Args:
+        comparable: Comparable (or scalar) to be evaluated.
+        array: Array to be compared. It will be converted to NumPy array.
+        density: Density below which the nodes are represented sparsely.
+
+    Returns:
+        Boolean NumPy array of the same shape as the array.
+
+    """
+    array = np.asarray(array)
+    result = visit(comparable, array.reshape(-1), density)
+    return to_dense(result, array.size).reshape(array.shape)
+
+
+def visit(comparable: Any_, flat: Any_, density: float, /) -> Any_:
+    """Return the dense mask or sparse indices of a node on a flat array."""
+    if isinstance(comparable, All) and len(comparable):
+        result = visit(comparable[0], flat, density)
+
+        for obj in comparable[1:]:
+            if is_sparse(result) and not result.size:
+                break
+
+            if is_sparse(result) and is_elementwise(obj):
+                result = result[visit(obj, flat[result], density)]
+                continue
+
+            other = visit(obj, flat, density)
+
+            if is_sparse(result):
+                result = np.intersect1d(result, to_sparse(other), assume_unique=True)
+            elif is_sparse(other):
+                result = other[result[other]]
+            else:
+                result = switch(result & other, density)
+
+        return result
+
+    if isinstance(comparable, Any) and len(comparable):
+        results = [visit(obj, flat, density) for obj in comparable]
+
+        if all(map(is_sparse, results)):
+            return switch(union(results), density, flat.size)
+
+        dense = [to_dense(result, flat.size) for result in results]
+        return switch(np.logical_or.reduce(dense), density)
+
+    if isinstance(comparable, Not):
+        result = visit(comparable.comparable, flat, density)
+        return switch(~to_dense(result, flat.size), density)
+
+    return switch(np.asarray(flat == comparable, bool), density)
+
+
+def is_sparse(result: Any_, /) -> bool:
+    """Check if a node result is sparse indices (not a dense mask)."""
+    return result.dtype != bool
+
+
+def switch(result: Any_, density: float, size: int | None = None, /) -> Any_:
+    """Switch a node result to the representation fitting its density."""
+    if is_sparse(result):
+        if size is not None and size and len(result) / size >= density:
+            return to_dense(result, size)
+
+        return result
+
+    if not result.size or np.count_nonzero(result) / result.size < density:
+        return np.flatnonzero(result)
+
+    return result
+
+
+def to_dense(result: Any_, size: int, /) -> Any_:
+    """Convert a node result to a dense mask."""
+    if not is_sparse(result):
+        return result
+
+    dense = np.zeros(size, bool)
+    dense[result] = True
+    return dense
+
+
+def to_sparse(result: Any_, /) -> Any_:
+    """Convert a node result to sparse indices."""
+    return result if is_sparse(result) else np.flatnonzero(result)
+
+
+def union(results: list[Any_], /) -> Any_:
+    """Return the sorted union of sparse indices."""
+    return np.unique(np.concatenate(results))
@@ -0,0 +1,225 @@
+__all__ = ["create_regexp", "split", "to_sql"]
+
+
+# standard library
+import re
+from collections.abc import Hashable
+from typing import Any as Any_, Literal
+
+# dependencies
+import numpy as np
+from ..comparison.builtins import ANY, AnyType, Match, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+from ..comparison.fields import Field
+from .datasets import flatten
+from .utils import is_value
+
+# type hints
+Dialect = Literal["duckdb", "sqlite"]
+Params = list[Any_]
+
+# constants
+FALSE = "(1 = 0)"
+TRUE = "(1 = 1)"
+
+
+def create_regexp(connection: Any_, /) -> None:
+    """Create the ``REGEXP`` function in a sqlite3 connection.
+
+    SQLite has the ``REGEXP`` operator but no implementation of it,
+    so this must be called on each connection where ``Match``
+    rendered by ``to_sql(..., dialect="sqlite")`` is run.
+    The pattern fully matches each value by ``re.fullmatch``.
+
+    Args:
+        connection: sqlite3 connection.
+
+    """
+
+    def regexp(pattern: str, value: Any_) -> Any_:
+        if value is None:
+            return None
+
+        return re.fullmatch(pattern, str(value)) is not None
+
+    connection.create_function("REGEXP", 2, regexp, deterministic=True)
+
+
+def split(
+    comparable: Any_,
+    /,
+    *,
+    column: Hashable | None = None,
+    dialect: Dialect = "sqlite",
+) -> tuple[str | None, Params, Any_]:
+    """Split a comparable into a rendered predicate and the residual.
+
+    The members of the top-level ``All`` (and of ``All`` bound to a field)
+    are rendered by ``to_sql`` one by one so that the unrenderable ones
+    (e.g. ``Where`` and user comparables) do not prevent the others
+    from being run in the database. ``table == comparable`` is equivalent to
+    selecting the rows by the predicate and then evaluating the residual.
+
+    Args:
+        comparable: Comparable (or tree of ``Field``) to be split.
+        column: Name of the column compared with a comparable not bound to fields.
+        dialect: SQL dialect of the database (``sqlite`` or ``duckdb``).
+
+    Returns:
+        Tuple of the predicate (``None`` if nothing is rendered),
+        its parameters, and the residual comparable
+        (``ANY`` if everything is rendered).
+
+    """
+    clauses: list[str] = []
+    params: Params = []
+    residuals: list[Any_] = []
+
+    for member in flatten(comparable):
+        try:
+            clause, member_params = to_sql(member, column=column, dialect=dialect)
+        except TypeError:
+            residuals.append(member)
+        else:
+            clauses.append(clause)
+            params.extend(member_params)
+
+    predicate = f"({' AND '.join(clauses)})" if clauses else None
+
+    if not residuals:
+        return predicate, params, ANY
+
+    if len(residuals) == 1:
+        return predicate, params, residuals[0]
+
+    return predicate, params, All(residuals)
+
+
+def to_sql(
+    comparable: Any_,
+    /,
+    *,
+    column: Hashable | None = None,
+    dialect: Dialect = "sqlite",
+) -> tuple[str, Params]:
+    """Render a comparable into a parameterized SQL predicate.
+
+    ``Range`` (of any bounds), scalar equality, membership (``Any`` of scalars),
+    ``ANY``, ``NEVER``, and ``All``, ``Any``, and ``Not`` of them are rendered
+    with ``?`` placeholders so that the rows are filtered in the database.
+    ``Match`` is rendered by ``regexp_full_match`` for DuckDB and by
+    the ``REGEXP`` operator for SQLite (see ``create_regexp``).
+    Comparables are applied to the columns of ``Field``, or to ``column``
+    if they are not bound to fields. ``NULL`` is never matched
+    (except by ``ANY``) and its negations are matched
+    as in the evaluation by NumPy.
+
+    Args:
+        comparable: Comparable (or tree of ``Field``) to be rendered.
+        column: Name of the column compared with a comparable not bound to fields.
+        dialect: SQL dialect of the database (``sqlite`` or ``duckdb``).
+
+    Returns:
+        Tuple of the predicate and the list of its parameters.
+
+    Raises:
+        TypeError: Raised if any part of the comparable cannot be rendered.
+        ValueError: Raised if the dialect is not supported.
+
+    Examples:
+        ::
+
+            import sqlite3
+            from ndtools import Field, Not, Range
+            from ndtools.engines.sql import to_sql
+
+            expr = (Field("energy") == Range(1, 5, "(]")) & (Field("flag") == Not(0))
+            where, params = to_sql(expr)
+            # -> ('(("energy" > ? AND "energy" <= ?) AND ...)', [1, 5, 0])
+
+            connection = sqlite3.connect("data.db")
+            connection.execute(f"SELECT * FROM events WHERE {where}", params)
+
+    """
+    if dialect not in ("duckdb", "sqlite"):
+        raise ValueError("Dialect must be either duckdb or sqlite.")
+
+    params: Params = []
+
+    def param(value: Any_, /) -> str:
+        params.append(value.item() if isinstance(value, np.generic) else value)
+        return "?"
+
+    def visit(obj: Any_, name: Hashable | None, /) -> str:
+        if isinstance(obj, AnyType):
+            return TRUE
+
+        if isinstance(obj, NeverType):
+            return FALSE
+
+        if isinstance(obj, Field):
+            return visit(obj.comparable, obj.name)
+
+        if isinstance(obj, Not):
+            return f"({visit(obj.comparable, name)} IS NOT TRUE)"
+
+        if isinstance(obj, Any) and obj and name is not None:
+            if all(map(is_value, obj)):
+                return f"({quote(name)} IN ({', '.join(map(param, obj))}))"
+
+        if isinstance(obj, (All, Any)):
+            if not obj:
+                raise TypeError("Empty All or Any cannot be rendered.")
+
+            op = " AND " if isinstance(obj, All) else " OR "
+            return f"({op.join(visit(member, name) for member in obj)})"
+
+        if name is None:
+            raise TypeError(f"Column of {obj!r} is not specified.")
+
+        if isinstance(obj, Range):
+            terms: list[str] = []
+
+            if obj.bounds not in ("[]", "[)", "(]", "()"):
+                raise ValueError("Bounds must be either [], [), (], or ().")
+
+            if obj.lower is not None:
+                op = ">=" if obj.is_lower_closed else ">"
+                terms.append(f"{quote(name)} {op} {param(obj.lower)}")
+
+            if obj.upper is not None:
+                op = "<=" if obj.is_upper_closed else "<"
+                terms.append(f"{quote(name)} {op} {param(obj.upper)}")
+
+            return f"({' AND '.join(terms)})" if terms else TRUE
+
+        if isinstance(obj, Match):
+            if obj.flags & ~re.IGNORECASE:
+                raise TypeError(f"Flags of {obj!r} cannot be rendered.")
+
+            ignore_case = not obj.case or bool(obj.flags & re.IGNORECASE)
+
+            if dialect == "duckdb":
+                pattern = param(obj.pat)
+                options = param("i" if ignore_case else "c")
+                clause = f"regexp_full_match({quote(name)}, {pattern}, {options})"
+            else:
+                pattern = f"(?i:{obj.pat})" if ignore_case else obj.pat
+                clause = f"{quote(name)} REGEXP {param(pattern)}"
+
+            if obj.na:
+                return f"({clause} OR {quote(name)} IS NULL)"
+
+            return f"({clause})"
+
+        if is_value(obj):
+            return f"({quote(name)} = {param(obj)})"
+
+        raise TypeError(f"{obj!r} cannot be rendered into SQL.")
+
+    return visit(comparable, column), params
+
+
+def quote(name: Hashable, /) -> str:
+    """Quote a column name as an SQL identifier."""
+    return '"' + str(name).replace('"', '""') + '"'
@@ -0,0 +1,73 @@
+__all__ = ["is_lowerable", "is_number", "is_value", "overflow", "to_scalar"]
+
+
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ..comparison.builtins import Range
+
+# constants
+BOUNDS = ("[]", "[)", "(]", "()")
+
+
+def is_lowerable(comparable: Range, /) -> bool:
+    """Check if given range only has valid bounds and numeric values."""
+    return (
+        comparable.bounds in BOUNDS
+        and (comparable.lower is None or is_number(comparable.lower))
+        and (comparable.upper is None or is_number(comparable.upper))
+    )
+
+
+def is_number(obj: Any_, /) -> bool:
+    """Check if given object is a real number (including booleans)."""
+    return isinstance(obj, (int, float, np.bool_, np.integer, np.floating))
+
+
+def is_value(obj: Any_, /) -> bool:
+    """Check if an object is a scalar value (not a comparable)."""
+    return obj is not None and pd.api.types.is_scalar(obj)
+
+
+def overflow(value: Any_, dtype: Any_, /) -> int:
+    """Check if an integer is out of the range of an integer data type.
+
+    Returns:
+        -1 if the integer is below the minimum, 1 if it is above the maximum,
+        and 0 otherwise (or if the value or the data type is not integer).
+
+    """
+    if (dtype := np.dtype(dtype)).kind not in "iu":
+        return 0
+
+    if not isinstance(value, (int, np.integer)):
+        return 0
+
+    if int(value) < (info := np.iinfo(dtype)).min:  # type: ignore
+        return -1
+
+    if int(value) > info.max:  # type: ignore
+        return 1
+
+    return 0
+
+
+def to_scalar(value: Any_, dtype: Any_, /) -> Any_:
+    """Cast a Python scalar to the data type of an array as NumPy does (NEP 50).
+
+    Python scalars are weakly typed so that, for example, ``1.1`` is compared
+    with a float32 array as float32. NumPy scalars and values that do not fit
+    the data type (e.g. ``1000`` for int8) are returned as they are.
+
+    """
+    if type(value) not in (bool, int, float):
+        return value
+
+    try:
+        with np.errstate(over="ignore"):
+            return np.result_type(dtype, value).type(value)
+    except (OverflowError, TypeError, ValueError):
+        return value
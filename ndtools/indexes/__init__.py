@@ -0,0 +1,8 @@
+__all__ = ["bitmap", "sorted", "strings", "zonemap"]
+
+
+# dependencies
+from . import bitmap
+from . import sorted
+from . import strings
+from . import zonemap
@@ -0,0 +1,264 @@
+__all__ = ["Bitmap", "BitmapIndex"]
+
+
+# standard library
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from typing_extensions import Self
+from ..comparison.builtins import AnyType, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+
+
+@dataclass(frozen=True, eq=False)
+class Bitmap:
+    """Bit-packed boolean mask that supports bitwise operations.
+
+    Args:
+        bits: Packed bits (``numpy.packbits``) of the flattened mask.
+        shape: Shape of the mask.
+
+    """
+
+    bits: Any_
+    """Packed bits (``numpy.packbits``) of the flattened mask."""
+
+    shape: tuple[int, ...]
+    """Shape of the mask."""
+
+    @classmethod
+    def empty(cls, shape: tuple[int, ...], /) -> Self:
+        """Create a bitmap whose bits are all False."""
+        return cls(np.zeros((int(np.prod(shape)) + 7) // 8, np.uint8), shape)
+
+    @classmethod
+    def from_mask(cls, mask: Any_, /) -> Self:
+        """Create a bitmap from a boolean mask."""
+        return cls(np.packbits(mask := np.asarray(mask, bool)), mask.shape)
+
+    @property
+    def size(self) -> int:
+        """Number of the elements."""
+        return int(np.prod(self.shape))
+
+    def count(self) -> int:
+        """Return the number of True elements."""
+        return int(np.bitwise_count(self.bits).sum())
+
+    def indices(self) -> Any_:
+        """Return the sorted flat indices of True elements."""
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.size))
+
+    def mask(self) -> Any_:
+        """Return the boolean mask."""
+        return np.unpackbits(self.bits, count=self.size).view(bool).reshape(self.shape)
+
+    def __and__(self, other: Self) -> Self:
+        return type(self)(self.bits & other.bits, self.shape)
+
+    def __or__(self, other: Self) -> Self:
+        return type(self)(self.bits | other.bits, self.shape)
+
+    def __invert__(self) -> Self:
+        bits = ~self.bits
+
+        if padding := -self.size % 8:
+            bits[-1] &= 0xFF << padding & 0xFF
+
+        return type(self)(bits, self.shape)
+
+
+class BitmapIndex:
+    """Binned bitmap index of an array for repeated queries by comparables.
+
+    It builds one bitmap per distinct value if the array has
+    at most ``bins`` distinct values, or one bitmap per bin whose edges
+    are picked from the sorted distinct values otherwise.
+    Then ``Range``, scalar equality, ``ANY``, and ``NEVER`` are answered
+    by OR of the bitmaps of the bins fully within them, where only
+    the elements in the edge bins are checked against the raw data,
+    and ``All``, ``Any``, and ``Not`` of them are answered by bitwise
+    AND, OR, and NOT of the bitmaps. Other comparables (e.g. ``Match``
+    and ``Where``) are evaluated on the raw data and converted to bitmaps.
+    The array is assumed not to be modified after the index is created.
+
+    Args:
+        array: Array to be indexed. It will be converted to NumPy array.
+        bins: Maximum number of bitmaps (bins) of the index.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import BitmapIndex, Range
+
+            index = BitmapIndex(np.array([3, 1, 4, 1, 5]))
+            index.mask(Range(1, 4) | 5)  # -> array([True, True, False, True, True])
+            index.count(Range(1, 4) | 5)  # -> 4
+
+    """
+
+    def __init__(self, array: Any_, /, *, bins: int = 64) -> None:
+        self.array = np.asarray(array)
+        """Indexed array."""
+
+        values = np.unique(self.array)
+        values = values[~pd.isna(values)]
+
+        if len(values) <= bins:
+            self.edges: Any_ = values
+            """Edges of the bins (distinct values if ``is_binned`` is False)."""
+
+            self.is_binned = False
+            """Whether the bins have widths (True) or are distinct values (False)."""
+        else:
+            self.edges = values[np.linspace(0, len(values) - 1, bins + 1).astype(int)]
+            self.is_binned = True
+
+        flat = self.array.ravel()
+        codes = np.full(flat.shape, -1, np.intp)
+        valid = ~pd.isna(flat)
+        codes[valid] = self.code(flat[valid])
+
+        self.positions = np.argsort(codes, kind="stable")
+        """Flat indices grouped by the bins (sorted within each bin)."""
+
+        self.offsets = np.searchsorted(codes[self.positions], np.arange(self.nbins + 1))
+        """Offsets of the bins in the grouped flat indices."""
+
+        self.bitmaps = [self.from_indices(self.members(i)) for i in range(self.nbins)]
+        """Bitmaps of the bins."""
+
+    @property
+    def nbins(self) -> int:
+        """Number of the bins."""
+        return len(self.edges) - 1 if self.is_binned else len(self.edges)
+
+    def bitmap(self, comparable: Any_, /) -> Bitmap:
+        """Return the bitmap of elements equal to given comparable."""
+        if isinstance(comparable, AnyType):
+            return ~Bitmap.empty(self.array.shape)
+
+        if isinstance(comparable, NeverType):
+            return Bitmap.empty(self.array.shape)
+
+        if isinstance(comparable, All) and len(comparable):
+            return reduce(Bitmap.__and__, map(self.bitmap, comparable))
+
+        if isinstance(comparable, Any) and len(comparable):
+            return reduce(Bitmap.__or__, map(self.bitmap, comparable))
+
+        if isinstance(comparable, Not):
+            return ~self.bitmap(comparable.comparable)
+
+        if isinstance(comparable, Range):
+            bitmap = self.search_range(comparable)
+        elif comparable is not None and pd.api.types.is_scalar(comparable):
+            bitmap = self.search_range(Range(comparable, comparable, "[]"))
+        else:
+            bitmap = None
+
+        if bitmap is None:
+            return Bitmap.from_mask(self.array == comparable)
+
+        return bitmap
+
+    def count(self, comparable: Any_, /) -> int:
+        """Return the number of elements equal to given comparable."""
+        return self.bitmap(comparable).count()
+
+    def indices(self, comparable: Any_, /) -> Any_:
+        """Return the sorted flat indices of elements equal to given comparable."""
+        return self.bitmap(comparable).indices()
+
+    def mask(self, comparable: Any_, /) -> Any_:
+        """Return the boolean mask of elements equal to given comparable."""
+        return self.bitmap(comparable).mask()
+
+    def code(self, values: Any_, /) -> Any_:
+        """Return the bin indices of values within the bins."""
+        if not self.is_binned:
+            return np.searchsorted(self.edges, values)  # type: ignore
+
+        codes: Any_ = np.searchsorted(self.edges, values, "right")  # type: ignore
+        return np.clip(codes - 1, 0, self.nbins - 1)  # type: ignore
+
+    def members(self, i: int, /) -> Any_:
+        """Return the sorted flat indices of the elements in the i-th bin."""
+        return self.positions[self.offsets[i] : self.offsets[i + 1]]
+
+    def from_indices(self, indices: Any_, /) -> Bitmap:
+        """Create a bitmap whose bits are True at given flat indices."""
+        bitmap = Bitmap.empty(self.array.shape)
+        bits = (0x80 >> (indices & 7)).astype(np.uint8)
+        np.bitwise_or.at(bitmap.bits, indices >> 3, bits)
+        return bitmap
+
+    def search_range(self, comparable: Range, /) -> Bitmap | None:
+        """Search for the bitmap of elements within given range.
+
+        Returns:
+            Bitmap of the elements within the range.
+            ``None`` if the bounds cannot be compared with the bins.
+
+        """
+        if comparable.bounds not in ("[]", "[)", "(]", "()"):
+            raise ValueError("Bounds must be either [], [), (], or ().")
+
+        if comparable.lower is None and comparable.upper is None:
+            return ~Bitmap.empty(self.array.shape)
+
+        values: Any_ = self.edges
+        normalized = comparable
+
+        if values.dtype.kind in "Mm":
+            if (normalized := comparable.normalize(values.dtype)) is not comparable:
+                values = values.view(np.int64)
+
+        def search(value: Any_, side: str, /) -> int:
+            return int(np.searchsorted(values, value, side))  # type: ignore
+
+        try:
+            if normalized.lower is None:
+                first = 0
+            elif self.is_binned:
+                first = max(search(normalized.lower, "right") - 1, 0)
+            else:
+                side = "left" if normalized.is_lower_closed else "right"
+                first = search(normalized.lower, side)
+
+            if normalized.upper is None:
+                last = self.nbins - 1
+            elif self.is_binned:
+                last = min(search(normalized.upper, "right") - 1, self.nbins - 1)
+            else:
+                side = "right" if normalized.is_upper_closed else "left"
+                last = search(normalized.upper, side) - 1
+        except (TypeError, ValueError):
+            return None
+
+        # bins of the bounds may be partially within the range
+        partial: set[int] = set()
+
+        if self.is_binned and normalized.lower is not None:
+            partial.add(first)
+
+        if self.is_binned and normalized.upper is not None:
+            partial.add(last)
+
+        bitmap = Bitmap.empty(self.array.shape)
+
+        for i in range(first, last + 1):
+            if i not in partial:
+                bitmap |= self.bitmaps[i]
+                continue
+
+            members = self.members(i)
+            matched = np.asarray(self.array.ravel()[members] == comparable)
+            bitmap |= self.from_indices(members[matched])
+
+        return bitmap
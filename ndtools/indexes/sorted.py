@@ -0,0 +1,237 @@
+__all__ = ["SortedIndex"]
+
+
+# standard library
+from functools import reduce
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ..comparison.builtins import AnyType, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+
+# type hints
+Intervals = list[tuple[int, int]]
+
+
+class SortedIndex:
+    """Sorted index of an array for repeated queries by comparables.
+
+    It pays for one argsort of the (flattened) array up front.
+    Then ``Range``, scalar equality, ``ANY``, ``NEVER``, and ``All``,
+    ``Any``, and ``Not`` of them are answered by binary search
+    on the sorted copy as intervals of the sorted positions,
+    which costs ``O(log n + k)`` instead of ``O(n)`` per query.
+    Other comparables (e.g. ``Match`` and ``Where``) are evaluated
+    on the candidates narrowed by the others in ``All``,
+    or on the whole array otherwise.
+    The array is assumed not to be modified after the index is created.
+
+    Args:
+        array: Array to be indexed. It will be converted to NumPy array.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Range, SortedIndex
+
+            index = SortedIndex(np.array([3, 1, 4, 1, 5]))
+            index.indices(Range(1, 4))  # -> array([0, 1, 3])
+            index.mask(Range(1, 4))  # -> array([True, True, False, True, False])
+            index.count(Range(1, 4))  # -> 3
+
+    """
+
+    def __init__(self, array: Any_, /) -> None:
+        self.array = np.asarray(array)
+        """Indexed array."""
+
+        self.order = np.argsort(self.array, axis=None, kind="stable")
+        """Flat indices that sort the array."""
+
+        self.values = self.array.ravel()[self.order]
+        """Sorted copy of the array (NaN or NaT at the end)."""
+
+        self.size = self.values.size
+        """Number of the elements."""
+
+        self.valid = int(self.size - np.count_nonzero(pd.isna(self.values)))
+        """Number of the elements that are not NaN nor NaT."""
+
+    def count(self, comparable: Any_, /) -> int:
+        """Return the number of elements equal to given comparable."""
+        if (intervals := self.search(comparable)) is not None:
+            return sum(stop - start for start, stop in intervals)
+
+        return len(self.indices(comparable))
+
+    def indices(self, comparable: Any_, /) -> Any_:
+        """Return the sorted flat indices of elements equal to given comparable."""
+        if (intervals := self.search(comparable)) is not None:
+            return np.sort(self.take(intervals))
+
+        flat = self.array.ravel()
+
+        if not isinstance(comparable, All):
+            return np.flatnonzero(flat == comparable)
+
+        indexed: list[Any_] = []
+        others: list[Any_] = []
+
+        for cond in comparable:
+            (indexed if self.search(cond) is not None else others).append(cond)
+
+        if indexed:
+            candidates = self.indices(All(indexed))
+        else:
+            candidates = np.arange(self.size)
+
+        for cond in others:
+            candidates = candidates[np.asarray(flat[candidates] == cond)]
+
+        return candidates
+
+    def mask(self, comparable: Any_, /) -> Any_:
+        """Return the boolean mask of elements equal to given comparable."""
+        mask = np.zeros(self.size, bool)
+
+        if (intervals := self.search(comparable)) is not None:
+            mask[self.take(intervals)] = True
+        else:
+            mask[self.indices(comparable)] = True
+
+        return mask.reshape(self.array.shape)
+
+    def search(self, comparable: Any_, /) -> Intervals | None:
+        """Search for the intervals of sorted positions equal to given comparable.
+
+        Args:
+            comparable: Comparable (or scalar) to be searched.
+
+        Returns:
+            Sorted and disjoint list of ``(start, stop)`` of the sorted positions.
+            ``None`` if the comparable (or any of its members) cannot be searched.
+
+        """
+        if isinstance(comparable, AnyType):
+            return [(0, self.size)]
+
+        if isinstance(comparable, NeverType):
+            return []
+
+        if isinstance(comparable, (All, Any)):
+            searched = [self.search(cond) for cond in comparable]
+
+            if any(intervals is None for intervals in searched):
+                return None
+
+            if isinstance(comparable, All):
+                return reduce(intersect, searched, [(0, self.size)])  # type: ignore
+            else:
+                return reduce(union, searched, [])  # type: ignore
+
+        if isinstance(comparable, Not):
+            if (intervals := self.search(comparable.comparable)) is None:
+                return None
+
+            return complement(intervals, self.size)
+
+        if isinstance(comparable, Range):
+            return self.search_range(comparable)
+
+        if comparable is not None and pd.api.types.is_scalar(comparable):
+            return self.search_range(Range(comparable, comparable, "[]"))
+
+        return None
+
+    def search_range(self, comparable: Range, /) -> Intervals | None:
+        """Search for the interval of sorted positions within given range."""
+        if comparable.bounds not in ("[]", "[)", "(]", "()"):
+            raise ValueError("Bounds must be either [], [), (], or ().")
+
+        if comparable.lower is None and comparable.upper is None:
+            return [(0, self.size)]
+
+        values: Any_ = self.values[: self.valid]
+
+        if values.dtype.kind in "Mm":
+            if (normalized := comparable.normalize(values.dtype)) is comparable:
+                return None
+
+            comparable, values = normalized, values.view(np.int64)
+
+        try:
+            if comparable.lower is None:
+                start = 0
+            else:
+                side = "left" if comparable.is_lower_closed else "right"
+                start = int(np.searchsorted(values, comparable.lower, side))  # type: ignore
+
+            if comparable.upper is None:
+                stop = self.valid
+            else:
+                side = "right" if comparable.is_upper_closed else "left"
+                stop = int(np.searchsorted(values, comparable.upper, side))  # type: ignore
+        except TypeError:
+            return None
+
+        return [(start, stop)] if start < stop else []
+
+    def take(self, intervals: Intervals, /) -> Any_:
+        """Return the flat indices of the elements in given intervals."""
+        if not intervals:
+            return np.empty(0, np.intp)
+
+        return np.concatenate([self.order[start:stop] for start, stop in intervals])
+
+
+def complement(intervals: Intervals, size: int, /) -> Intervals:
+    """Return the complement of intervals within ``[0, size)``."""
+    result: Intervals = []
+    position = 0
+
+    for start, stop in intervals:
+        if position < start:
+            result.append((position, start))
+
+        position = stop
+
+    if position < size:
+        result.append((position, size))
+
+    return result
+
+
+def intersect(left: Intervals, right: Intervals, /) -> Intervals:
+    """Return the intersection of two sorted and disjoint lists of intervals."""
+    result: Intervals = []
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        start = max(left[i][0], right[j][0])
+        stop = min(left[i][1], right[j][1])
+
+        if start < stop:
+            result.append((start, stop))
+
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+
+    return result
+
+
+def union(left: Intervals, right: Intervals, /) -> Intervals:
+    """Return the union of two sorted and disjoint lists of intervals."""
+    result: Intervals = []
+
+    for start, stop in sorted(left + right):
+        if result and start <= result[-1][1]:
+            result[-1] = (result[-1][0], max(result[-1][1], stop))
+        else:
+            result.append((start, stop))
+
+    return result
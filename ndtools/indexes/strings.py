@@ -0,0 +1,189 @@
+__all__ = ["StringIndex", "literals"]
+
+
+# standard library
+import re
+from collections import defaultdict
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ..comparison.builtins import Match
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:
+    import sre_parse  # type: ignore
+
+
+# constants
+AT: Any_ = sre_parse.AT  # type: ignore
+LITERAL: Any_ = sre_parse.LITERAL  # type: ignore
+SUBPATTERN: Any_ = sre_parse.SUBPATTERN  # type: ignore
+
+
+class StringIndex:
+    """N-gram and prefix index of a string array for repeated ``Match`` queries.
+
+    It keeps the sorted distinct strings of the array (i.e. a sorted-prefix
+    table) and an inverted index from each n-gram to the distinct strings
+    containing it. Then the literal parts of a ``Match`` pattern (see
+    ``literals``) narrow the candidates by the prefix table and the n-gram
+    index, and the full regular expression is run only on the candidates.
+    The results are identical to ``array == Match(...)``.
+    Case-insensitive patterns, arrays with missing or non-string elements,
+    and other comparables are evaluated without the index.
+    The array is assumed not to be modified after the index is created.
+
+    Args:
+        array: Array of strings to be indexed.
+            It will be converted to NumPy array.
+        n: Length of the n-grams (3 for trigrams).
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Match, StringIndex
+
+            index = StringIndex(np.array(["apple", "banana", "apricot"]))
+            index.mask(Match("ap.*"))  # -> array([True, False, True])
+            index.candidates(Match("ap.*"))  # -> array([0, 1]) (distinct strings)
+
+    """
+
+    def __init__(self, array: Any_, /, *, n: int = 3) -> None:
+        self.array = np.asarray(array)
+        """Indexed array."""
+
+        self.n = n
+        """Length of the n-grams."""
+
+        flat = self.array.ravel()
+
+        self.is_indexed = flat.dtype.kind == "U" or (
+            flat.dtype.kind == "O" and all(isinstance(obj, str) for obj in flat)
+        )
+        """Whether the array consists only of strings and is indexed."""
+
+        if not self.is_indexed:
+            self.values = self.inverse = np.empty(0, np.intp)
+            self.ngrams: dict[str, Any_] = {}
+            return
+
+        self.values, self.inverse = np.unique(flat, return_inverse=True)
+        """Sorted distinct strings and the indices that reconstruct the array."""
+
+        ngrams: defaultdict[str, list[int]] = defaultdict(list)
+
+        for i, value in enumerate(self.values):
+            for ngram in {value[j : j + n] for j in range(len(value) - n + 1)}:
+                ngrams[ngram].append(i)
+
+        self.ngrams = {key: np.array(val, np.intp) for key, val in ngrams.items()}
+        """Inverted index from each n-gram to the distinct strings containing it."""
+
+    def candidates(self, match: Match, /) -> Any_:
+        """Return the indices of the distinct strings that may match a pattern.
+
+        Args:
+            match: ``Match`` whose pattern is case-sensitive.
+
+        Returns:
+            Sorted indices of the distinct strings (``values``)
+            narrowed by the literal prefix and the n-grams of the pattern.
+
+        """
+        prefix, runs = literals(match.pat, match.flags)
+        candidates = np.arange(len(self.values))
+
+        if prefix:
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            start, stop = np.searchsorted(self.values, [prefix, upper])
+            candidates = candidates[start:stop]
+
+        for run in runs:
+            for j in range(len(run) - self.n + 1):
+                empty = np.empty(0, np.intp)
+                postings = self.ngrams.get(run[j : j + self.n], empty)
+                candidates = np.intersect1d(candidates, postings, assume_unique=True)
+
+        return candidates
+
+    def indices(self, comparable: Any_, /) -> Any_:
+        """Return the sorted flat indices of elements equal to given comparable."""
+        return np.flatnonzero(self.mask(comparable))
+
+    def mask(self, comparable: Any_, /) -> Any_:
+        """Return the result of ``array == comparable`` using the index if possible."""
+        if not self.is_indexable(comparable):
+            return self.array == comparable
+
+        regex = re.compile(comparable.pat, comparable.flags)
+        matched = np.zeros(len(self.values), bool)
+
+        for i in self.candidates(comparable):
+            matched[i] = regex.fullmatch(self.values[i]) is not None
+
+        return matched[self.inverse].reshape(self.array.shape)
+
+    def is_indexable(self, comparable: Any_, /) -> bool:
+        """Check if given comparable can be evaluated with the index."""
+        return (
+            self.is_indexed
+            and isinstance(comparable, Match)
+            and comparable.case
+            and not parse(comparable.pat, comparable.flags).state.flags & re.IGNORECASE
+        )
+
+
+def literals(pattern: str, flags: int = 0, /) -> tuple[str, list[str]]:
+    """Extract the literal parts of a regular expression for full matching.
+
+    Args:
+        pattern: Regular expression.
+        flags: Regular expression flags.
+
+    Returns:
+        Tuple of the literal prefix that every full match starts with,
+        and the literal runs that every full match contains.
+
+    Examples:
+        ::
+
+            literals("ab(cd)e[fg]+hij.*")  # -> ("abcde", ["abcde", "hij"])
+
+    """
+    runs: list[str] = []
+    chars: list[str] = []
+    prefix: str | None = None
+
+    def flush() -> None:
+        nonlocal prefix
+
+        if prefix is None:
+            prefix = "".join(chars)
+
+        if chars:
+            runs.append("".join(chars))
+            chars.clear()
+
+    def visit(items: Any_, /) -> None:
+        for op, av in items:
+            if op is LITERAL:
+                chars.append(chr(av))
+            elif op is SUBPATTERN and not av[1] & re.IGNORECASE:
+                visit(av[3])
+            elif op is AT and prefix is None and not chars:
+                continue
+            else:
+                flush()
+
+    visit(parse(pattern, flags))
+    flush()
+    return prefix or "", runs
+
+
+def parse(pattern: str, flags: int = 0, /) -> Any_:
+    """Parse a regular expression into the internal tree of the re module."""
+    return sre_parse.parse(pattern, flags)  # type: ignore
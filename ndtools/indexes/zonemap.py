@@ -0,0 +1,253 @@
+__all__ = ["ZoneMap"]
+
+
+# standard library
+from functools import reduce
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ..comparison.builtins import AnyType, NeverType, Range
+from ..comparison.comparables import All, Any, Not
+from ..engines.incremental import is_elementwise
+from ..engines.utils import is_value
+
+# constants
+ALL_FALSE = 0
+ALL_TRUE = 1
+UNKNOWN = -1
+
+
+class ZoneMap:
+    """Zone map (per-block statistics) of an array for chunked evaluation.
+
+    It computes once the minimum, maximum, null count, and distinct values
+    (if there are at most ``distinct`` of them) of each block of the
+    (flattened) array. Then ``Range``, scalar equality, and membership
+    (``Any`` of scalars) leaves are decided per block as all-False or
+    all-True by the statistics if possible, the decisions are propagated
+    through ``All``, ``Any``, and ``Not``, and only the undecided blocks
+    are read and evaluated while the others are filled with constants.
+    It is effective for partially ordered data (e.g. time series).
+    The array is assumed not to be modified after the zone map is created.
+
+    Args:
+        array: Array to be mapped. It will be converted to NumPy array.
+        blocksize: Number of the elements in each block.
+        distinct: Maximum number of the distinct values kept per block.
+
+    Examples:
+        ::
+
+            import numpy as np
+            from ndtools import Range, ZoneMap
+
+            zonemap = ZoneMap(np.arange(1000), blocksize=100)
+            zonemap.decide(Range(150, 420))  # -> array([0, -1, 1, 1, -1, 0, ...])
+            zonemap.mask(Range(150, 420))  # reads only the 2nd and 5th blocks
+
+    """
+
+    def __init__(
+        self,
+        array: Any_,
+        /,
+        *,
+        blocksize: int = 65536,
+        distinct: int = 16,
+    ) -> None:
+        if blocksize <= 0:
+            raise ValueError("Block size must be positive.")
+
+        self.array = np.asarray(array)
+        """Mapped array."""
+
+        self.blocksize = blocksize
+        """Number of the elements in each block."""
+
+        flat = self.array.ravel()
+        mins: list[Any_] = []
+        maxs: list[Any_] = []
+
+        self.nulls = np.zeros(self.nblocks, np.intp)
+        """Number of the missing values (e.g. NaN and NaT) in each block."""
+
+        self.distincts: list[Any_] = []
+        """Sorted distinct values of each block (``None`` if too many)."""
+
+        self.known = np.zeros(self.nblocks, bool)
+        """Whether the statistics of each block are available."""
+
+        for i in range(self.nblocks):
+            block = flat[i * blocksize : (i + 1) * blocksize]
+            valid = ~pd.isna(block)
+            self.nulls[i] = block.size - np.count_nonzero(valid)
+
+            try:
+                values = np.unique(block[valid])
+            except TypeError:
+                values = block[:0]
+
+            if values.size:
+                self.known[i] = True
+                mins.append(values[0])
+                maxs.append(values[-1])
+            else:
+                mins.append(block[0])
+                maxs.append(block[0])
+
+            is_small = self.known[i] and values.size <= distinct
+            self.distincts.append(values if is_small else None)
+
+        self.mins = np.array(mins, flat.dtype)
+        """Minimum of each block (undefined if the statistics are unknown)."""
+
+        self.maxs = np.array(maxs, flat.dtype)
+        """Maximum of each block (undefined if the statistics are unknown)."""
+
+    @property
+    def nblocks(self) -> int:
+        """Number of the blocks."""
+        return -(-self.array.size // self.blocksize)
+
+    def count(self, comparable: Any_, /) -> int:
+        """Return the number of elements equal to given comparable."""
+        return int(np.count_nonzero(self.mask(comparable)))
+
+    def decide(self, comparable: Any_, /) -> Any_:
+        """Decide each block by the statistics.
+
+        Args:
+            comparable: Comparable (or scalar) to be decided.
+
+        Returns:
+            Integer array of the blocks whose values are
+            1 (all-True), 0 (all-False), or -1 (undecided).
+
+        """
+        if isinstance(comparable, AnyType):
+            return self.full(ALL_TRUE)
+
+        if isinstance(comparable, NeverType):
+            return self.full(ALL_FALSE)
+
+        if isinstance(comparable, All) and len(comparable):
+            decided = np.array([self.decide(obj) for obj in comparable])
+            return combine(decided, ALL_FALSE, ALL_TRUE)
+
+        if isinstance(comparable, Any) and len(comparable):
+            decided = np.array([self.decide(obj) for obj in comparable])
+            result = combine(decided, ALL_TRUE, ALL_FALSE)
+
+            if all(is_value(obj) for obj in comparable):
+                result[self.decide_isin(comparable)] = ALL_TRUE
+
+            return result
+
+        if isinstance(comparable, Not):
+            decided = self.decide(comparable.comparable)
+            return np.where(decided == UNKNOWN, UNKNOWN, 1 - decided)
+
+        if isinstance(comparable, Range):
+            return self.decide_range(comparable)
+
+        if is_value(comparable):
+            return self.decide_value(comparable)
+
+        return self.full(UNKNOWN)
+
+    def decide_isin(self, values: Any_, /) -> Any_:
+        """Return whether each block consists only of given values."""
+        result = np.zeros(self.nblocks, bool)
+
+        for i, distinct in enumerate(self.distincts):
+            if distinct is None or self.nulls[i]:
+                continue
+
+            try:
+                matched = reduce(np.logical_or, (distinct == value for value in values))
+            except (TypeError, ValueError):
+                continue
+
+            result[i] = np.all(matched)
+
+        return result
+
+    def decide_range(self, comparable: Range, /) -> Any_:
+        """Decide each block for a range by its minimum and maximum."""
+        if comparable.lower is None and comparable.upper is None:
+            return self.full(ALL_TRUE)
+
+        mins: Any_ = self.mins
+        maxs: Any_ = self.maxs
+
+        if (kind := mins.dtype.kind) in "MmS":
+            if (normalized := comparable.normalize(mins.dtype)) is not comparable:
+                comparable = normalized
+
+                if kind in "Mm":
+                    mins, maxs = mins.view(np.int64), maxs.view(np.int64)
+
+        try:
+            inside = np.asarray(mins == comparable) & np.asarray(maxs == comparable)
+            outside = np.asarray(maxs < comparable) | np.asarray(mins > comparable)
+        except (TypeError, ValueError):
+            return self.full(UNKNOWN)
+
+        result = self.full(UNKNOWN)
+        result[self.known & outside] = ALL_FALSE
+        result[self.known & inside & (self.nulls == 0)] = ALL_TRUE
+        return result
+
+    def decide_value(self, value: Any_, /) -> Any_:
+        """Decide each block for scalar equality by its statistics."""
+        result = self.decide_range(Range(value, value, "[]"))
+
+        for i, distinct in enumerate(self.distincts):
+            if distinct is None or result[i] != UNKNOWN:
+                continue
+
+            try:
+                if not np.any(distinct == value):
+                    result[i] = ALL_FALSE
+            except (TypeError, ValueError):
+                continue
+
+        return result
+
+    def full(self, decision: int, /) -> Any_:
+        """Return the same decision for all the blocks."""
+        return np.full(self.nblocks, decision, np.int8)
+
+    def mask(self, comparable: Any_, /) -> Any_:
+        """Return the boolean mask reading only the undecided blocks.
+
+        Comparables that opt out of elementwise evaluation
+        (see ``ndtools.engines.incremental``) are evaluated
+        on the whole array without pruning.
+
+        """
+        if not is_elementwise(comparable):
+            return np.asarray(self.array == comparable, bool)
+
+        flat = self.array.ravel()
+        mask = np.empty(flat.shape, bool)
+
+        for i, decision in enumerate(self.decide(comparable)):
+            block = slice(i * self.blocksize, (i + 1) * self.blocksize)
+
+            if decision == UNKNOWN:
+                mask[block] = flat[block] == comparable
+            else:
+                mask[block] = decision == ALL_TRUE
+
+        return mask.reshape(self.array.shape)
+
+
+def combine(decided: Any_, absorbing: int, identity: int, /) -> Any_:
+    """Combine the decisions of members where one absorbing decision decides all."""
+    result = np.full(decided.shape[1], UNKNOWN, np.int8)
+    result[(decided == identity).all(0)] = identity
+    result[(decided == absorbing).any(0)] = absorbing
+    return result
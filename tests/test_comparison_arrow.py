@@ -0,0 +1,59 @@
+# dependencies
+import numpy as np
+import pandas as pd
+import pytest
+from ndtools import Any, Match, Range
+from ndtools.comparison.arrow import is_arrow, supports_regex
+
+pa = pytest.importorskip("pyarrow")
+
+
+# test functions
+def test_is_arrow() -> None:
+    assert is_arrow(pa.array([1, 2]))
+    assert is_arrow(pa.chunked_array([[1, 2]]))
+    assert is_arrow(pd.Series([1, 2], dtype="int64[pyarrow]"))
+    assert is_arrow(pd.Series(["a"], dtype="string[pyarrow]"))
+    assert not is_arrow(pd.Series([1, 2]))
+    assert not is_arrow(np.arange(2))
+
+
+def test_supports_regex() -> None:
+    assert supports_regex("a+")
+    assert not supports_regex("(a)\\1")
+    assert not supports_regex("a+", 8)
+
+
+def test_Match() -> None:
+    data = pd.Series(["a", "aa", "ab", None], dtype="string[pyarrow]")
+    expected = pd.Series([True, True, False, None], dtype="bool[pyarrow]")
+    pd.testing.assert_series_equal(data == Match("a+"), expected)
+    pd.testing.assert_series_equal(data == Match("A+", case=False), expected)
+    assert (pa.array(["a", "b"]) == Match("a")).to_pylist() == [True, False]
+
+
+def test_Range() -> None:
+    data = pd.Series([0, 1, 2, None], dtype="int64[pyarrow]")
+    expected = pd.Series([False, True, False, None], dtype="bool[pyarrow]")
+    pd.testing.assert_series_equal(data == Range(1, 2), expected)
+    pd.testing.assert_series_equal(data == Range(0, 2, "()"), expected)
+    assert (pa.array([0, 1, 2]) == Range(None, None)).to_pylist() == [True] * 3
+    assert (pa.array([0, 1, 2]) == Range(None, 1, "[]")).to_pylist() == [
+        True,
+        True,
+        False,
+    ]
+
+
+def test_Any() -> None:
+    data = pd.Series(["a", "b", "c", None], dtype="string[pyarrow]")
+    expected = pd.Series([True, False, True, None], dtype="bool[pyarrow]")
+    pd.testing.assert_series_equal(data == Any(["a", "c"]), expected)
+    pd.testing.assert_series_equal(data == Any(["a", Match("c")]), expected)
+
+
+def test_Any_cast() -> None:
+    data = pd.Series([1, 2, None], dtype="int64[pyarrow]")
+    assert (data == Any([1, 2.5])).tolist() == [True, False, pd.NA]
+    assert (data == Any([1.0, 2.0])).tolist() == [True, True, pd.NA]
+    assert not (pd.Series(["1", "2"], dtype="string[pyarrow]") == Any([1, 2])).any()
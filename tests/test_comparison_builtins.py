@@ -1,8 +1,17 @@
+# standard library
+import pickle
+from copy import copy
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
 # dependencies
 import numpy as np
-from ndtools import ANY, NEVER, Match, Range, Where
+import pandas as pd
+from ndtools import ANY, NEVER, Any, Match, Not, Range, RangeSet, Where
 from ndtools.comparison.builtins import AnyType, NeverType
+from ndtools.comparison.operators import compare
 from numpy.char import isupper
+from pytest import raises
 
 
 def test_ANY() -> None:
@@ -27,6 +36,48 @@ def test_Match() -> None:
     assert all((np.array(["a", "aa"]) == Match("a+")) == np.array([True, True]))
 
 
+def test_Match_container() -> None:
+    for dtype in ("object", "string"):
+        data = pd.Series(["a", "bb"], index=[5, 6], dtype=dtype)
+
+        for comparable in (Match("a"), Not(Match("a")), Any(["a", Match("b+")])):
+            result = data == comparable
+            assert isinstance(result, pd.Series)
+            assert result.index.equals(data.index)
+
+    result = pd.Index(["a", "bb"], name="x") == Match("a")
+    assert isinstance(result, pd.Index)
+    assert result.name == "x"
+
+
+def test_Range_compare() -> None:
+    data = np.array([0.0, 1.0, 1.5, 2.0, 3.0, np.nan])
+
+    for bounds in ("[]", "[)", "(]", "()"):
+        for window in (
+            Range(1, 2, bounds),
+            Range(None, 2, bounds),
+            Range(1, None, bounds),
+            Range(None, None, bounds),
+        ):
+            result = compare(window, data)
+            assert all((result == 0) == (data == window))
+            assert all((result == -1) == (data > window))
+            assert all((result == 1) == (data < window))
+            assert all(np.isin(result, (0, 1)) == (window >= data))
+            assert all(np.isin(result, (-1, 0)) == (window <= data))
+
+    series = pd.Series(data, index=list("abcdef"))
+    result = compare(Range(1, 2), series)
+    assert isinstance(result, pd.Series)
+    assert result.index.equals(series.index)
+    assert result.tolist() == [1, 0, 0, -1, -1, 2]
+
+    data = np.array(["2000-01-01", "2000-01-05", "NaT", "2000-02-01"], "M8[D]")
+    result = compare(Range("2000-01-02", "2000-01-10"), data)
+    assert all(result == np.array([1, 0, 2, -1]))
+
+
 def test_Range_eq() -> None:
     data = np.arange(3)
     assert all((data == Range(1, 2, "[]")) == np.array([False, True, True]))
@@ -149,3 +200,105 @@ def test_Range_ne() -> None:
 
 def test_Where() -> None:
     assert all((np.array(["A", "b"]) == Where(isupper)) == np.array([True, False]))
+    result = pd.Series(["A", "b"], index=[5, 6]) == Where(np.isin, ["A"])
+    assert isinstance(result, pd.Series)
+    assert result.index.equals(pd.Index([5, 6]))
+
+
+def test_Range_normalize() -> None:
+    data = np.array(["2000-01-01T00", "2000-01-01T01", "NaT"], "M8[h]")
+    assert all(
+        (data == Range("2000-01-01T00:30", "2000-01-01T01:00", "[]"))
+        == np.array([False, True, False])
+    )
+    assert all(
+        (data == Range(None, pd.Timestamp("2000-01-01T00:30"), "()"))
+        == np.array([True, False, False])
+    )
+    assert all(
+        (data != Range(datetime(2000, 1, 1), None, "[)"))
+        == np.array([False, False, True])
+    )
+
+    data = np.array([1, 2, 3], "m8[s]")
+    assert all((data == Range(timedelta(seconds=1.5), "3s")) == [False, True, False])
+
+    data = np.array([b"a", b"b", b"c"])
+    assert all((data == Range("b", None)) == np.array([False, True, True]))
+
+    window = Range("2000-01-01T00:30", None, "()")
+    assert window.normalize("M8[h]") is window.normalize("M8[h]")
+    assert window.normalize("M8[h]").lower == 262969
+    assert window.normalize("f8") is window
+
+    window.normalize("M8[h]")
+    assert (
+        replace(window, lower="2000-01-01T00", bounds="[]").normalize("M8[h]").lower
+        == 262968
+    )
+    assert pickle.loads(pickle.dumps(window)) == window
+
+
+def test_Range_normalize_tz() -> None:
+    data = np.array(["2000-01-01T00", "2000-01-02T00"], "M8[ns]")
+
+    for value in (
+        pd.Timestamp("2000-01-01T12", tz="UTC"),
+        datetime(2000, 1, 1, 12, tzinfo=timezone.utc),
+    ):
+        with raises(TypeError, match="tz-naive and tz-aware"):
+            data == Range(value, None)  # type: ignore
+
+
+def test_RangeSet() -> None:
+    data = np.array([0.0, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, np.nan])
+    ranges = [
+        Range(1, 2, "[]"),
+        Range(1, 2, "[)"),
+        Range(1, 2, "(]"),
+        Range(1, 2, "()"),
+        Range(None, 2),
+        Range(2, None, "(]"),
+        Range(None, None),
+        Range(3, 1),
+    ]
+    bins = RangeSet(ranges)
+    expected = np.array([data == window for window in ranges])
+
+    assert (bins.masks(data) == expected).all()
+    assert (bins.counts(data) == expected.sum(1)).all()
+    assert (bins.labels(data) == [4, 0, 0, 0, 5, 5, 5, 6]).all()
+    assert ((data == bins) == expected.any(0)).all()
+    assert (RangeSet([]).labels(data) == -1).all()
+
+
+def test_RangeSet_datetime() -> None:
+    data = np.array(["2000-01-01", "2000-01-02", "NaT"], "M8[D]")
+    bins = RangeSet.from_edges(["2000-01-01", "2000-01-01T12", None])
+
+    assert (bins.labels(data) == [0, 1, -1]).all()
+    assert (bins.counts(data) == [1, 1]).all()
+
+
+def test_RangeSet_mixed() -> None:
+    data = np.array([b"a", b"b", b"c"])
+    bins = RangeSet([Range("a", "b"), Range(b"b", b"c", "[]")])
+    assert (bins.labels(data) == [0, 1, 1]).all()
+
+    data = np.array(["2000-01-01", "2000-01-02"], "M8[D]")
+    bins = RangeSet([Range("2000-01-01", "2000-01-02"), Range(0, 1)])
+
+    with raises(ValueError):
+        bins.labels(data)
+
+
+def test_slots() -> None:
+    for comparable in (
+        Match("a"),
+        Range(1, 2),
+        RangeSet([Range(1, 2)]),
+        Where(isupper),
+    ):
+        assert not hasattr(comparable, "__dict__")
+        assert hash(comparable) == hash(copy(comparable))
+        assert comparable == copy(comparable)
@@ -1,9 +1,11 @@
 # standard library
+import pickle
 from typing import Any as Any_
 
 # dependencies
 import numpy as np
-from ndtools import All, Any, Combinable, Equatable, Not, Orderable
+from ndtools import All, Any, Combinable, Equatable, Match, Not, Orderable, Range
+from pytest import raises
 
 
 # helper functions
@@ -26,6 +28,27 @@ def test_Any() -> None:
     assert eq(Any([0]) | Any([1]), Any([0, 1]))
 
 
+def test_Group() -> None:
+    left = All([Range(1, 2), Not(Match("a")), Any([0, 1])])
+    right = All([Range(1, 2), Not(Match("a")), Any([0, 1])])
+
+    assert left == right
+    assert not left != right
+    assert left != All([Range(1, 3), Not(Match("a")), Any([0, 1])])
+    assert hash(left) == hash(right)
+    assert {left: 0}[right] == 0
+    assert Range(1, 2) in left and 1 not in All([Range(0, 2)])
+    assert left[1:] == All([Not(Match("a")), Any([0, 1])])
+    assert pickle.loads(pickle.dumps(left)) == left
+    assert not hasattr(left, "__dict__") and not hasattr(Not(1), "__dict__")
+
+    with raises(AttributeError):
+        left.data = ()  # type: ignore
+
+    with raises(TypeError):
+        hash(All([np.arange(3)]))
+
+
 def test_Combinable() -> None:
     class Test(Combinable):
         def __init__(self, value: Any_) -> None:
@@ -273,3 +296,23 @@ def test_Orderable_ltne() -> None:
     assert all((right > left) == np.array([False, False, True]))
     assert all((left != right) == np.array([True, False, True]))
     assert all((right != left) == np.array([True, False, True]))
+
+
+def test_Group_of() -> None:
+    assert eq(All.of([0, All([1, 2]), Any([3])]), All([0, 1, 2, Any([3])]))
+    assert eq(Any.of([0, All([1, 2]), Any([3])]), Any([0, All([1, 2]), 3]))
+
+
+def test_Group_concat() -> None:
+    left = All([0, 1])
+    right = left.concat([2]).concat([3, 4])
+
+    assert eq(left, All([0, 1]))
+    assert eq(right, All([0, 1, 2, 3, 4]))
+    all_, any_ = All([0]), Any([0])
+
+    for i in range(1, 1000):
+        all_, any_ = all_ & i, any_ | i
+
+    assert eq(all_, All(range(1000)))
+    assert eq(any_, Any(range(1000)))
@@ -0,0 +1,78 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ndtools import All, Any, Field, Match, Not, Range
+from ndtools.comparison.fields import columns, evaluate, regroup
+from pytest import mark, raises
+
+
+# test classes
+class Table(dict[str, Any_]):
+    def __init__(self, **columns: Any_) -> None:
+        super().__init__(**columns)
+        self.reads: list[str] = []
+
+    def __getitem__(self, name: str) -> Any_:
+        self.reads.append(name)
+        return super().__getitem__(name)
+
+
+# test data
+expr = (
+    (Field("energy") == Range(1, 5))
+    & Not(Field("flag") == 0)
+    & ((Field("name") == Match("a.*")) | (Field("energy") == 0))
+    & (Field("energy") == Not(3))
+)
+expected = np.array([True, False, False, True, False])
+data = {
+    "energy": np.array([1, 0, 3, 4, 6]),
+    "flag": np.array([1, 1, 1, 2, 1]),
+    "name": np.array(["ab", "b", "a", "ac", "a"]),
+    "unused": np.array([0, 0, 0, 0, 0]),
+}
+
+
+# test functions
+@mark.parametrize(
+    "table",
+    [
+        data,
+        pd.DataFrame(data),
+        pd.DataFrame(data).to_records(index=False),
+    ],
+)
+def test_evaluate(table: Any_) -> None:
+    assert (evaluate(expr, table) == expected).all()
+
+    if not isinstance(table, np.ndarray):
+        assert (np.asarray(table == expr) == expected).all()
+
+
+def test_evaluate_reads() -> None:
+    table = Table(**data)
+    assert (evaluate(expr, table) == expected).all()
+    assert sorted(table.reads) == ["energy", "flag", "name"]
+
+
+def test_Field() -> None:
+    assert (Field("a") == Range(1, 2)) == Field("a", Range(1, 2))
+    assert hash(Field("a", 1)) == hash(Field("a", 1))
+
+    with raises(TypeError):
+        Field("a", 1) == np.arange(3)  # type: ignore
+
+
+def test_columns() -> None:
+    assert columns(expr) == ["energy", "flag", "name"]
+
+
+def test_regroup() -> None:
+    result = regroup(Field("a", 1) & Field("b", 2) & Field("a", 3))
+    assert result == All([Field("a", All([1, 3])), Field("b", 2)])
+
+    result = regroup(Field("a", 1) | Not(Field("b", 2)) | Field("a", 3))
+    assert result == Any([Field("a", Any([1, 3])), Not(Field("b", 2))])
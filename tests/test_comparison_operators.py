@@ -4,7 +4,8 @@ from typing import Any
 
 # dependencies
 import numpy as np
-from ndtools.comparison.operators import eq, ge, gt, le, lt, ne
+import pandas as pd
+from ndtools.comparison.operators import compare, eq, ge, gt, le, lt, ne
 
 
 def test_operators_eqge() -> None:
@@ -173,3 +174,63 @@ def test_operators_ltne() -> None:
     assert all(le(left, right) == np.array([False, True, True]))
     assert all(lt(left, right) == np.array([False, False, True]))
     assert all(ne(left, right) == np.array([True, False, True]))
+
+
+def test_operators_compare() -> None:
+    class Test:
+        def __init__(self, value: Any) -> None:
+            self.value = value
+            self.calls = 0
+
+        def __compare__(self, array: Any) -> Any:
+            self.calls += 1
+            return np.where(np.isnan(array), 2, np.sign(self.value - array))
+
+    left, right = Test(1), np.array([0.0, 1.0, 2.0, np.nan])
+    assert all(np.asarray(eq(left, right)) == np.array([False, True, False, False]))
+    assert all(np.asarray(ge(left, right)) == np.array([True, True, False, False]))
+    assert all(np.asarray(gt(left, right)) == np.array([True, False, False, False]))
+    assert all(np.asarray(le(left, right)) == np.array([False, True, True, False]))
+    assert all(np.asarray(lt(left, right)) == np.array([False, False, True, False]))
+    assert all(np.asarray(ne(left, right)) == np.array([True, False, True, True]))
+    assert all(compare(left, right) == np.array([1, 0, -1, 2]))
+    assert left.calls == 7
+
+
+def test_operators_compare_first() -> None:
+    class Test:
+        def __init__(self, value: Any) -> None:
+            self.value = value
+            self.calls = 0
+
+        def __compare__(self, array: Any) -> Any:
+            self.calls += 1
+            return np.sign(self.value - array)
+
+        def __lt__(self, array: Any) -> Any:
+            raise AssertionError("Not to be called.")
+
+    left, right = Test(1), np.arange(3)
+    assert all(np.asarray(ge(left, right)) == np.array([True, True, False]))
+    assert all(np.asarray(gt(left, right)) == np.array([True, False, False]))
+    assert all(np.asarray(le(left, right)) == np.array([False, True, True]))
+    assert left.calls == 3
+
+
+def test_operators_compare_fallback() -> None:
+    class Test:
+        def __init__(self, value: Any) -> None:
+            self.value = value
+
+        def __eq__(self, array: Any) -> Any:
+            return array == self.value
+
+        def __gt__(self, array: Any) -> Any:
+            return array < self.value
+
+    left, right = Test(1), np.arange(3)
+    assert all(compare(left, right) == np.array([1, 0, -1]))
+
+    result = compare(left, pd.Series(right, index=[3, 4, 5]))
+    assert isinstance(result, pd.Series)
+    assert result.tolist() == [1, 0, -1]
@@ -0,0 +1,90 @@
+# standard library
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import Equatable, Match, Range, Where, aevaluate
+from pytest import raises
+
+
+# test classes
+class AboveMean(Equatable):
+    __elementwise__ = False
+
+    def __eq__(self, array: Any_) -> Any_:
+        return array > array.mean()
+
+
+# test functions
+def test_aevaluate() -> None:
+    data = np.arange(100).reshape(10, 10) % 17
+    expr = Range(2, 10) | Where(np.equal, 16)
+    result = asyncio.run(aevaluate(expr, data, chunksize=7))
+    assert result.shape == data.shape
+    assert (result == (data == expr)).all()
+
+
+def test_aevaluate_non_elementwise() -> None:
+    data = np.arange(10.0)
+    result = asyncio.run(aevaluate(AboveMean(), data, chunksize=3))
+    assert (result == (data > 4.5)).all()
+
+
+def test_aevaluate_limiter() -> None:
+    data = np.array(["a", "bb", "aa", "b"] * 10)
+
+    async def main() -> list[Any_]:
+        limiter = asyncio.Semaphore(1)
+
+        with ThreadPoolExecutor(2) as executor:
+            return await asyncio.gather(
+                *(
+                    aevaluate(
+                        Match(pat),
+                        data,
+                        chunksize=3,
+                        executor=executor,
+                        limiter=limiter,
+                    )
+                    for pat in ("a+", "b+")
+                )
+            )
+
+    a, b = asyncio.run(main())
+    assert (a == (data == Match("a+"))).all()
+    assert (b == (data == Match("b+"))).all()
+
+
+def test_aevaluate_timeout() -> None:
+    def slow(array: Any_) -> Any_:
+        from time import sleep
+
+        sleep(0.05)
+        return array > 0
+
+    with raises(TimeoutError):
+        asyncio.run(aevaluate(Where(slow), np.arange(10), chunksize=1, timeout=0.1))
+
+
+def test_aevaluate_cancel() -> None:
+    calls: list[int] = []
+
+    def slow(array: Any_) -> Any_:
+        from time import sleep
+
+        calls.append(len(array))
+        sleep(0.02)
+        return array > 0
+
+    async def main() -> None:
+        task = asyncio.create_task(aevaluate(Where(slow), np.arange(100), chunksize=1))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert len(calls) < 100
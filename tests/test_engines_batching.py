@@ -0,0 +1,97 @@
+# standard library
+import asyncio
+from typing import Any as Any_
+
+# dependencies
+from ndtools import Equatable, Field, Match, Not, Range
+from ndtools.engines.batching import Batcher, evaluate
+from pytest import raises
+
+
+# test classes
+class Counter(Equatable):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __eq__(self, array: Any_) -> Any_:
+        self.calls += 1
+        return array % 2 == 0
+
+
+class Failure(Equatable):
+    def __eq__(self, array: Any_) -> Any_:
+        raise RuntimeError("Failed.")
+
+
+# test functions
+def test_evaluate() -> None:
+    assert list(evaluate(Range(1, 3), [0, 1, 2, 3])) == [False, True, True, False]
+    assert list(evaluate(Match("a.*"), ["ab", "b"])) == [True, False]
+    assert list(evaluate(Not(1), (value for value in [1, 2]))) == [False, True]
+    assert evaluate(Range(1, 3), []).shape == (0,)
+    assert list(evaluate(1, [1, "a", 1.0, True])) == [True, False, True, True]
+
+    records = [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 1, "b": "y"}]
+    expr = (Field("a") == 1) & (Field("b") == "y")
+    assert list(evaluate(expr, records)) == [False, False, True]
+
+
+def test_Batcher() -> None:
+    counter = Counter()
+    batcher = Batcher(counter, batchsize=4, latency=0.01)
+
+    async def main() -> list[bool]:
+        return list(await asyncio.gather(*(batcher(value) for value in range(10))))
+
+    assert asyncio.run(main()) == [value % 2 == 0 for value in range(10)]
+    assert counter.calls == 3
+
+
+def test_Batcher_latency() -> None:
+    batcher = Batcher(Range(1, 3), batchsize=1000, latency=0.01)
+
+    async def main() -> bool:
+        return await asyncio.wait_for(batcher(2), 1.0)
+
+    assert asyncio.run(main()) is True
+
+
+def test_Batcher_error() -> None:
+    batcher = Batcher(Failure(), latency=0.0)
+
+    async def main() -> Any_:
+        return await batcher(1)
+
+    with raises(RuntimeError):
+        asyncio.run(main())
+
+    with raises(ValueError):
+        Batcher(1, batchsize=0)
+
+
+def test_Batcher_events() -> None:
+    batcher = Batcher(Range(0, 2), batchsize=3)
+
+    async def main() -> list[Any_]:
+        events = [batcher(1), batcher(None), batcher(5)]
+        return list(await asyncio.gather(*events, return_exceptions=True))
+
+    first, second, third = asyncio.run(main())
+    assert first is True
+    assert isinstance(second, TypeError)
+    assert third is False
+
+    with raises(TypeError):
+        evaluate(Range(0, 2), [1, None])
+
+    with raises(TypeError):
+        evaluate(Range(0, 2), [1, "a", 2.5])
+
+
+def test_Batcher_records() -> None:
+    batcher = Batcher(Field("a", Range(1, 3)), batchsize=2)
+
+    async def main() -> list[bool]:
+        return list(await asyncio.gather(batcher({"a": 0}), batcher({"a": 1})))
+
+    assert asyncio.run(main()) == [False, True]
@@ -0,0 +1,123 @@
+# standard library
+import tracemalloc
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, All, Any, Equatable, Match, Not, Range, Where
+from ndtools.engines.budget import evaluate, footprint
+from pytest import mark, raises
+
+
+# test classes
+class Even(Equatable):
+    def __eq__(self, array: Any_) -> Any_:
+        return array % 2 == 0
+
+
+class Global(Equatable):
+    __elementwise__ = False
+
+    def __eq__(self, array: Any_) -> Any_:
+        return array > array.mean()
+
+
+# helper functions
+def is_ordered(array: Any_) -> Any_:
+    return array == array
+
+
+# test data
+arrays = [
+    np.arange(1000.0).reshape(10, 100),
+    np.arange(1000),
+    np.arange("2000-01-01", "2002-09-27", dtype="datetime64[D]"),
+]
+comparables = [
+    ANY,
+    NEVER,
+    Range(100, 500),
+    Range(None, 500, "(]"),
+    Range(100, None, "()"),
+    Range(None, None),
+    Not(Range(100, 500)),
+    All([Range(100, 500), Not(200), Even()]),
+    Any([Range(None, 100), Range(900, None), 500, Even()]),
+    Where(is_ordered),
+]
+
+
+# test functions
+@mark.parametrize("array", arrays[:2])
+@mark.parametrize("comparable", comparables)
+def test_evaluate(array: Any_, comparable: Any_) -> None:
+    mask, report = evaluate(comparable, array, budget=1024)
+
+    assert (mask == (array == comparable)).all()
+    assert mask.shape == array.shape
+    assert report.budget == 1024
+    assert report.estimate <= 1024
+
+
+def test_evaluate_nonelementwise() -> None:
+    array = np.arange(1000.0)
+    mask, report = evaluate(Range(100, 900) & Global(), array, budget=1024)
+
+    assert (mask == ((array >= 100) & (array < 900) & (array > 499.5))).all()
+    assert report.chunksize == array.size
+    assert report.estimate > 1024
+
+
+def test_evaluate_datetime() -> None:
+    array = arrays[2]
+    window = Range("2000-03-01", "2001-03-01")
+    mask, report = evaluate(window, array, budget=100)
+
+    assert (mask == (array == window)).all()
+    assert report.chunksize == 100
+
+
+def test_evaluate_peak() -> None:
+    array = np.arange(10**6, dtype=float)
+    comparable = All([Range(10, 10**5), Not(Range(100, 200)), Not(500)])
+    mask, report = evaluate(comparable, array, budget=10**4)
+
+    assert (mask == (array == comparable)).all()
+    assert report.chunksize == 10**4 // 2
+    assert report.estimate == 10**4
+    assert report.peak <= 2 * report.estimate
+
+
+def test_evaluate_tracing() -> None:
+    tracemalloc.start()
+
+    try:
+        tracemalloc.reset_peak()
+        data = np.ones(10**5)
+        peak = tracemalloc.get_traced_memory()[1]
+        evaluate(Range(0, 2) & Even(), np.arange(10), budget=100)
+
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak >= data.nbytes
+    finally:
+        tracemalloc.stop()
+
+    evaluate(Range(0, 2), np.arange(10), budget=100)
+    assert not tracemalloc.is_tracing()
+
+
+def test_evaluate_budget() -> None:
+    with raises(ValueError):
+        evaluate(Even(), np.arange(10), budget=1)
+
+
+def test_footprint() -> None:
+    assert footprint(ANY, "f8") == 0
+    assert footprint(1.0, "f8") == 0
+    assert footprint(Range(0, 1), "f8") == 1
+    assert footprint(Range(0, None), "f8") == 0
+    assert footprint(Range(None, "2000-01-01"), "M8[ns]") == 1
+    assert footprint(Range(0, 1) & Not(1), "f8") == 1
+    assert footprint(Range(0, 1) & Range(2, 3) & Range(4, 5), "f8") == 2
+    assert footprint(Even(), "f8") == 9
+    assert footprint(Match("a"), "U4") == 81
@@ -0,0 +1,82 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import Classify, Equatable, Field, Match, Range
+from pytest import mark
+
+
+# test classes
+class Counter(Equatable):
+    def __init__(self, divisor: int, /) -> None:
+        self.divisor = divisor
+        self.sizes: list[int] = []
+
+    def __eq__(self, array: Any_) -> Any_:
+        self.sizes.append(len(array))
+        return array % self.divisor == 0
+
+
+class Global(Equatable):
+    __elementwise__ = False
+
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+
+    def __eq__(self, array: Any_) -> Any_:
+        self.sizes.append(len(array))
+        return array > array.mean()
+
+
+# test data
+data = np.arange(-5, 25).reshape(5, 6)
+
+
+# test functions
+@mark.parametrize(
+    "comparables",
+    [
+        [Range(None, 0), Range(0, 10), 99],
+        [Range(0, 20), Range(10, None), Range(None, 5)],
+        [15, Range(10, 20), Range(None, None)],
+    ],
+)
+def test_Classify(comparables: list[Any_]) -> None:
+    labels = Classify(comparables, default=-1)(data)
+    condlist = [data == comparable for comparable in comparables]
+    expected = np.select(condlist, range(len(comparables)), -1)
+
+    assert labels.shape == data.shape
+    assert np.array_equal(labels, expected)
+
+
+def test_Classify_strings() -> None:
+    classify = Classify([Match("ERROR.*"), Match("WARN.*")], default=2)
+    assert list(classify(["WARN: a", "INFO: b", "ERROR: c"])) == [1, 2, 0]
+    assert list(Classify([], default=5)(np.arange(3))) == [5, 5, 5]
+
+
+def test_Classify_unlabeled() -> None:
+    first, second, third = Counter(2), Counter(3), Counter(1)
+    classify = Classify([first, second, third, Counter(5)], default=9)
+
+    assert list(classify(np.arange(12))) == [0, 2, 0, 1, 0, 2, 0, 2, 0, 1, 0, 2]
+    assert first.sizes == [12]
+    assert second.sizes == [6]
+    assert third.sizes == [4]
+
+
+def test_Classify_elementwise() -> None:
+    nonelementwise = Global()
+    labels = Classify([Range(6, 8), nonelementwise], default=-1)(np.arange(10))
+
+    assert list(labels) == [-1] * 5 + [1, 0, 0, 1, 1]
+    assert nonelementwise.sizes == [10]
+
+
+def test_Classify_table() -> None:
+    table = np.array([(1, "a"), (2, "b"), (3, "a")], [("x", "i8"), ("y", "U1")])
+    classify = Classify([Field("x", 2), Field("y", "a")], default=-1)
+
+    assert list(classify(table)) == [1, 0, 1]
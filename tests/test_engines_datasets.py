@@ -0,0 +1,102 @@
+# standard library
+from pathlib import Path
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ndtools import ANY, NEVER, Field, Match, Not, Range, Where
+from ndtools.comparison.fields import evaluate
+from ndtools.engines.datasets import read, split, to_expression
+from pytest import fixture, importorskip
+
+ds = importorskip("pyarrow.dataset")
+pq = importorskip("pyarrow.parquet")
+
+
+# helper functions
+def is_even(array: Any_) -> Any_:
+    return array % 2 == 0
+
+
+def is_large(array: Any_) -> Any_:
+    return array > 2
+
+
+# test fixtures
+@fixture
+def data(tmp_path: Path) -> tuple[pd.DataFrame, Path]:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "time": pd.date_range("2000-01-01", periods=1000, freq="h"),
+            "energy": np.sort(rng.uniform(0, 10, 1000)),
+            "flag": rng.integers(0, 4, 1000),
+            "name": rng.choice(["apple", "banana", "apricot"], 1000),
+        }
+    )
+    df.loc[::97, "energy"] = np.nan
+    df.to_parquet(path := tmp_path / "data.parquet", row_group_size=100)
+    return df, path
+
+
+# test functions
+def test_read(data: tuple[pd.DataFrame, Path]) -> None:
+    df, path = data
+    exprs = [
+        Field("energy", Range(1, 5)),
+        Field("energy", Range(1, 5, "(]")) & Field("flag", 1),
+        Field("energy", Not(Range(1, 5))),
+        Field("energy", Range(None, 2)) | Field("energy", Range(8, None, "()")),
+        Field("flag", Not(1) & Not(2)),
+        Field("flag", 1) | Field("flag", 3),
+        Field("name", Match("ap.*")),
+        Field("name", Not(Match("ap.*"))),
+        Field("time", Range("2000-01-10", "2000-01-20")),
+        Field("energy", ANY),
+        Field("energy", NEVER),
+        Field("flag", Where(is_even)) & Field("energy", Range(1, 5)),
+    ]
+
+    for expr in exprs[:-1]:
+        assert split(expr, pq.read_schema(path))[1] is ANY
+
+    for expr in exprs:
+        table = read(expr, path, columns=["time", "energy"])
+        expected = df[np.asarray(evaluate(expr, df), bool)]
+        assert table.column_names == ["time", "energy"]
+        assert table.num_rows == len(expected)
+        assert (table["time"].to_numpy() == expected["time"].to_numpy()).all()
+
+
+def test_read_dataset(data: tuple[pd.DataFrame, Path]) -> None:
+    df, path = data
+    expr = Field("energy", Range(1, 5) & Where(is_large))
+    table = read(expr, ds.dataset(path))
+
+    assert table.column_names == list(df.columns)
+    assert table.num_rows == evaluate(expr, df).sum()
+
+
+def test_split(data: tuple[pd.DataFrame, Path]) -> None:
+    schema = pq.read_schema(data[1])
+    where = Where(is_large)
+
+    expression, residual = split(Field("energy", Range(1, 5) & where), schema)
+    assert expression is not None
+    assert residual == Field("energy", where)
+
+    expression, residual = split(Field("energy", Range(1, 5) | where), schema)
+    assert expression is None
+    assert residual == Field("energy", Range(1, 5) | where)
+
+    expression, residual = split(Field("energy", Range(1, 5)), schema)
+    assert expression is not None
+    assert residual is ANY
+
+
+def test_to_expression() -> None:
+    assert to_expression(Range(1, 5)) is None
+    assert to_expression(Field("a", Where(np.isnan))) is None
+    assert to_expression(Field("a", Match("(?=a)"))) is None
+    assert str(to_expression(Field("a", 1))) == "(a == 1)"
@@ -0,0 +1,65 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import ANY, Equatable, Match, Not, Range, Where
+from ndtools.engines.incremental import Incremental, is_elementwise
+
+
+# test classes
+class AboveMean(Equatable):
+    __elementwise__ = False
+
+    def __eq__(self, array: Any_) -> Any_:
+        return array > array.mean()
+
+
+# test functions
+def test_Incremental() -> None:
+    data = np.arange(100) % 17
+    expr = (Range(2, 10) & Not(5)) | Where(np.equal, 16) | ANY & Range(None, 1)
+    evaluator = Incremental(expr)
+
+    for size in (0, 1, 10, 11, 50, 100):
+        result = evaluator(data[:size])
+        assert evaluator.size == size
+        assert (result == (data[:size] == expr)).all()
+
+    assert not result.flags.writeable
+
+
+def test_Incremental_strings() -> None:
+    data = np.array(["a", "bb", "ab", "ba", "aa"])
+    evaluator = Incremental(Match("a+"))
+
+    for size in (2, 3, 5):
+        assert (evaluator(data[:size]) == (data[:size] == Match("a+"))).all()
+
+
+def test_Incremental_non_elementwise() -> None:
+    data = np.arange(100, dtype=float)
+    expr = Range(10, 90) & AboveMean()
+    evaluator = Incremental(expr)
+
+    for size in (10, 50, 100):
+        assert (evaluator(data[:size]) == (data[:size] == expr)).all()
+
+    assert list(evaluator.buffers) == [(0,)]
+
+
+def test_Incremental_reset() -> None:
+    evaluator = Incremental(Range(1, 3))
+    evaluator(np.arange(5))
+    assert (evaluator(np.arange(3)[::-1]) == [True, True, False]).all()
+
+
+def test_is_elementwise() -> None:
+    def func(array: Any_) -> Any_:
+        return array > array.mean()
+
+    func.__elementwise__ = False  # type: ignore
+
+    assert is_elementwise(Range(1, 2) & Match("a") | 1)
+    assert not is_elementwise(Range(1, 2) & Not(AboveMean()))
+    assert not is_elementwise(Where(func))
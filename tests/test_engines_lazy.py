@@ -0,0 +1,119 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, Any, Equatable, Match, Not, Range, Where
+from ndtools.engines.lazy import Lazy, Mask
+from pytest import mark, raises
+
+
+# test classes
+class Counter(Equatable):
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+
+    def __eq__(self, array: Any_) -> Any_:
+        self.sizes.append(len(array))
+        return array % 2 == 0
+
+
+class Global(Equatable):
+    __elementwise__ = False
+
+    def __init__(self) -> None:
+        self.sizes: list[int] = []
+
+    def __eq__(self, array: Any_) -> Any_:
+        self.sizes.append(np.size(array))
+        return array > array.mean()
+
+
+# helper functions
+def is_multiple_of_three(array: Any_) -> Any_:
+    return array % 3 == 0
+
+
+# test data
+a = np.arange(12)
+b = np.arange(12)[::-1] * 2
+c = np.array(list("abcabcabcabc"))
+comparables = [
+    ANY,
+    NEVER,
+    5,
+    Range(3, 60, "(]"),
+    Not(Range(3, 60)),
+    Range(2, 80) & Not(Range(10, 20)) & Not(5),
+    Any([Range(None, 3), 50, Range(90, None)]) | Where(is_multiple_of_three),
+    Range(10, 90) & Global(),
+]
+
+
+# test functions
+@mark.parametrize("chunksize", [1, 5, 100])
+@mark.parametrize("workers", [None, 4])
+def test_Mask(chunksize: int, workers: int | None) -> None:
+    mask = (Lazy(a) == Range(1, 9)) & (Lazy(b) != 4) | ~(Lazy(c) == Match("[ab]"))
+    expected = ((a == Range(1, 9)) & (b != 4)) | ~(c == Match("[ab]"))
+
+    assert isinstance(mask, Mask)
+    assert mask.shape == a.shape
+    assert np.array_equal(mask.evaluate(chunksize=chunksize, workers=workers), expected)
+    assert np.array_equal(np.asarray(mask), expected)
+    assert np.array_equal(a[mask], a[expected])
+    assert mask.count(chunksize=chunksize) == np.count_nonzero(expected)
+    assert mask.any(chunksize=chunksize)
+    assert not mask.all(chunksize=chunksize)
+
+
+def test_Mask_order() -> None:
+    d = a.reshape(3, 4)
+    assert np.array_equal(
+        np.asarray((Lazy(d) >= 3) & (Lazy(d) < 9)), (d >= 3) & (d < 9)
+    )
+    assert np.array_equal(np.asarray(Lazy(a) >= 3), a >= 3)
+    assert np.array_equal(np.asarray(Lazy(a) > 3), a > 3)
+    assert np.array_equal(np.asarray(Lazy(a) <= 3), a <= 3)
+    assert np.array_equal(np.asarray(Lazy(a) < 3), a < 3)
+    assert np.array_equal(np.asarray((Lazy(a) < 3) ^ (Lazy(b) < 3)), (a < 3) ^ (b < 3))
+
+
+def test_Mask_fuse() -> None:
+    counter = Counter()
+    mask = (Lazy(a) == Range(None, 4)) & (Lazy(a) == counter)
+
+    assert (
+        list(mask.evaluate(chunksize=4).flat)
+        == [True, False, True, False] + [False] * 8
+    )
+    assert counter.sizes == [4]
+
+    combined = (Lazy(a) == 1) & (Lazy(b) == 2) & (Lazy(c) == "a")
+    assert combined.op == "and"
+    assert len(combined.args) == 3
+
+
+@mark.parametrize("comparable", comparables)
+def test_Mask_comparables(comparable: Any_) -> None:
+    data = np.arange(100.0)
+    mask = (Lazy(data) == comparable) | ~(Lazy(data[::-1]) != comparable)
+    expected = (data == comparable) | (data[::-1] == comparable)
+    assert np.array_equal(mask.evaluate(chunksize=7), expected)
+
+
+def test_Mask_elementwise() -> None:
+    nonelementwise = Global()
+    mask = (Lazy(a) == nonelementwise) | (Lazy(a) == 0)
+    expected = (a > a.mean()) | (a == 0)
+
+    assert np.array_equal(mask.evaluate(chunksize=2), expected)
+    assert nonelementwise.sizes == [a.size]
+
+
+def test_Mask_error() -> None:
+    with raises(ValueError):
+        (Lazy(a) == 1).combine("and", Lazy(np.arange(3)) == 1)
+
+    with raises(ValueError):
+        (Lazy(a) == 1).evaluate(chunksize=0)
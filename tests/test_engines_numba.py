@@ -0,0 +1,90 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pytest
+from ndtools import ANY, NEVER, All, Any, Match, Not, Range, Where
+from ndtools.engines.numba import CACHESIZE, compile_kernel, evaluate
+
+numba = pytest.importorskip("numba")
+
+
+# test functions
+def test_evaluate() -> None:
+    data = np.arange(12.0).reshape(3, 4)
+    exprs = [
+        All([Range(0, 10), Not(Range(3, 4)), Range(None, 8, "(]")]),
+        Any([Range(None, 2, "()"), 5, Range(8, None, "(]")]),
+        Not(All([ANY, Range(None, None)])) | NEVER,
+        Range(2, 5, "[]") & Where(np.greater, 3),
+    ]
+
+    for expr in exprs:
+        assert (evaluate(expr, data) == (data == expr)).all()
+        assert (evaluate(expr, data, parallel=True) == (data == expr)).all()
+
+
+def test_evaluate_cache() -> None:
+    data = np.arange(10)
+    compile_kernel.cache_clear()
+    evaluate(Range(1, 2) | 5, data)
+    evaluate(Range(3, 4) | 6, data)
+    assert compile_kernel.cache_info().currsize == 1
+    assert compile_kernel.cache_info().maxsize == CACHESIZE
+
+
+def test_evaluate_Where() -> None:
+    shapes: list[Any_] = []
+
+    def greater(array: Any_, value: Any_) -> Any_:
+        shapes.append(array.shape)
+        return array > value
+
+    data = np.arange(12.0).reshape(3, 4)
+    expr = Range(2, 8) & Where(greater, 3)
+    assert (evaluate(expr, data) == (data == expr)).all()
+    assert shapes == [(3, 4), (3, 4)]
+
+
+def test_evaluate_scalars() -> None:
+    exprs = [
+        Range(None, 1.1, "[]"),
+        Range(1.1, None, "(]"),
+        Not(1.1),
+        Range(0.5, 2),
+        Range(1000, None),
+        Range(None, -1),
+    ]
+
+    for data in [
+        np.array([1.0, 1.1, 1.2], "f4"),
+        np.array([0, 1, 2], "i1"),
+        np.array([0, 1], "u1"),
+    ]:
+        for expr in exprs:
+            assert (evaluate(expr, data) == (data == expr)).all()
+
+
+def test_evaluate_overflow() -> None:
+    for dtype in ("i1", "u1", "i8", "u8"):
+        info = np.iinfo(dtype)
+        data = np.array([info.min, 0, info.max], dtype)
+        exprs = [
+            Range(info.max + 1, None),
+            Range(None, info.max + 1),
+            Range(info.min - 1, None),
+            Range(None, info.min - 1),
+            Range(info.min - 1, info.max + 1, "()"),
+            Not(info.max + 1),
+            Any([info.min - 1, 0]),
+        ]
+
+        for expr in exprs:
+            assert (evaluate(expr, data) == (data == expr)).all()
+
+
+def test_evaluate_fallback() -> None:
+    data = np.array(["a", "aa", "b"])
+    expected = np.array([True, True, False])
+    assert (evaluate(Match("a+"), data) == expected).all()
@@ -0,0 +1,75 @@
+# dependencies
+import numpy as np
+import pytest
+from ndtools import ANY, NEVER, All, Any, Match, Not, Range, Where
+from ndtools.engines.numexpr import evaluate, to_expression
+
+pytest.importorskip("numexpr")
+
+
+# test functions
+def test_evaluate() -> None:
+    data = np.arange(10.0)
+    exprs = [
+        All([Range(0, 10), Not(Range(3, 4)), Range(None, 8, "(]")]),
+        Any([Range(None, 2, "()"), 5, Range(8, None, "(]")]),
+        Not(All([ANY, Range(None, None)])) | NEVER,
+        Range(2, 5, "[]") & Where(np.greater, 3),
+    ]
+
+    for expr in exprs:
+        assert (evaluate(expr, data) == (data == expr)).all()
+
+
+def test_evaluate_scalars() -> None:
+    exprs = [
+        Range(None, 1.1, "[]"),
+        Range(1.1, None, "(]"),
+        Not(1.1),
+        Range(0.5, 2),
+        Range(1000, None),
+        Range(None, -1),
+    ]
+
+    for data in [
+        np.array([1.0, 1.1, 1.2], "f4"),
+        np.array([0, 1, 2], "i1"),
+        np.array([0, 1], "u1"),
+    ]:
+        for expr in exprs:
+            assert (evaluate(expr, data) == (data == expr)).all()
+
+
+def test_evaluate_overflow() -> None:
+    for dtype in ("i1", "u1", "i8", "u8"):
+        info = np.iinfo(dtype)
+        data = np.array([info.min, 0, info.max], dtype)
+        exprs = [
+            Range(info.max + 1, None),
+            Range(None, info.max + 1),
+            Range(info.min - 1, None),
+            Range(None, info.min - 1),
+            Range(info.min - 1, info.max + 1, "()"),
+            Not(info.max + 1),
+            Any([info.min - 1, 0]),
+        ]
+
+        for expr in exprs:
+            assert (evaluate(expr, data) == (data == expr)).all()
+
+
+def test_evaluate_fallback() -> None:
+    data = np.array(["a", "aa", "b"])
+    expected = np.array([True, True, False])
+    assert (evaluate(Match("a+"), data) == expected).all()
+
+
+def test_to_expression() -> None:
+    data = np.arange(3)
+    expression, operands = to_expression(Range(1, 2) | Not(0), data)
+    assert expression == "(((array >= v0) & (array < v1)) | (~(array == v2)))"
+    assert [operands[f"v{i}"] for i in range(3)] == [1, 2, 0]
+
+    expression, operands = to_expression(Range(1, 2) & Where(np.equal, 1), data)
+    assert expression == "(((array >= v0) & (array < v1)) & m2)"
+    assert (operands["m2"] == np.array([False, True, False])).all()
@@ -0,0 +1,148 @@
+# standard library
+from datetime import date, datetime, timedelta
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ndtools import (
+    ANY,
+    NEVER,
+    All,
+    Any,
+    Equatable,
+    Field,
+    Match,
+    Not,
+    Range,
+    RangeSet,
+    Where,
+)
+from ndtools.engines.plans import Plan, dump_value, load_value
+from numpy.char import isupper
+from pytest import mark, raises
+
+
+# test classes
+class Even(Equatable):
+    def __eq__(self, array: Any_) -> Any_:
+        return array % 2 == 0
+
+
+# test data
+values = [
+    None,
+    True,
+    1,
+    1.5,
+    float("nan"),
+    "a",
+    b"a",
+    np.float32(1.5),
+    np.datetime64("2000-01-01T00:00:00.123", "ms"),
+    np.timedelta64(3, "h"),
+    pd.Timestamp("2000-01-01", tz="UTC"),
+    pd.Timedelta("1s"),
+    datetime(2000, 1, 1, 12),
+    date(2000, 1, 1),
+    timedelta(days=1, seconds=2, microseconds=3),
+    (1, [2, "3"]),
+]
+
+
+# test functions
+@mark.parametrize("value", values)
+def test_value(value: Any_) -> None:
+    loaded = load_value(dump_value(value, False), False)
+    assert type(loaded) is type(value)
+    assert repr(loaded) == repr(value)
+
+
+def test_Plan() -> None:
+    data = np.array([0, 1, 2, 3, 4, 5])
+    expr = (
+        All([Range(1, 4), Not(2)])
+        | Any([5, NEVER])
+        | Not(Range(None, 5, "(]") & ANY)
+        | RangeSet([Range(0, 0, "[]")])
+    )
+    plan = Plan.loads(Plan.from_comparable(expr).dumps())
+
+    assert plan.comparable == expr
+    assert (plan(data) == (data == expr)).all()
+    assert plan.fingerprint == Plan.from_comparable(expr).fingerprint
+    assert plan.fingerprint != Plan.from_comparable(expr | 6).fingerprint
+
+
+def test_Plan_strings() -> None:
+    data = np.array(["A", "b", "Ab"])
+    expr = Match("A.*") & Where(isupper) | Match("B", case=False)
+    plan = Plan.loads(Plan.from_comparable(expr).dumps(), functions=[isupper])
+
+    assert plan.comparable == expr
+    assert (plan(data) == (data == expr)).all()
+
+
+def test_Plan_functions() -> None:
+    data = Plan.from_comparable(Where(isupper)).dumps()
+
+    with raises(ValueError):
+        Plan.loads(data)
+
+    with raises(ValueError):
+        Plan.loads(data.replace(b":isupper", b":islower"), functions=[isupper])
+
+    assert Plan.loads(
+        data, functions=[f"{isupper.__module__}:{isupper.__name__}"]
+    ).comparable == Where(isupper)
+    assert Plan.loads(data, allow_pickle=True).comparable == Where(isupper)
+
+
+def test_Plan_dtypes() -> None:
+    data = np.array(["2000-01-01", "2000-01-02", "NaT"], "M8[D]")
+    expr = Range("2000-01-01T12", None)
+    plan = Plan.loads(Plan.from_comparable(expr, dtypes=["M8[D]"]).dumps())
+
+    assert plan.tree["normalized"] == {"<M8[D]": [10958, None, "[]"]}
+    assert (plan(data) == [False, True, False]).all()
+
+
+@mark.parametrize("bounds", ["[]", "[)", "(]", "()"])
+def test_Plan_bytes(bounds: Any_) -> None:
+    data = np.array([b"a", b"b", b"c"], "S1")
+    expr = Range("a", "c", bounds)
+    plan = Plan.from_comparable(expr, dtypes=["S1"])
+
+    assert (plan(data) == (data == Range(b"a", b"c", bounds))).all()
+    assert (Plan.loads(plan.dumps())(data) == plan(data)).all()
+
+
+def test_Plan_pickle() -> None:
+    data = np.arange(4)
+    expr = Range(0, 3) & Even()
+
+    with raises(TypeError):
+        Plan.from_comparable(expr)
+
+    with raises(ValueError):
+        Plan.loads(Plan.from_comparable(expr, allow_pickle=True).dumps())
+
+    plan = Plan.loads(
+        Plan.from_comparable(expr, allow_pickle=True).dumps(),
+        allow_pickle=True,
+    )
+    assert (plan(data) == [True, False, True, False]).all()
+
+
+def test_Plan_fields() -> None:
+    data = {"a": np.arange(3), "b": np.array(["x", "y", "z"])}
+    expr = Field("a", Range(1, 3)) & Field("b", Not("y"))
+    plan = Plan.loads(Plan.from_comparable(expr).dumps())
+
+    assert plan.comparable == expr
+    assert (plan(data) == [False, False, True]).all()
+
+
+def test_Plan_version() -> None:
+    with raises(ValueError):
+        Plan.loads(b'{"tree":{"type":"ANY"},"version":0}')
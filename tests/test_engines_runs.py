@@ -0,0 +1,90 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, Any, Not, Range, Where
+from ndtools.engines.runs import Runs, runs
+from pytest import mark, raises
+
+
+# helper functions
+def is_even(array: Any_) -> Any_:
+    return array % 2 == 0
+
+
+# test data
+arrays = [
+    np.arange(100.0),
+    np.repeat(np.arange(10), 10),
+    np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3] * 10),
+    np.where(np.arange(100) % 7 == 0, np.nan, np.arange(100.0)),
+    np.arange("2000-01-01", "2000-04-10", dtype="M8[D]"),
+]
+comparables = [
+    ANY,
+    NEVER,
+    5,
+    Range(3, 6),
+    Range(3, 6, "(]"),
+    Range(None, 6, "[]"),
+    Range(6, None, "()"),
+    Not(Range(3, 6)),
+    Range(2, 80) & Not(Range(10, 20)) & Not(5),
+    Range(None, 2) | Range(50, 60) | 95,
+    Any([1, 3, 5]),
+    Where(is_even),
+]
+
+
+# test functions
+@mark.parametrize("array", arrays[:4])
+@mark.parametrize("comparable", comparables)
+def test_runs(array: Any_, comparable: Any_) -> None:
+    expected = array == comparable
+    assert (np.asarray(runs(comparable, array)) == expected).all()
+    assert (np.asarray(runs(comparable, array, sorted=False)) == expected).all()
+    assert runs(comparable, array).count() == expected.sum()
+    assert np.array_equal(
+        runs(comparable, array).select(array), array[expected], equal_nan=True
+    )
+
+
+def test_runs_datetime() -> None:
+    array = arrays[4]
+    expr = Range("2000-01-10", "2000-02-01") & Not(
+        Range("2000-01-15", "2000-01-20", "[]")
+    )
+    result = runs(expr, array)
+
+    assert result.slices() == [slice(9, 14), slice(20, 31)]
+    assert (np.asarray(result) == (array == expr)).all()
+
+
+def test_Runs() -> None:
+    left = Runs.from_mask(np.array([0, 1, 1, 0, 1, 1, 1, 0], bool))
+    right = Runs.from_mask(np.array([1, 1, 0, 0, 0, 1, 0, 1], bool))
+
+    assert left.slices() == [slice(1, 3), slice(4, 7)]
+    assert (~left).slices() == [slice(0, 1), slice(3, 4), slice(7, 8)]
+    assert (left & right).slices() == [slice(1, 2), slice(5, 6)]
+    assert (left | right).slices() == [slice(0, 3), slice(4, 8)]
+    assert left == Runs([1, 4], [3, 7], 8)
+    assert Runs([], [], 8).slices() == []
+    assert (~Runs([], [], 8)).slices() == [slice(0, 8)]
+
+
+def test_Runs_merge() -> None:
+    result = Runs([4, 0, 2, 6], [6, 3, 3, 6], 8)
+    assert result.slices() == [slice(0, 3), slice(4, 6)]
+    assert (np.asarray(result) == [1, 1, 1, 0, 1, 1, 0, 0]).all()
+    assert (~result).slices() == [slice(3, 4), slice(6, 8)]
+
+    with raises(ValueError):
+        Runs([0, 1], [2], 8)
+
+    with raises(ValueError):
+        Runs([-1], [2], 8)
+
+    with raises(ValueError):
+        Runs([0], [9], 8)
@@ -0,0 +1,96 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ndtools import ANY, NEVER, All, Any, Equatable, Field, Match, Not, Range, Where
+from ndtools.engines.selection import select
+from pytest import importorskip, mark, raises
+
+
+# test classes
+class Global(Equatable):
+    __elementwise__ = False
+
+    def __eq__(self, array: Any_) -> Any_:
+        return array > array.mean()
+
+
+# helper functions
+def is_multiple_of_three(array: Any_) -> Any_:
+    return array % 3 == 0
+
+
+# test data
+comparables = [
+    ANY,
+    NEVER,
+    5,
+    Range(3, 60),
+    Not(Range(3, 60)),
+    All([Range(3, 60), Not(10), Where(is_multiple_of_three)]),
+    Any([Range(None, 3), 50, Range(90, None)]),
+    Global(),
+]
+
+
+# test functions
+@mark.parametrize("comparable", comparables)
+def test_select(comparable: Any_) -> None:
+    data = np.arange(100.0).reshape(10, 10)
+    expected = data[data == comparable]
+
+    for chunksize in (1, 7, 1000):
+        assert (select(comparable, data, chunksize=chunksize) == expected).all()
+
+    if not isinstance(comparable, (int, Global)):
+        assert (comparable.select(data, chunksize=7) == expected).all()
+
+
+def test_select_axis() -> None:
+    data = np.arange(10).reshape(2, 5)
+    assert (Range(1, 3).select(data, axis=1) == data[:, 1:3]).all()
+    assert (Not(0).select(data, axis=0) == data[1:]).all()
+
+
+def test_select_pandas() -> None:
+    series = pd.Series(["a", "bb", None, "ab"], index=list("wxyz"), dtype="string")
+    result = Match("a.*").select(series, chunksize=3)
+    assert result.to_dict() == {"w": "a", "z": "ab"}
+    assert list(Range("x", "y", "[]").select(series, axis=0).index) == ["x", "y"]
+
+    df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10) % 2})
+    expr = (Field("a") == Range(2, 8)) & (Field("b") == 1)
+    assert list(expr.select(df, chunksize=3).index) == [3, 5, 7]
+    assert list(Match("b").select(df, axis=1).columns) == ["b"]
+
+
+def test_select_tables() -> None:
+    table = np.array([(1, 0.5), (2, 1.5), (3, 2.5)], [("a", "i8"), ("b", "f8")])
+    expr = Field("b", Range(1, 3))
+    assert (select(expr, table, chunksize=2) == table[1:]).all()
+
+    result = select(expr, {"a": table["a"], "b": table["b"]})
+    assert list(result["a"]) == [2, 3]
+
+
+def test_select_xarray() -> None:
+    xr = importorskip("xarray")
+    data = xr.DataArray(np.arange(10), dims="t", coords={"t": np.arange(10) * 10})
+
+    assert list(Range(20, 50).select(data, axis="t").t) == [20, 30, 40]
+    assert list(Range(2, 5).select(data).t) == [20, 30, 40]
+
+    data = xr.DataArray(np.arange(6).reshape(2, 3), dims=("x", "y"))
+    data = data.assign_coords(x=[10, 20])
+    result = Range(2, 5).select(data)
+    assert result.dims == ("x_y",)
+    assert list(result.values) == [2, 3, 4]
+    assert list(result.x.values) == [10, 20, 20]
+    assert list(result.y.values) == [2, 0, 1]
+
+
+def test_select_chunksize() -> None:
+    with raises(ValueError):
+        select(1, np.arange(3), chunksize=0)
@@ -0,0 +1,70 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, All, Equatable, Not, Range, Where
+from ndtools.engines.sparse import indices, mask
+from pytest import mark
+
+
+# test classes
+class Counter(Equatable):
+    def __init__(self) -> None:
+        self.size = 0
+
+    def __eq__(self, array: Any_) -> Any_:
+        self.size += array.size
+        return array % 2 == 0
+
+
+class Global(Equatable):
+    __elementwise__ = False
+
+    def __eq__(self, array: Any_) -> Any_:
+        return array > array.mean()
+
+
+# helper functions
+def is_even(array: Any_) -> Any_:
+    return array % 2 == 0
+
+
+# test data
+data = np.arange(10000).reshape(100, 100)
+comparables = [
+    ANY,
+    NEVER,
+    Range(10, 13),
+    Range(10, 9000),
+    Not(Range(10, 13)),
+    Not(Range(10, 9000)),
+    Range(10, 13) & Where(is_even),
+    Range(10, 9000) & Range(8990, None) & Not(8995),
+    All([Range(10, 9000), 50, Range(40, 60)]),
+    Range(10, 13) | Range(9990, None) | 5000,
+    Range(10, 13) | Range(100, 9000),
+    Not(Range(10, 13) | 5000) & Range(None, 20),
+    Range(10, 5000) & Global(),
+    Range(1, 0) & Range(10, 20),
+]
+
+
+# test functions
+@mark.parametrize("comparable", comparables)
+def test_indices(comparable: Any_) -> None:
+    expected = np.flatnonzero(data == comparable)
+    assert (indices(comparable, data) == expected).all()
+    assert (indices(comparable, data, density=0.0) == expected).all()
+    assert (indices(comparable, data, density=1.1) == expected).all()
+
+
+@mark.parametrize("comparable", comparables)
+def test_mask(comparable: Any_) -> None:
+    assert (mask(comparable, data) == (data == comparable)).all()
+
+
+def test_indices_candidates() -> None:
+    counter = Counter()
+    assert list(indices(Range(10, 13) & counter, data)) == [10, 12]
+    assert counter.size == 3
@@ -0,0 +1,110 @@
+# standard library
+import sqlite3
+from re import IGNORECASE
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+import pandas as pd
+from ndtools import ANY, NEVER, All, Any, Field, Match, Not, Range, Where
+from ndtools.comparison.fields import evaluate
+from ndtools.engines.sql import create_regexp, split, to_sql
+from pytest import fixture, importorskip, mark, raises
+
+
+# helper functions
+def is_large(array: Any_) -> Any_:
+    return array > 2
+
+
+# test data
+exprs = [
+    Field("energy", Range(1, 5)),
+    Field("energy", Range(1, 5, "[]")),
+    Field("energy", Range(1, 5, "(]")),
+    Field("energy", Range(1, 5, "()")),
+    Field("energy", Range(None, 2) | Range(8, None, "()")),
+    Field("energy", Range(None, None)),
+    Field("energy", Not(Range(1, 5))),
+    Field("energy", ANY),
+    Field("energy", NEVER),
+    Field("flag", 1) | Field("flag", 3),
+    Field("flag", Any([1, 2])),
+    Field("flag", Not(Any([1, 2]))),
+    Field("flag", Not(1) & Not(2)),
+    Field("name", Match("ap.*")),
+    Field("name", Match("AP.*", case=False)),
+    Field("name", Match("AP.*", flags=IGNORECASE)),
+    Field("name", Not(Match("ap.*"))),
+    All([Field("energy", Range(1, 5)), Not(Field("flag", 0))]),
+]
+
+
+# test fixtures
+@fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "energy": rng.uniform(0, 10, 100),
+            "flag": rng.integers(0, 4, 100),
+            "name": rng.choice(["apple", "banana", "apricot"], 100),
+        }
+    )
+    df.loc[::7, "energy"] = np.nan
+    return df
+
+
+# test functions
+@mark.parametrize("expr", exprs)
+def test_to_sql_sqlite(df: pd.DataFrame, expr: Any_) -> None:
+    connection = sqlite3.connect(":memory:")
+    create_regexp(connection)
+    df.reset_index().to_sql("data", connection)  # type: ignore
+
+    where, params = to_sql(expr)
+    query = f'SELECT "index" FROM data WHERE {where} ORDER BY "index"'
+    result = [row[0] for row in connection.execute(query, params)]
+    assert result == list(df.index[evaluate(expr, df)])
+
+
+@mark.parametrize("expr", exprs)
+def test_to_sql_duckdb(df: pd.DataFrame, expr: Any_) -> None:
+    duckdb = importorskip("duckdb")
+    connection = duckdb.connect()
+    connection.register("data", df.reset_index())
+
+    where, params = to_sql(expr, dialect="duckdb")
+    query = f'SELECT "index" FROM data WHERE {where} ORDER BY "index"'
+    result = [row[0] for row in connection.execute(query, params).fetchall()]
+    assert result == list(df.index[evaluate(expr, df)])
+
+
+def test_to_sql() -> None:
+    assert to_sql(Range(1, 5), column="x") == ('("x" >= ? AND "x" < ?)', [1, 5])
+    assert to_sql(np.int64(1), column='a"b') == ('("a""b" = ?)', [1])
+    assert to_sql(Field("x", Any([1, 2]))) == ('("x" IN (?, ?))', [1, 2])
+
+    with raises(TypeError):
+        to_sql(Range(1, 5))
+
+    with raises(TypeError):
+        to_sql(Field("x", Where(np.isnan)))
+
+    with raises(ValueError):
+        to_sql(Field("x", 1), dialect="mysql")  # type: ignore
+
+
+def test_split() -> None:
+    where = Where(is_large)
+    assert split(Field("x", Range(1, 5) & where)) == (
+        '(("x" >= ? AND "x" < ?))',
+        [1, 5],
+        Field("x", where),
+    )
+    assert split(Field("x", Range(1, 5) | where)) == (
+        None,
+        [],
+        Field("x", Range(1, 5) | where),
+    )
+    assert split(Field("x", 1)) == ('(("x" = ?))', [1], ANY)
@@ -0,0 +1,50 @@
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, All, Any, BitmapIndex, Not, Range, Where
+from ndtools.indexes.bitmap import Bitmap
+
+
+# test functions
+def test_Bitmap() -> None:
+    left = Bitmap.from_mask([True, False, True, False, True])
+    right = Bitmap.from_mask([True, True, False, False, False])
+    assert ((left & right).mask() == [True, False, False, False, False]).all()
+    assert ((left | right).mask() == [True, True, True, False, True]).all()
+    assert ((~left).mask() == [False, True, False, True, False]).all()
+    assert (~left).count() == 2
+    assert ((~left).indices() == [1, 3]).all()
+
+
+def test_BitmapIndex() -> None:
+    exprs = [
+        Range(2, 5),
+        Range(2.5, 5.5, "(]"),
+        Range(None, 3, "[]"),
+        Range(7, None, "()"),
+        Range(None, None),
+        Not(Range(3, 4)),
+        Range(0, 8) & Not(Range(3, 4)) & Range(None, 6, "(]"),
+        Any([Range(None, 2, "()"), 5, Range(8, None, "(]")]),
+        Not(All([ANY, 3])) | NEVER,
+        Range(2, 8) & Where(np.greater, 4),
+        Any([1, 3, 5]),
+    ]
+
+    for high in (10, 1000):
+        data = np.random.default_rng(0).integers(0, high, (20, 5)).astype(float)
+        data[0, 0] = data[5, 3] = np.nan
+        index = BitmapIndex(data, bins=16)
+        assert index.is_binned == (high > 16)
+
+        for expr in exprs:
+            expected = data == expr
+            assert (index.mask(expr) == expected).all()
+            assert (index.indices(expr) == np.flatnonzero(expected)).all()
+            assert index.count(expr) == expected.sum()
+
+
+def test_BitmapIndex_strings() -> None:
+    data = np.array(["b", "a", "c", "a"])
+    index = BitmapIndex(data)
+    assert (index.mask(Any(["a", "c"])) == [False, True, True, True]).all()
+    assert (index.mask(Range("a", "b", "(]")) == [True, False, False, False]).all()
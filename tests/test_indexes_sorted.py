@@ -0,0 +1,52 @@
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, All, Any, Not, Range, SortedIndex, Where
+
+
+# test functions
+def test_SortedIndex() -> None:
+    data = np.random.default_rng(0).integers(0, 10, (20, 5)).astype(float)
+    data[0, 0] = data[5, 3] = np.nan
+    index = SortedIndex(data)
+    exprs = [
+        Range(2, 5),
+        Range(2, 5, "(]"),
+        Range(None, 3, "[]"),
+        Range(7, None, "()"),
+        Range(None, None),
+        Not(Range(3, 4)),
+        Range(0, 8) & Not(Range(3, 4)) & Range(None, 6, "(]"),
+        Any([Range(None, 2, "()"), 5, Range(8, None, "(]")]),
+        Not(All([ANY, 3])) | NEVER,
+        Range(2, 8) & Where(np.greater, 4),
+        Where(np.less, 3),
+    ]
+
+    for expr in exprs:
+        expected = data == expr
+        assert (index.mask(expr) == expected).all()
+        assert (index.indices(expr) == np.flatnonzero(expected)).all()
+        assert index.count(expr) == expected.sum()
+
+
+def test_SortedIndex_search() -> None:
+    index = SortedIndex(np.array([3, 1, 4, 1, 5]))
+    assert index.search(Range(1, 4)) == [(0, 3)]
+    assert index.search(Not(1)) == [(2, 5)]
+    assert index.search(Where(np.greater, 1)) is None
+
+
+def test_SortedIndex_datetime() -> None:
+    data = np.array(["2000-01-03", "NaT", "2000-01-01", "2000-01-02"], "M8[D]")
+    index = SortedIndex(data)
+    expr = Range("2000-01-01T12", None)
+    assert (index.mask(expr) == (data == expr)).all()
+    assert (index.mask(Not(expr)) == (data == Not(expr))).all()
+
+
+def test_SortedIndex_datetime_fallback() -> None:
+    data = np.arange("1970-01-01", "1970-01-20", dtype="M8[D]")
+    index = SortedIndex(data)
+    expr = Range(5, 10)
+    assert index.search(expr) is None
+    assert (index.mask(expr) == (data == expr)).all()
@@ -0,0 +1,46 @@
+# standard library
+from re import IGNORECASE
+
+# dependencies
+import numpy as np
+from ndtools import Match, Range, StringIndex
+from ndtools.indexes.strings import literals
+
+
+# test functions
+def test_literals() -> None:
+    assert literals("abc") == ("abc", ["abc"])
+    assert literals("ab(cd)e[fg]+hij.*") == ("abcde", ["abcde", "hij"])
+    assert literals("^ab.c") == ("ab", ["ab", "c"])
+    assert literals(".*abc|def") == ("", [])
+    assert literals("(?i:ab)cd") == ("", ["cd"])
+
+
+def test_StringIndex() -> None:
+    data = np.array(["apple", "banana", "apricot", "grape", "apple", "pineapple"])
+    index = StringIndex(data)
+    matches = [
+        Match("ap.*"),
+        Match(".*apple"),
+        Match("a(pp|pr).*"),
+        Match(".*an.*na"),
+        Match("gr[a-z]pe"),
+        Match("xyz"),
+        Match("APPLE", case=False),
+        Match("(?i)APPLE"),
+        Match("apple", flags=IGNORECASE),
+    ]
+
+    for match in matches:
+        assert (index.mask(match) == (data == match)).all()
+
+    assert list(index.candidates(Match("ap.*"))) == [0, 1]
+    assert list(index.candidates(Match(".*pple"))) == [0, 4]
+    assert (index.mask(Range("b", "h")) == (data == Range("b", "h"))).all()
+
+
+def test_StringIndex_missing() -> None:
+    data = np.array(["apple", None, "apricot"], object)
+    index = StringIndex(data)
+    assert not index.is_indexed
+    assert (index.mask(Match("ap.*", na=False)) == [True, False, True]).all()
@@ -0,0 +1,100 @@
+# standard library
+from typing import Any as Any_
+
+# dependencies
+import numpy as np
+from ndtools import ANY, NEVER, Any, Not, Range, Where, ZoneMap
+from pytest import mark
+
+
+# helper functions
+def is_even(array: Any_) -> Any_:
+    return array % 2 == 0
+
+
+# test data
+comparables = [
+    ANY,
+    NEVER,
+    5,
+    Range(3, 60),
+    Range(3, 6, "(]"),
+    Range(None, 6, "[]"),
+    Range(6, None, "()"),
+    Not(Range(3, 60)),
+    Range(2, 80) & Not(Range(10, 20)) & Not(5),
+    Any([Range(None, 3), 50, Range(90, None)]),
+    Any([1, 3, 5]),
+    Where(is_even) & Range(10, 90),
+]
+
+
+# test functions
+def test_ZoneMap() -> None:
+    data = np.arange(1000)
+    zonemap = ZoneMap(data, blocksize=100)
+    window = Range(150, 420)
+
+    assert zonemap.nblocks == 10
+    assert list(zonemap.decide(window)) == [0, -1, 1, 1, -1, 0, 0, 0, 0, 0]
+    assert list(zonemap.decide(Not(window))) == [1, -1, 0, 0, -1, 1, 1, 1, 1, 1]
+    assert (
+        list(zonemap.decide(window & Range(300, None))) == [0] * 3 + [1, -1] + [0] * 5
+    )
+    assert list(zonemap.decide(window | 999)) == [0, -1, 1, 1, -1, 0, 0, 0, 0, -1]
+    assert (zonemap.decide(ANY) == 1).all()
+    assert (zonemap.decide(NEVER) == 0).all()
+    assert zonemap.count(window) == 270
+
+
+def test_ZoneMap_results() -> None:
+    rng = np.random.default_rng(0)
+    data = np.sort(rng.integers(0, 100, 1000)).astype(float)
+    data[rng.integers(0, 1000, 20)] = np.nan
+    data[500:600] = rng.permutation(data[500:600])
+    zonemap = ZoneMap(data.reshape(10, 100), blocksize=64)
+    comparables = [
+        Range(10, 50),
+        Range(10, 50, "(]"),
+        Range(None, 30),
+        Range(70, None),
+        Not(Range(10, 50)),
+        Range(10, 50) & Not(20),
+        Range(None, 5) | Range(95, None) | 50,
+        42,
+        Where(is_even) & Range(0, 10),
+    ]
+
+    for comparable in comparables:
+        expected = data.reshape(10, 100) == comparable
+        assert (zonemap.mask(comparable) == expected).all()
+
+
+@mark.parametrize("comparable", comparables)
+def test_ZoneMap_comparables(comparable: Any_) -> None:
+    data = np.arange(100.0)
+    zonemap = ZoneMap(data, blocksize=16)
+    assert (zonemap.mask(comparable) == (data == comparable)).all()
+
+
+def test_ZoneMap_datetime() -> None:
+    data = np.arange("2000-01-01", "2000-03-01", dtype="datetime64[D]")
+    data[3] = np.datetime64("NaT")
+    zonemap = ZoneMap(data, blocksize=7)
+    window = Range("2000-01-10", "2000-02-01")
+
+    assert (zonemap.mask(window) == (data == window)).all()
+    assert (zonemap.decide(window) != -1).sum() > 6
+
+
+def test_ZoneMap_membership() -> None:
+    data = np.tile(np.array(["a", "b", "c", "d"]), 50)
+    data[100:] = np.sort(data[100:])
+    zonemap = ZoneMap(data, blocksize=25, distinct=4)
+    member = Any(["a", "b"])
+
+    assert list(zonemap.decide("c")) == [-1] * 4 + [0] * 2 + [1, 0]
+    assert list(zonemap.decide(member)) == [-1] * 4 + [1] * 2 + [0] * 2
+    assert list(zonemap.decide(Not(member))) == [-1] * 4 + [0] * 2 + [1] * 2
+    assert (zonemap.mask(member) == (data == member)).all()
+    assert (zonemap.mask(Range("b", "d")) == (data == Range("b", "d"))).all()